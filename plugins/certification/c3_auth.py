@@ -1,8 +1,8 @@
-import requests
+from http_sessions import get_session
 
 
 def get_access_token(base_url: str, client_id: str, client_secret: str) -> str:
-    response = requests.post(
+    response = get_session(base_url).post(
         f"{base_url}/oauth2/token/",
         auth=(client_id, client_secret),
         data={"grant_type": "client_credentials", "scope": "read write"},
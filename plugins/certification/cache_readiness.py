@@ -0,0 +1,63 @@
+"""
+Readiness states of the PR and Jira caches
+
+Caches are loaded by background jobs after the plugin activates, so commands
+check readiness and answer with a notice instead of blocking on a load.
+"""
+
+from typing import Dict, List
+
+# No data yet: the initial load has not completed
+CACHE_WARMING = "warming"
+# No data yet: the initial load failed, and so has every attempt since
+CACHE_FAILED = "failed"
+# Serving a snapshot saved before the last restart while the initial load runs
+CACHE_RESTORED = "restored"
+# Refreshed at least once since the plugin activated
+CACHE_READY = "ready"
+
+
+def format_warming_up_notice(cache_names: List[str], partial: bool = False) -> str:
+    """
+    Format the notice shown while caches are still loading.
+
+    Args:
+        cache_names: Human readable names of the caches that are still warming up
+        partial: True if the notice is prepended to results that leave out
+            the data of those caches
+
+    Returns:
+        Notice message
+    """
+    names = " and ".join(cache_names)
+    if partial:
+        return (
+            f"⏳ **Partial results:** {names} are still loading after a restart "
+            "and are not included below."
+        )
+    return f"⏳ {names} are still loading after a restart. Please try again in a minute."
+
+
+def format_load_failed_notice(errors: Dict[str, str], partial: bool = False) -> str:
+    """
+    Format the notice shown while caches could not be loaded.
+
+    Args:
+        errors: Error of the last load attempt by human readable cache name
+        partial: True if the notice is prepended to results that leave out
+            the data of those caches
+
+    Returns:
+        Notice message
+    """
+    names = " and ".join(errors)
+    details = "; ".join(f"{name}: {error}" for name, error in errors.items())
+    if partial:
+        return (
+            f"⚠️ **Partial results:** {names} could not be loaded ({details}) "
+            "and are not included below."
+        )
+    return (
+        f"⚠️ {names} could not be loaded ({details}). Loading is retried in the "
+        "background; please contact the bot admins if this persists."
+    )
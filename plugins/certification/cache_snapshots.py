@@ -0,0 +1,65 @@
+"""
+Versioned cache snapshots kept in the plugin's persistent storage
+
+Errbot stores plugin data in a shelf under BOT_DATA_DIR, so snapshots saved
+here survive restarts and let the bot answer from slightly stale data while
+the first refresh after startup runs.
+"""
+
+import logging
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _snapshot_key(name: str) -> str:
+    return f"snapshot:{name}"
+
+
+def save_snapshot(storage: MutableMapping, name: str, version: int, data: Any) -> None:
+    """
+    Save a snapshot of cache data.
+
+    Args:
+        storage: Plugin storage (or any mapping) to write to
+        name: Name of the cache
+        version: Format version of `data`; snapshots of another version are
+            ignored when loading
+        data: Picklable cache contents
+    """
+    storage[_snapshot_key(name)] = {
+        "version": version,
+        "saved_at": datetime.now(),
+        "data": data,
+    }
+
+
+def load_snapshot(
+    storage: MutableMapping, name: str, version: int
+) -> Optional[Tuple[datetime, Any]]:
+    """
+    Load a snapshot saved by save_snapshot.
+
+    Returns:
+        Tuple of (time the snapshot was saved, data), or None if there is no
+        snapshot of the expected version
+    """
+    try:
+        snapshot = storage.get(_snapshot_key(name))
+    except Exception as e:
+        logger.warning(f"Could not read {name} snapshot: {e}")
+        return None
+
+    if not snapshot:
+        return None
+
+    if snapshot.get("version") != version:
+        logger.info(
+            f"Ignoring {name} snapshot with version {snapshot.get('version')}, "
+            f"expected {version}"
+        )
+        return None
+
+    return snapshot["saved_at"], snapshot["data"]
@@ -1,11 +1,12 @@
 # ruff: noqa: I001, E402
 
 import os
+import threading
 from datetime import datetime
 import logging
 
 from dotenv import load_dotenv
-from errbot import BotPlugin, botcmd
+from errbot import BotPlugin, botcmd, webhook
 from config import DIGEST_SEND_TIME
 
 from c3.client import AuthenticatedClient as C3Client
@@ -24,12 +25,32 @@ from ldap import (
     get_mattermost_handle_from_github_username,
 )
 from github import get_github_username_from_email
-from pr_cache import PullRequestCache
+from pr_cache_utils import CredentialPool, github_credentials_from_env, github_rate_limit
+from github_webhook import handle_github_webhook
+from pr_cache import SNAPSHOT_VERSION as PR_SNAPSHOT_VERSION, PullRequestCache
+from cache_snapshots import load_snapshot, save_snapshot
+from cache_readiness import (
+    CACHE_FAILED,
+    CACHE_WARMING,
+    format_load_failed_notice,
+    format_warming_up_notice,
+)
+from http_sessions import close_sessions
+from user_handle_cache import (
+    USER_CACHE_SNAPSHOT_VERSION,
+    export_user_cache,
+    restore_user_cache,
+)
 from jira_integration import (
+    JIRA_SNAPSHOT_VERSION,
+    export_jira_snapshot,
+    get_jira_cache_error,
+    get_jira_cache_readiness,
     get_jira_issues_for_mattermost_handle,
     get_jira_issues_for_github_team_members,
+    get_jira_snapshot,
     refresh_jira_issues_cache,
-    jira_issues_cache,
+    restore_jira_snapshot,
 )
 from formatting import (
     format_pr_summary,
@@ -56,6 +77,7 @@ except ImportError as e:
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 import ssl_fix  # noqa: F401
 
@@ -70,6 +92,7 @@ mattermost_base_url = f"https://{os.environ.get('ERRBOT_SERVER')}/api/v4"
 github_token = os.environ.get("GITHUB_TOKEN")
 github_org = os.environ.get("GITHUB_ORG")
 github_team = os.environ.get("GITHUB_TEAM")
+github_webhook_secret = os.environ.get("GITHUB_WEBHOOK_SECRET")
 
 llm_api_server = os.environ.get("LLM_API_SERVER", "http://localhost:11434")
 llm_api_token = os.environ.get("LLM_API_TOKEN")
@@ -84,6 +107,12 @@ if not github_token:
 if not github_org:
     raise Exception("GITHUB_ORG must be set")
 
+# GITHUB_TOKEN plus any additional tokens and GitHub App installation, shared
+# by the PR cache and user lookups
+github_credentials = CredentialPool(
+    github_credentials_from_env(github_token), github_rate_limit
+)
+
 C3_BASE_URL = "https://certification.canonical.com"
 
 # Lazy loading of c3_access_token - will be initialized when first needed
@@ -145,11 +174,17 @@ class CertificationPlugin(BotPlugin):
 
     def __init__(self, bot, name):
         super().__init__(bot, name)
-        self.pr_cache = PullRequestCache(repo_filter=GITHUB_REPOS)
+        self.pr_cache = PullRequestCache(
+            repo_filter=GITHUB_REPOS, credentials=github_credentials
+        )
+        # Serializes writes to the plugin storage from scheduler threads
+        self._snapshot_lock = threading.Lock()
 
     def activate(self):
         super().activate()
 
+        self._restore_cache_snapshots()
+
         scheduler = BackgroundScheduler()
 
         # Parse the digest send time from config
@@ -167,16 +202,95 @@ class CertificationPlugin(BotPlugin):
         scheduler.add_job(self.polled_digest_sending, digest_trigger)
         self.log.info(f"Scheduled daily digest for {hour:02d}:{minute:02d} UTC")
 
-        pr_cache_trigger = CronTrigger(minute="*/5", timezone="UTC")
-        scheduler.add_job(self.refresh_pr_cache, pr_cache_trigger)
+        # The PR refresh interval adapts to the GitHub rate limit budget, see
+        # _reschedule_pr_cache_refresh
+        self._pr_refresh_seconds = round(self.pr_cache.next_refresh_interval())
+        self._pr_refresh_job = scheduler.add_job(
+            self.refresh_pr_cache, IntervalTrigger(seconds=self._pr_refresh_seconds)
+        )
+
+        # Repositories that failed to fetch are retried between refreshes
+        scheduler.add_job(
+            self.retry_failed_pr_repositories,
+            IntervalTrigger(minutes=self.pr_cache.retry_minutes),
+        )
 
         jira_cache_trigger = CronTrigger(minute="*/5", timezone="UTC")
-        scheduler.add_job(refresh_jira_issues_cache, jira_cache_trigger)
+        scheduler.add_job(self.refresh_jira_cache, jira_cache_trigger)
+
+        user_cache_trigger = CronTrigger(minute="*/30", timezone="UTC")
+        scheduler.add_job(self.save_user_cache_snapshot, user_cache_trigger)
+
+        # Initial loads run in the background right away so that activation does
+        # not block; commands check cache readiness meanwhile
+        scheduler.add_job(self.refresh_pr_cache)
+        scheduler.add_job(self.refresh_jira_cache)
 
         scheduler.start()
 
-        self.refresh_pr_cache()
-        refresh_jira_issues_cache()
+    def deactivate(self):
+        self.save_user_cache_snapshot()
+        close_sessions()
+        super().deactivate()
+
+    def _restore_cache_snapshots(self):
+        """
+        Restore the PR, Jira and user handle caches from snapshots saved before
+        the last restart.
+        """
+        pr_snapshot = load_snapshot(self, "pr_cache", PR_SNAPSHOT_VERSION)
+        if pr_snapshot:
+            saved_at, data = pr_snapshot
+            self.pr_cache.restore_snapshot(data, saved_at)
+
+        jira_snapshot = load_snapshot(self, "jira_issues", JIRA_SNAPSHOT_VERSION)
+        if jira_snapshot:
+            saved_at, data = jira_snapshot
+            restore_jira_snapshot(data)
+            self.log.info(f"Restored Jira issues snapshot from {saved_at}")
+
+        user_snapshot = load_snapshot(self, "user_handles", USER_CACHE_SNAPSHOT_VERSION)
+        if user_snapshot:
+            restore_user_cache(user_snapshot[1])
+
+    def _warming_caches(self, prs: bool = True, jira: bool = True) -> list[str]:
+        """Names of the given caches whose initial load has not completed yet"""
+        warming = []
+        if prs and self.pr_cache.readiness() == CACHE_WARMING:
+            warming.append("PRs")
+        if jira and get_jira_cache_readiness() == CACHE_WARMING:
+            warming.append("Jira issues")
+        return warming
+
+    def _failed_caches(self, prs: bool = True, jira: bool = True) -> dict[str, str]:
+        """Errors of the given caches that could not be loaded at all, by name"""
+        failed = {}
+        if prs and self.pr_cache.readiness() == CACHE_FAILED:
+            failed["PRs"] = self.pr_cache.last_refresh_error
+        if jira and get_jira_cache_readiness() == CACHE_FAILED:
+            failed["Jira issues"] = get_jira_cache_error()
+        return failed
+
+    def _unavailable_caches_notice(
+        self, prs: bool = True, jira: bool = True, partial: bool = False
+    ) -> str | None:
+        """Notice for the given caches that have no data yet, None if all have"""
+        notices = []
+        failed = self._failed_caches(prs, jira)
+        if failed:
+            notices.append(format_load_failed_notice(failed, partial))
+        warming = self._warming_caches(prs, jira)
+        if warming:
+            notices.append(format_warming_up_notice(warming, partial))
+        return "\n".join(notices) or None
+
+    def _save_cache_snapshot(self, name: str, version: int, data) -> None:
+        """Persist a cache snapshot, logging instead of failing the calling job"""
+        try:
+            with self._snapshot_lock:
+                save_snapshot(self, name, version, data)
+        except Exception as e:
+            logger.error(f"Error saving {name} snapshot: {e}")
 
     def polled_digest_sending(self):
         # Note: artefacts are now included in send_team_pr_summaries
@@ -235,7 +349,7 @@ class CertificationPlugin(BotPlugin):
                 )
                 if target_user_email:
                     github_username = get_github_username_from_email(
-                        github_token, target_user_email
+                        github_credentials, target_user_email
                     )
 
             return github_username
@@ -246,7 +360,7 @@ class CertificationPlugin(BotPlugin):
             return None
 
     def _generate_user_digest(
-        self, github_username: str, mattermost_username: str, is_digest: bool = False, use_github_for_jira: bool = False
+        self, github_username: str, mattermost_username: str, is_digest: bool = False, use_github_for_jira: bool = False, include_prs: bool = True
     ) -> str | None:
         """
         Generate a combined PR and Jira digest for a user.
@@ -257,9 +371,10 @@ class CertificationPlugin(BotPlugin):
             mattermost_username: Mattermost username (may be GitHub username as fallback)
             is_digest: True for digest format, False for command response
             use_github_for_jira: If True, lookup Jira issues via GitHub username->email instead of Mattermost handle
+            include_prs: If False, leave PRs out, e.g. while the PR cache is warming up
         """
         try:
-            pr_data = self.pr_cache.get_prs_for_user(github_username)
+            pr_data = self.pr_cache.get_prs_for_user(github_username) if include_prs else {}
             
             # Use the new generate_user_digest function from formatting module
             return generate_user_digest(
@@ -334,9 +449,68 @@ class CertificationPlugin(BotPlugin):
     def refresh_pr_cache(self):
         """Refresh the PR cache with latest data from filtered repositories"""
         try:
-            self.pr_cache.refresh_cache()
+            if self.pr_cache.refresh_cache():
+                self._save_cache_snapshot(
+                    "pr_cache", PR_SNAPSHOT_VERSION, self.pr_cache.export_snapshot()
+                )
+            # Loads the team into the cache on the first run; the PR cache
+            # refresh keeps it fresh from then on
+            if github_team:
+                self.pr_cache.get_team_members(github_team)
         except Exception as e:
             logger.error(f"Error refreshing PR cache: {e}")
+        self._reschedule_pr_cache_refresh()
+
+    def retry_failed_pr_repositories(self):
+        """Retry fetching the PRs of repositories that failed in the last refresh"""
+        try:
+            if self.pr_cache.retry_failed_repositories():
+                self._save_cache_snapshot(
+                    "pr_cache", PR_SNAPSHOT_VERSION, self.pr_cache.export_snapshot()
+                )
+        except Exception as e:
+            logger.error(f"Error retrying failed PR repositories: {e}")
+
+    @webhook("/github/webhook", methods=("POST",), raw=True)
+    def github_webhook(self, request):
+        """Apply GitHub pull_request and pull_request_review events to the PR cache"""
+        return handle_github_webhook(
+            self.pr_cache, github_webhook_secret, request.headers, request.get_data()
+        )
+
+    def _reschedule_pr_cache_refresh(self):
+        """Stretch or shrink the PR refresh interval to fit the GitHub rate limit"""
+        job = getattr(self, "_pr_refresh_job", None)
+        if job is None:
+            return
+
+        seconds = round(self.pr_cache.next_refresh_interval())
+        # Ignore small changes so the job is not rescheduled after every refresh
+        if abs(seconds - self._pr_refresh_seconds) < 60:
+            return
+
+        self.log.info(
+            f"Rescheduling PR cache refresh every {seconds}s "
+            f"(was every {self._pr_refresh_seconds}s)"
+        )
+        self._pr_refresh_seconds = seconds
+        try:
+            job.reschedule(trigger=IntervalTrigger(seconds=seconds))
+        except Exception as e:
+            logger.error(f"Error rescheduling PR cache refresh: {e}")
+
+    def refresh_jira_cache(self):
+        """Refresh the Jira issues cache and persist it"""
+        if refresh_jira_issues_cache():
+            self._save_cache_snapshot(
+                "jira_issues", JIRA_SNAPSHOT_VERSION, export_jira_snapshot()
+            )
+
+    def save_user_cache_snapshot(self):
+        """Persist the user handle lookups used for artefact reviewers"""
+        self._save_cache_snapshot(
+            "user_handles", USER_CACHE_SNAPSHOT_VERSION, export_user_cache()
+        )
 
     @botcmd(split_args_with=" ")
     def artefacts(self, msg, args):
@@ -407,6 +581,10 @@ class CertificationPlugin(BotPlugin):
         if not github_token:
             return "GitHub token not configured. Please set the GITHUB_TOKEN environment variable."
 
+        notice = self._unavailable_caches_notice(jira=False)
+        if notice:
+            return notice
+
         try:
             pr_data = self.pr_cache.get_prs_for_user(github_username)
 
@@ -456,6 +634,10 @@ class CertificationPlugin(BotPlugin):
         """
         mattermost_username = self._parse_username_arg(args, msg.frm.username)
 
+        notice = self._unavailable_caches_notice(prs=False)
+        if notice:
+            return notice
+
         try:
             issues = get_jira_issues_for_mattermost_handle(mattermost_username)
             
@@ -481,8 +663,14 @@ class CertificationPlugin(BotPlugin):
         if not github_team:
             return "No GitHub team configured. Please set the GITHUB_TEAM environment variable."
 
+        notice = self._unavailable_caches_notice(prs=False)
+        if notice:
+            return notice
+
         try:
-            team_members = self.pr_cache.get_team_members(github_team)
+            # A user is waiting, so missing members may use the interactive reserve
+            with self.pr_cache.rate_limit.interactive():
+                team_members = self.pr_cache.get_team_members(github_team)
             if not team_members:
                 return f"No members found for team {github_team}"
 
@@ -516,6 +704,10 @@ class CertificationPlugin(BotPlugin):
         Usage: !sprint_summary
         Uses the configured LLM to analyze and summarize current sprint issues
         """
+        notice = self._unavailable_caches_notice(prs=False)
+        if notice:
+            return notice
+
         try:
             if not LLM_AVAILABLE:
                 return "LLM functionality not available. Please ensure the requests library is installed and LLM configuration is set up."
@@ -528,7 +720,7 @@ class CertificationPlugin(BotPlugin):
                 return f"Could not connect to LLM API at {llm_client.server_url}. Please check the configuration and server status."
 
             all_sprint_issues = []
-            for assignee_email, issues in jira_issues_cache.items():
+            for assignee_email, issues in get_jira_snapshot().data.issues.items():
                 for issue in issues:
                     all_sprint_issues.append(
                         {
@@ -670,12 +862,20 @@ Keep the summary concise (3-4 paragraphs) and actionable for team members and st
         if not github_token:
             return "GitHub token not configured. Please set the GITHUB_TOKEN environment variable."
 
+        # While caches have no data yet, answer with the available data and say
+        # what is missing
+        unavailable = self._warming_caches() + list(self._failed_caches())
+        unavailable_notice = self._unavailable_caches_notice(partial=True)
+
         try:
             sections = []
             
             # Get PR and Jira digest
             pr_jira_msg = self._generate_user_digest(
-                github_username, mattermost_username, is_digest=False
+                github_username,
+                mattermost_username,
+                is_digest=False,
+                include_prs="PRs" not in unavailable,
             )
             if pr_jira_msg:
                 sections.append(pr_jira_msg)
@@ -686,7 +886,11 @@ Keep the summary concise (3-4 paragraphs) and actionable for team members and st
                 sections.append(artefacts_msg)
             
             if sections:
+                if unavailable_notice:
+                    sections.insert(0, unavailable_notice)
                 return "\n\n---\n\n".join(sections)
+            elif unavailable:
+                return self._unavailable_caches_notice()
             else:
                 cache_stats = self.pr_cache.get_cache_stats()
                 # Check if we have artefacts even if no PRs/Jira
@@ -1,30 +1,47 @@
 from typing import Optional
 
 import requests
+from http_sessions import get_session
+from pr_cache_utils import (
+    CredentialPool,
+    RateLimitBackoff,
+    TokenCredential,
+    github_rate_limit,
+)
 
 _github_email_cache: dict[str, Optional[str]] = {}
 
 
-def get_github_username_from_email(github_token, email):
+def get_github_username_from_email(credentials, email):
     """
     Get GitHub username from email address using GitHub API
     Results are cached to avoid duplicate requests
+
+    credentials is a CredentialPool, or a single token
     """
-    if not github_token:
+    if not credentials:
         return None
 
     if email in _github_email_cache:
         return _github_email_cache[email]
 
-    headers = {
-        "Authorization": f"token {github_token}",
-        "Accept": "application/vnd.github.v3+json",
-    }
+    if isinstance(credentials, str):
+        credentials = CredentialPool([TokenCredential(credentials)], github_rate_limit)
 
     try:
         # Search for users by email
         search_url = f"https://api.github.com/search/users?q={email}+in:email"
-        response = requests.get(search_url, headers=headers)
+        # Looked up for a user command, so it may use the interactive reserve
+        with credentials.rate_limit.interactive():
+            credential = credentials.acquire("search")
+            response = get_session(search_url).get(
+                search_url, headers=credential.headers()
+            )
+        credentials.rate_limit.update(response, credential.name)
+
+        if response.status_code in (403, 429):
+            # Rate limited; the lookup is retried next time instead of cached
+            return None
 
         if response.status_code == 200:
             data = response.json()
@@ -33,6 +50,9 @@ def get_github_username_from_email(github_token, email):
                 # Cache the result
                 _github_email_cache[email] = username
                 return username
+    except RateLimitBackoff:
+        # Do not cache a negative result just because we are rate limited
+        return None
     except requests.exceptions.RequestException:
         pass
 
@@ -0,0 +1,80 @@
+"""
+Receiver for GitHub webhook events that push PR changes into the PR cache
+
+GitHub signs every delivery with the webhook secret (X-Hub-Signature-256);
+deliveries with a missing or wrong signature are rejected before the payload
+is parsed.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+from typing import Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Events applied to the PR cache; other events are acknowledged and ignored
+PR_WEBHOOK_EVENTS = ("pull_request", "pull_request_review")
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """
+    Check the X-Hub-Signature-256 header of a webhook delivery.
+
+    Args:
+        secret: Webhook secret configured on GitHub
+        body: Raw request body
+        signature: Value of the X-Hub-Signature-256 header, "sha256=<hex digest>"
+
+    Returns:
+        True if the body was signed with the secret
+    """
+    if not secret or not signature or not signature.startswith("sha256="):
+        return False
+
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature)
+
+
+def handle_github_webhook(
+    pr_cache, secret: Optional[str], headers: Mapping[str, str], body: bytes
+) -> Tuple[str, int]:
+    """
+    Verify a webhook delivery and apply it to the PR cache.
+
+    Args:
+        pr_cache: PullRequestCache to update
+        secret: Webhook secret; webhooks are disabled when it is not set
+        headers: Request headers
+        body: Raw request body
+
+    Returns:
+        Response text and HTTP status code
+    """
+    if not secret:
+        return "GitHub webhooks are not configured", 404
+
+    if not verify_signature(secret, body, headers.get("X-Hub-Signature-256")):
+        logger.warning(
+            f"Rejected GitHub webhook delivery {headers.get('X-GitHub-Delivery')} "
+            f"with invalid signature"
+        )
+        return "Invalid signature", 401
+
+    event = headers.get("X-GitHub-Event")
+    if event == "ping":
+        return "pong", 200
+    if event not in PR_WEBHOOK_EVENTS:
+        return f"Ignored {event} event", 200
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        return "Invalid JSON payload", 400
+
+    if pr_cache.apply_webhook_event(event, payload):
+        return f"Applied {event} event", 200
+    return f"Ignored {event} event", 200
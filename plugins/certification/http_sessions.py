@@ -0,0 +1,78 @@
+"""
+Shared HTTP sessions for upstream APIs
+
+One keep-alive requests.Session is kept per upstream host so that GitHub,
+Mattermost, C3 and LLM calls reuse TCP and TLS connections instead of
+opening a new connection for every request.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open per host; grown for callers needing more, like the
+# PR cache fetch workers and their page workers
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_POOL_CONNECTIONS = 4
+
+_sessions: Dict[str, requests.Session] = {}
+# host -> connection pool size of its session
+_pool_sizes: Dict[str, int] = {}
+_sessions_lock = threading.Lock()
+
+
+def _mount_adapter(session: requests.Session, pool_maxsize: int) -> None:
+    pool_connections = int(
+        os.environ.get("HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS)
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def get_session(url: str, pool_maxsize: Optional[int] = None) -> requests.Session:
+    """
+    Get the shared session for the host of a URL.
+
+    Args:
+        url: Any URL on the upstream host
+        pool_maxsize: Connections the caller may use concurrently; the pool
+            of the host is grown to keep them open
+
+    Returns:
+        Session reusing connections to that host
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    pool_maxsize = max(
+        pool_maxsize or 0,
+        int(os.environ.get("HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE)),
+    )
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            _sessions[key] = session
+            logger.debug(f"Created HTTP session for {key}")
+        if pool_maxsize > _pool_sizes.get(key, 0):
+            # Requests in flight finish on the previous adapter
+            _mount_adapter(session, pool_maxsize)
+            _pool_sizes[key] = pool_maxsize
+        return session
+
+
+def close_sessions() -> None:
+    """Close all shared sessions and their pooled connections"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _pool_sizes.clear()
@@ -3,14 +3,24 @@ Jira integration module for certification-errbot
 """
 
 from .cache import (
+    JIRA_SNAPSHOT_VERSION,
+    export_jira_snapshot,
+    get_jira_cache_error,
+    get_jira_cache_readiness,
     get_jira_issues_for_github_team_members,
     get_jira_issues_for_mattermost_handle,
     get_jira_issues_for_user,
-    jira_account_to_email,
-    jira_issues_cache,
+    get_jira_snapshot,
     refresh_jira_issues_cache,
+    restore_jira_snapshot,
+)
+from .client import (
+    get_filter_jql,
+    get_jira_client,
+    get_story_points_field,
+    identify_story_points_field,
+    reset_jira_client,
 )
-from .client import get_jira_client, identify_story_points_field
 from .priority import get_priority_sort_key, is_review_status
 
 __all__ = [
@@ -19,11 +29,18 @@ __all__ = [
     "get_jira_issues_for_user",
     "get_jira_issues_for_mattermost_handle",
     "get_jira_issues_for_github_team_members",
-    "jira_issues_cache",
-    "jira_account_to_email",
+    "get_jira_snapshot",
+    "export_jira_snapshot",
+    "restore_jira_snapshot",
+    "JIRA_SNAPSHOT_VERSION",
+    "get_jira_cache_readiness",
+    "get_jira_cache_error",
     # Client functions
     "get_jira_client",
+    "reset_jira_client",
+    "get_filter_jql",
     "identify_story_points_field",
+    "get_story_points_field",
     # Priority functions
     "get_priority_sort_key",
     "is_review_status",
@@ -3,25 +3,206 @@ Jira issues cache management
 """
 
 import logging
+import math
 import os
+import re
 import sys
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 from jira.exceptions import JIRAError
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cache_readiness import CACHE_FAILED, CACHE_READY, CACHE_RESTORED, CACHE_WARMING
 from ldap import get_email_from_github_username, get_email_from_mattermost_handle
-
-from .client import JIRA_FILTER_ID, JIRA_SERVER, get_jira_client
+from snapshot_store import SnapshotStore, VersionedSnapshot
+
+from .client import (
+    DEFAULT_STORY_POINTS_FIELD,
+    JIRA_FILTER_ID,
+    JIRA_SERVER,
+    get_filter_jql,
+    get_jira_client,
+    get_story_points_field,
+    reset_jira_client,
+)
 from .priority import get_priority_sort_key, is_review_status
 
 logger = logging.getLogger(__name__)
 
-# Cache for Jira issues by user email
-jira_issues_cache: Dict[str, List[Dict[str, Any]]] = {}
+# Issue fields read by _extract_issue_data and _process_issue_assignee, besides
+# the story points field
+ISSUE_FIELDS = ("summary", "status", "priority", "assignee")
+
+# Minutes between full refreshes when JIRA_INCREMENTAL_REFRESH is enabled
+DEFAULT_FULL_REFRESH_MINUTES = 60
+
+# Pages of a large filter fetched concurrently once the first page is in
+DEFAULT_PAGE_WORKERS = 4
+
+# Incremental refreshes also fetch issues updated this long before the previous
+# refresh started, as JQL compares update times by the minute
+DELTA_OVERLAP_MINUTES = 2
+
+
+# Categories of the per-user views, in the order lookups return them
+JIRA_CATEGORIES = ("active", "review", "completed", "untriaged")
+
+
+def _categorize_issues(cached_issues: List[Dict[str, Any]]) -> Dict[str, List]:
+    """
+    Categorize issues by their state and priority
+
+    Args:
+        cached_issues: List of cached issue dictionaries
+
+    Returns:
+        Dictionary with categorized issues
+    """
+    categorized: Dict[str, List] = {category: [] for category in JIRA_CATEGORIES}
+
+    for issue in cached_issues:
+        if issue.get("is_completed", False):
+            categorized["completed"].append(issue)
+        elif not issue.get("priority") or issue.get("priority", "").lower() in ["none", ""]:
+            categorized["untriaged"].append(issue)
+        elif issue.get("is_in_review", False):
+            categorized["review"].append(issue)
+        else:
+            categorized["active"].append(issue)
+
+    return categorized
+
+
+def _build_user_view(
+    cached_issues: List[Dict[str, Any]],
+) -> Mapping[str, Tuple[Dict[str, Any], ...]]:
+    """
+    Categorize the issues of one assignee and sort them by priority
+
+    Returns:
+        Read-only mapping of category to issues
+    """
+    categorized = _categorize_issues(cached_issues)
+    view = {
+        category: tuple(
+            sorted(
+                categorized[category],
+                key=lambda x: get_priority_sort_key(x.get("priority", "")),
+            )
+        )
+        for category in ("active", "review", "completed")
+    }
+    # Untriaged issues don't need priority sorting (they have no priority)
+    view["untriaged"] = tuple(categorized["untriaged"])
+    return MappingProxyType(view)
+
+
+class JiraCacheContents(NamedTuple):
+    """Jira issues loaded by one refresh; published read-only"""
+
+    issues: Mapping[str, Tuple[Dict[str, Any], ...]]  # assignee email -> issues
+    account_to_email: Mapping[str, str]  # Jira account ID -> email
+    # assignee email -> category -> issues sorted by priority, built at publish
+    # time so that lookups do not categorize and sort again
+    views: Mapping[str, Mapping[str, Tuple[Dict[str, Any], ...]]]
+
+
+def _freeze_contents(
+    issues: Dict[str, List[Dict[str, Any]]], account_to_email: Dict[str, str]
+) -> JiraCacheContents:
+    return JiraCacheContents(
+        issues=MappingProxyType(
+            {email: tuple(email_issues) for email, email_issues in issues.items()}
+        ),
+        account_to_email=MappingProxyType(dict(account_to_email)),
+        views=MappingProxyType(
+            {
+                email: _build_user_view(email_issues)
+                for email, email_issues in issues.items()
+            }
+        ),
+    )
+
 
-# Mapping of Jira account IDs to emails
-jira_account_to_email: Dict[str, str] = {}
+# Refreshes build new contents and publish them at once, so readers never see
+# a cache that is being rebuilt
+_jira_store = SnapshotStore(_freeze_contents({}, {}))
+
+# Format version of snapshots produced by export_jira_snapshot
+JIRA_SNAPSHOT_VERSION = 1
+
+# Readiness state of the Jira issues cache (see cache_readiness)
+_jira_cache_readiness = CACHE_WARMING
+# Why the last refresh failed, None once a refresh succeeded
+_last_refresh_error: Optional[str] = None
+
+# Start of the last successful refresh, and of the last full one
+_last_refresh_at: Optional[datetime] = None
+_last_full_refresh_at: Optional[datetime] = None
+
+
+def get_jira_snapshot() -> VersionedSnapshot[JiraCacheContents]:
+    """
+    Get the current Jira issues cache contents
+
+    Returns:
+        Versioned snapshot that stays consistent while the cache is refreshed
+    """
+    return _jira_store.current()
+
+
+def get_jira_cache_readiness() -> str:
+    """
+    Get the readiness state of the Jira issues cache
+
+    Returns:
+        CACHE_READY when no Jira filter is configured, since there is nothing to load
+    """
+    if not JIRA_FILTER_ID:
+        return CACHE_READY
+    return _jira_cache_readiness
+
+
+def get_jira_cache_error() -> Optional[str]:
+    """
+    Get the error of the last Jira issues cache refresh
+
+    Returns:
+        Why the last refresh failed, or None if it succeeded
+    """
+    return _last_refresh_error
+
+
+def _record_refresh_error(error: str) -> None:
+    """Remember why a refresh failed, reporting it while no data was ever loaded"""
+    global _jira_cache_readiness, _last_refresh_error
+
+    _last_refresh_error = error
+    if _jira_cache_readiness == CACHE_WARMING:
+        _jira_cache_readiness = CACHE_FAILED
+
+
+def _add_jql_condition(jql: str, condition: str) -> str:
+    """
+    Restrict a JQL query by another condition
+
+    Args:
+        jql: JQL query, optionally ending with an ORDER BY clause
+        condition: JQL condition the results must also match
+
+    Returns:
+        JQL query matching both, with the original ORDER BY clause
+    """
+    # Keep ORDER BY last, and the original conditions together so that an OR
+    # in them does not bypass the added condition
+    parts = re.split(r"\s+ORDER\s+BY\s+", jql, maxsplit=1, flags=re.IGNORECASE)
+    query = f"({parts[0].strip()}) AND {condition}"
+    if len(parts) > 1:
+        query += f" ORDER BY {parts[1].strip()}"
+    return query
 
 
 def _build_jql_query(base_jql: str, sprint_filter: bool) -> str:
@@ -38,44 +219,70 @@ def _build_jql_query(base_jql: str, sprint_filter: bool) -> str:
     if not sprint_filter:
         return base_jql
 
-    # Handle ORDER BY clause properly when adding sprint filter
-    if "ORDER BY" in base_jql.upper():
-        jql_parts = base_jql.split("ORDER BY")
-        return (
-            f"{jql_parts[0].strip()} AND sprint in openSprints() "
-            f"ORDER BY {jql_parts[1].strip()}"
-        )
-    else:
-        return f"{base_jql} AND sprint in openSprints()"
+    return _add_jql_condition(base_jql, "sprint in openSprints()")
 
 
-def _fetch_all_issues(client, jql: str, max_results: int = 100):
+def _updated_since_condition(since: datetime, now: datetime) -> str:
     """
-    Fetch all issues from Jira with pagination
+    JQL condition matching issues updated since a point in time
 
-    Args:
-        client: JIRA client instance
-        jql: JQL query string
-        max_results: Page size for pagination
-
-    Returns:
-        List of all fetched issues
+    The age is relative to the Jira server clock, so neither clock skew nor
+    the timezone of the Jira user matters.
     """
-    all_issues = []
-    start_at = 0
-
-    while True:
-        issues = client.search_issues(
-            jql_str=jql,
-            startAt=start_at,
-            maxResults=max_results,
-            fields="*all",  # Fetch all fields to identify story points field
+    minutes = math.ceil((now - since).total_seconds() / 60) + DELTA_OVERLAP_MINUTES
+    return f"updated >= -{minutes}m"
+
+
+def _is_full_refresh_due(now: datetime) -> bool:
+    """Whether the next refresh must reload the whole filter"""
+    incremental = os.environ.get("JIRA_INCREMENTAL_REFRESH", "false").lower() == "true"
+    if not incremental or _last_refresh_at is None or _last_full_refresh_at is None:
+        return True
+    full_refresh_interval = timedelta(
+        minutes=int(
+            os.environ.get("JIRA_FULL_REFRESH_MINUTES", DEFAULT_FULL_REFRESH_MINUTES)
         )
+    )
+    return now - _last_full_refresh_at >= full_refresh_interval
 
+
+def _issue_fields(story_points_field: str) -> str:
+    """Comma-separated fields to fetch for every issue"""
+    return ",".join((*ISSUE_FIELDS, story_points_field))
+
+
+def _search_page(client, jql: str, fields: str, start_at: int, max_results: int):
+    return client.search_issues(
+        jql_str=jql,
+        startAt=start_at,
+        maxResults=max_results,
+        fields=fields,
+    )
+
+
+def _unique_issues(pages) -> List[Any]:
+    """Issues of consecutive pages in order, each key once"""
+    seen = set()
+    issues = []
+    for page in pages:
+        for issue in page:
+            if issue.key not in seen:
+                seen.add(issue.key)
+                issues.append(issue)
+    return issues
+
+
+def _fetch_remaining_pages_serially(client, jql: str, fields: str, max_results: int):
+    """Fetch the pages after the first one by one, until one is not full"""
+    pages = []
+    start_at = max_results
+
+    while True:
+        issues = _search_page(client, jql, fields, start_at, max_results)
         if not issues:
             break
 
-        all_issues.extend(issues)
+        pages.append(issues)
 
         # If we got fewer results than requested, we're done
         if len(issues) < max_results:
@@ -83,21 +290,83 @@ def _fetch_all_issues(client, jql: str, max_results: int = 100):
 
         start_at += max_results
 
-    return all_issues
+    return pages
 
 
-def _extract_issue_data(issue, jira_server: str) -> Dict[str, Any]:
+def _fetch_all_issues(client, jql: str, fields: str, max_results: int = 100):
+    """
+    Fetch all issues from Jira with pagination
+
+    The first page tells the total number of results; the remaining pages
+    are then fetched concurrently by up to JIRA_PAGE_WORKERS workers. If
+    results shift between pages meanwhile, so that pages disagree on the total
+    or an issue shows up twice, all pages are fetched once more.
+
+    Args:
+        client: JIRA client instance
+        jql: JQL query string
+        fields: Comma-separated issue fields to fetch
+        max_results: Page size for pagination
+
+    Returns:
+        List of all fetched issues
+    """
+    first_page = _search_page(client, jql, fields, 0, max_results)
+    total = getattr(first_page, "total", None)
+
+    if not isinstance(total, int):
+        # Without a total the number of pages is unknown
+        if not first_page or len(first_page) < max_results:
+            return list(first_page or [])
+        pages = _fetch_remaining_pages_serially(client, jql, fields, max_results)
+        return _unique_issues([first_page, *pages])
+
+    if not first_page or len(first_page) >= total:
+        return list(first_page)
+    # Servers may return smaller pages than requested
+    page_size = len(first_page)
+    workers = int(os.environ.get("JIRA_PAGE_WORKERS", DEFAULT_PAGE_WORKERS))
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="jira-pages"
+    ) as executor:
+        for attempt in range(2):
+            pages = [first_page]
+            pages += executor.map(
+                lambda start: _search_page(client, jql, fields, start, page_size),
+                range(page_size, total, page_size),
+            )
+            issues = _unique_issues(pages)
+            consistent = len(issues) == total and all(
+                getattr(page, "total", total) == total for page in pages
+            )
+            if consistent or attempt:
+                break
+            logger.warning(
+                f"Jira results shifted while paging ({len(issues)} of {total} issues), "
+                f"fetching them again"
+            )
+            first_page = _search_page(client, jql, fields, 0, page_size)
+            total = getattr(first_page, "total", total)
+
+    return issues
+
+
+def _extract_issue_data(
+    issue, jira_server: str, story_points_field: str = DEFAULT_STORY_POINTS_FIELD
+) -> Dict[str, Any]:
     """
     Extract relevant data from a Jira issue
 
     Args:
         issue: JIRA issue object
         jira_server: JIRA server URL for building links
+        story_points_field: Custom field ID holding story points
 
     Returns:
         Dictionary with extracted issue data
     """
-    story_points = getattr(issue.fields, "customfield_10024", None)
+    story_points = getattr(issue.fields, story_points_field, None)
 
     # Determine issue state based on status
     status_name = issue.fields.status.name
@@ -121,14 +390,14 @@ def _extract_issue_data(issue, jira_server: str) -> Dict[str, Any]:
     }
 
 
-def _process_issue_assignee(issue, jira_issues_cache, jira_account_to_email):
+def _process_issue_assignee(issue, issues_by_email, account_to_email):
     """
     Process assignee information from an issue and update caches
 
     Args:
         issue: JIRA issue object
-        jira_issues_cache: Cache dictionary to update
-        jira_account_to_email: Account mapping dictionary to update
+        issues_by_email: Issues dictionary being built to update
+        account_to_email: Account mapping dictionary being built to update
 
     Returns:
         Email address of assignee or None
@@ -140,108 +409,166 @@ def _process_issue_assignee(issue, jira_issues_cache, jira_account_to_email):
     email = getattr(issue.fields.assignee, "emailAddress", account_id)
 
     # Store account ID to email mapping
-    jira_account_to_email[account_id] = email
+    account_to_email[account_id] = email
 
     # Initialize cache entry if needed
-    if email not in jira_issues_cache:
-        jira_issues_cache[email] = []
+    if email not in issues_by_email:
+        issues_by_email[email] = []
 
     return email
 
 
-def refresh_jira_issues_cache():
+def _merge_changed_issues(
+    contents: JiraCacheContents, changed_issues, story_points_field: str
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+    """
+    Merge issues fetched by an incremental refresh into the cache contents
+
+    Changed issues replace their cached version by key, under their current
+    assignee, so issues assigned to someone else move over and unassigned ones
+    are dropped.
+
+    Args:
+        contents: Current cache contents
+        changed_issues: JIRA issue objects updated since the previous refresh
+        story_points_field: Custom field ID holding story points
+
+    Returns:
+        Tuple of (issues by assignee email, account ID to email mapping)
+    """
+    changed_keys = {issue.key for issue in changed_issues}
+    issues_by_email: Dict[str, List[Dict[str, Any]]] = {}
+    for email, email_issues in contents.issues.items():
+        kept = [issue for issue in email_issues if issue["key"] not in changed_keys]
+        if kept:
+            issues_by_email[email] = kept
+    account_to_email = dict(contents.account_to_email)
+
+    for issue in changed_issues:
+        email = _process_issue_assignee(issue, issues_by_email, account_to_email)
+        if email:
+            issues_by_email[email].append(
+                _extract_issue_data(issue, JIRA_SERVER, story_points_field)
+            )
+
+    return issues_by_email, account_to_email
+
+
+def refresh_jira_issues_cache() -> bool:
     """
     Refresh the Jira issues cache by fetching all issues from the saved filter
+
+    With JIRA_INCREMENTAL_REFRESH enabled, only issues updated since the
+    previous refresh are fetched and merged, and the whole filter is reloaded
+    every JIRA_FULL_REFRESH_MINUTES to drop issues that left it.
+
+    Returns:
+        True if the cache was refreshed
     """
+    global _jira_cache_readiness, _last_refresh_error, _last_refresh_at
+    global _last_full_refresh_at
+
     if not JIRA_FILTER_ID:
-        return
+        return False
 
     client = get_jira_client()
     if not client:
         logger.error("Failed to get Jira client for cache refresh")
-        return
+        _record_refresh_error("could not connect to Jira")
+        return False
 
     try:
+        started_at = datetime.now(timezone.utc)
+        full_refresh = _is_full_refresh_due(started_at)
+
         # Get the saved filter
-        saved_filter = client.filter(JIRA_FILTER_ID)
+        filter_jql = get_filter_jql(client, JIRA_FILTER_ID)
 
         # Build JQL query with optional sprint filtering
         sprint_filter = (
             os.environ.get("JIRA_CURRENT_SPRINT_ONLY", "false").lower() == "true"
         )
-        jql = _build_jql_query(saved_filter.jql, sprint_filter)
-
-        # Fetch all issues
-        all_issues = _fetch_all_issues(client, jql)
-
-        # Clear and rebuild the cache
-        jira_issues_cache.clear()
-        jira_account_to_email.clear()
-
-        # Process each issue
-        for issue in all_issues:
-            email = _process_issue_assignee(issue, jira_issues_cache, jira_account_to_email)
-            if email:
-                issue_data = _extract_issue_data(issue, JIRA_SERVER)
-                jira_issues_cache[email].append(issue_data)
+        jql = _build_jql_query(filter_jql, sprint_filter)
+        if not full_refresh:
+            jql = _add_jql_condition(
+                jql, _updated_since_condition(_last_refresh_at, started_at)
+            )
+
+        # Fetch all issues, with only the fields extracted from them
+        story_points_field = get_story_points_field(client)
+        all_issues = _fetch_all_issues(client, jql, _issue_fields(story_points_field))
+
+        # Build the new contents aside and publish them in one go
+        if full_refresh:
+            issues_by_email: Dict[str, List[Dict[str, Any]]] = {}
+            account_to_email: Dict[str, str] = {}
+
+            # Process each issue
+            for issue in all_issues:
+                email = _process_issue_assignee(issue, issues_by_email, account_to_email)
+                if email:
+                    issue_data = _extract_issue_data(issue, JIRA_SERVER, story_points_field)
+                    issues_by_email[email].append(issue_data)
+        else:
+            issues_by_email, account_to_email = _merge_changed_issues(
+                _jira_store.current().data, all_issues, story_points_field
+            )
+
+        snapshot = _jira_store.publish(_freeze_contents(issues_by_email, account_to_email))
+        logger.info(
+            f"Refreshed Jira issues cache (version {snapshot.version}, "
+            f"{'full' if full_refresh else 'incremental'}): {len(all_issues)} issues"
+        )
+        _jira_cache_readiness = CACHE_READY
+        _last_refresh_error = None
+        _last_refresh_at = started_at
+        if full_refresh:
+            _last_full_refresh_at = started_at
+        return True
 
     except JIRAError as e:
         logger.error(f"Failed to refresh issues cache: {str(e)}")
+        _record_refresh_error(f"Jira answered HTTP {e.status_code}")
+        reset_jira_client(e)
     except Exception as e:
         logger.error(f"Unexpected error refreshing cache: {str(e)}")
+        _record_refresh_error(str(e))
+        reset_jira_client(e)
+    return False
 
 
-def _categorize_issues(cached_issues: List[Dict[str, Any]]) -> Dict[str, List]:
+def export_jira_snapshot() -> Dict[str, Any]:
     """
-    Categorize issues by their state and priority
-
-    Args:
-        cached_issues: List of cached issue dictionaries
+    Export the Jira caches as plain data that can be persisted
 
     Returns:
-        Dictionary with categorized issues
+        Dictionary accepted by restore_jira_snapshot
     """
-    # Separate issues by state and priority
-    untriaged_issues = [
-        issue
-        for issue in cached_issues
-        if not issue.get("is_completed", False)
-        and (
-            not issue.get("priority")
-            or issue.get("priority", "").lower() in ["none", ""]
-        )
-    ]
-
-    active_issues = [
-        issue
-        for issue in cached_issues
-        if not issue.get("is_completed", False)
-        and not issue.get("is_in_review", False)
-        and issue.get("priority")
-        and issue.get("priority", "").lower() not in ["none", ""]
-    ]
-
-    review_issues = [
-        issue
-        for issue in cached_issues
-        if not issue.get("is_completed", False)
-        and issue.get("is_in_review", False)
-        and issue.get("priority")
-        and issue.get("priority", "").lower() not in ["none", ""]
-    ]
-
-    completed_issues = [
-        issue for issue in cached_issues if issue.get("is_completed", False)
-    ]
-
+    contents = _jira_store.current().data
     return {
-        "untriaged": untriaged_issues,
-        "active": active_issues,
-        "review": review_issues,
-        "completed": completed_issues,
+        "issues": {email: list(issues) for email, issues in contents.issues.items()},
+        "account_to_email": dict(contents.account_to_email),
     }
 
 
+def restore_jira_snapshot(snapshot: Dict[str, Any]) -> None:
+    """
+    Restore the Jira caches from data produced by export_jira_snapshot
+
+    Args:
+        snapshot: Exported cache data
+    """
+    global _jira_cache_readiness, _last_refresh_at
+
+    _jira_store.publish(
+        _freeze_contents(snapshot["issues"], snapshot["account_to_email"])
+    )
+    if _jira_cache_readiness in (CACHE_WARMING, CACHE_FAILED):
+        _jira_cache_readiness = CACHE_RESTORED
+    # Restored issues are reconciled by a full refresh before any delta
+    _last_refresh_at = None
+
+
 def get_jira_issues_for_user(
     email: str, max_results: int = 50
 ) -> Dict[str, List[Dict[str, Any]]]:
@@ -255,25 +582,12 @@ def get_jira_issues_for_user(
     Returns:
         Dictionary with 'active', 'review', 'completed', and 'untriaged' lists
     """
-    if email not in jira_issues_cache:
-        return {"active": [], "review": [], "completed": [], "untriaged": []}
-
-    cached_issues = jira_issues_cache[email]
-    categorized = _categorize_issues(cached_issues)
-
-    # Sort by priority and limit results
-    result = {}
-    for category in ["active", "review", "completed"]:
-        sorted_issues = sorted(
-            categorized[category],
-            key=lambda x: get_priority_sort_key(x.get("priority", "")),
-        )[:max_results]
-        result[category] = sorted_issues
-
-    # Untriaged issues don't need priority sorting (they have no priority)
-    result["untriaged"] = categorized["untriaged"][:max_results]
+    view = _jira_store.current().data.views.get(email)
+    if view is None:
+        return {category: [] for category in JIRA_CATEGORIES}
 
-    return result
+    # Views are categorized and sorted by priority when published
+    return {category: list(view[category][:max_results]) for category in JIRA_CATEGORIES}
 
 
 def get_jira_issues_for_mattermost_handle(
@@ -4,8 +4,11 @@ Jira client configuration and initialization
 
 import logging
 import os
-from typing import Optional
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
 
+import requests
 from jira import JIRA
 from jira.exceptions import JIRAError
 
@@ -16,28 +19,128 @@ JIRA_TOKEN = os.environ.get("JIRA_TOKEN")
 JIRA_EMAIL = os.environ.get("JIRA_EMAIL")
 JIRA_FILTER_ID = os.environ.get("JIRA_FILTER_ID")
 
+# Story points field used when no field is named after story points
+DEFAULT_STORY_POINTS_FIELD = "customfield_10024"
+
+# Lowercased names of story points fields; matched exactly, as names merely
+# containing them include unrelated fields such as Sprint
+STORY_POINTS_FIELD_NAMES = (
+    "story points",
+    "story point",
+    "story point estimate",
+    "storypoints",
+    "sp",
+)
+
+# Story points field identified on the Jira server, looked up once
+_story_points_field: Optional[str] = None
+
+# Minutes the JQL of a saved filter is cached for
+DEFAULT_FILTER_TTL_MINUTES = 60
+
+# Client kept for the lifetime of the process, so that refreshes reuse its
+# session and connections; re-created after auth or connection errors
+_client: Optional[JIRA] = None
+_client_lock = threading.Lock()
+
+# filter ID -> (fetch time, JQL)
+_filter_jql: Dict[str, Tuple[datetime, str]] = {}
+_filter_jql_lock = threading.Lock()
+
 
 def get_jira_client() -> Optional[JIRA]:
     """
     Get authenticated Jira client
 
+    The client is created on first use and shared by later calls.
+
     Returns:
         Authenticated JIRA client or None if configuration is missing
     """
+    global _client
+
     if not all([JIRA_SERVER, JIRA_TOKEN, JIRA_EMAIL]):
         logger.warning(
             "Jira configuration incomplete. Need JIRA_SERVER, JIRA_TOKEN, and JIRA_EMAIL"
         )
         return None
 
+    with _client_lock:
+        if _client is not None:
+            return _client
+        try:
+            _client = JIRA(server=JIRA_SERVER, basic_auth=(JIRA_EMAIL, JIRA_TOKEN))
+            return _client
+        except JIRAError as e:
+            logger.error(f"Failed to create Jira client: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error creating Jira client: {str(e)}")
+            return None
+
+
+def reset_jira_client(error: Exception) -> bool:
+    """
+    Drop the shared client after an error it may not recover from
+
+    Authentication errors and broken connections make the next
+    get_jira_client call create a new client; other errors keep it.
+
+    Args:
+        error: Error raised while using the client
+
+    Returns:
+        True if the client was dropped
+    """
+    global _client
+
+    if isinstance(error, JIRAError):
+        if error.status_code not in (401, 403):
+            return False
+    elif not isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    ):
+        return False
+
+    with _client_lock:
+        _client = None
+    logger.warning(f"Dropped Jira client after error, it is re-created on next use: {error}")
+    return True
+
+
+def get_filter_jql(client: JIRA, filter_id: str) -> str:
+    """
+    Get the JQL of a saved filter, cached for JIRA_FILTER_TTL_MINUTES
+
+    Args:
+        client: JIRA client instance
+        filter_id: Saved filter ID
+
+    Returns:
+        The filter's JQL; the last known JQL while fetching it fails
+
+    Raises:
+        JIRAError if the filter was never fetched and fetching it fails
+    """
+    ttl = timedelta(
+        minutes=int(os.environ.get("JIRA_FILTER_TTL_MINUTES", DEFAULT_FILTER_TTL_MINUTES))
+    )
+    with _filter_jql_lock:
+        cached = _filter_jql.get(filter_id)
+    if cached and datetime.now() - cached[0] < ttl:
+        return cached[1]
+
     try:
-        return JIRA(server=JIRA_SERVER, basic_auth=(JIRA_EMAIL, JIRA_TOKEN))
-    except JIRAError as e:
-        logger.error(f"Failed to create Jira client: {str(e)}")
-        return None
-    except Exception as e:
-        logger.error(f"Unexpected error creating Jira client: {str(e)}")
-        return None
+        jql = client.filter(filter_id).jql
+    except (JIRAError, requests.exceptions.RequestException) as e:
+        if not cached:
+            raise
+        logger.warning(f"Failed to fetch Jira filter {filter_id}, using cached JQL: {e}")
+        return cached[1]
+
+    with _filter_jql_lock:
+        _filter_jql[filter_id] = (datetime.now(), jql)
+    return jql
 
 
 def identify_story_points_field(client: Optional[JIRA] = None) -> Optional[str]:
@@ -58,18 +161,47 @@ def identify_story_points_field(client: Optional[JIRA] = None) -> Optional[str]:
     try:
         fields = client.fields()
 
-        story_points_names = ["story points", "story point", "storypoints", "sp"]
-
-        for field in fields:
-            if "custom" in field["id"]:
-                field_name = field.get("name", "").lower()
-                if any(sp_name in field_name for sp_name in story_points_names):
-                    logger.info(f"Found story points field: {field['id']} - {field['name']}")
-                    return field["id"]
+        candidates = [
+            field
+            for field in fields
+            if "custom" in field["id"]
+            and field.get("name", "").strip().lower() in STORY_POINTS_FIELD_NAMES
+        ]
+        if candidates:
+            # Sites can have several, e.g. Story Points and Story point estimate
+            field = next(
+                (f for f in candidates if f["id"] == DEFAULT_STORY_POINTS_FIELD),
+                candidates[0],
+            )
+            logger.info(f"Found story points field: {field['id']} - {field['name']}")
+            return field["id"]
 
-        logger.warning("Story points field not found by name, using default customfield_10024")
-        return "customfield_10024"
+        logger.warning(
+            f"Story points field not found by name, using default {DEFAULT_STORY_POINTS_FIELD}"
+        )
+        return DEFAULT_STORY_POINTS_FIELD
 
     except JIRAError as e:
         logger.error(f"Failed to identify story points field: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+
+def get_story_points_field(client: JIRA) -> str:
+    """
+    Get the custom field ID for story points, identifying it on first use
+
+    Args:
+        client: JIRA client instance
+
+    Returns:
+        Field ID for story points; the default field while it cannot be identified
+    """
+    global _story_points_field
+
+    if _story_points_field is None:
+        field = identify_story_points_field(client)
+        if field is None:
+            # Identified again on the next call
+            return DEFAULT_STORY_POINTS_FIELD
+        _story_points_field = field
+    return _story_points_field
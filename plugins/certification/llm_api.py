@@ -3,7 +3,7 @@ import logging
 import os
 from typing import Dict, Optional
 
-import requests
+from http_sessions import get_session
 from requests.exceptions import RequestException, Timeout
 
 logger = logging.getLogger(__name__)
@@ -71,7 +71,7 @@ class LLMAPIClient:
                 "options": {"num_predict": max_tokens, "temperature": temperature},
             }
 
-            response = requests.post(
+            response = get_session(url).post(
                 url,
                 headers=self._get_headers(),
                 json=payload,
@@ -101,7 +101,7 @@ class LLMAPIClient:
                 "stream": False,
             }
 
-            response = requests.post(
+            response = get_session(url).post(
                 url, headers=self._get_headers(), json=payload, timeout=120
             )
 
@@ -1,7 +1,7 @@
 from os import environ
 from typing import Any, Dict, TypedDict
 
-import requests
+from http_sessions import get_session
 
 mattermost_token = environ.get("ERRBOT_TOKEN")
 mattermost_base_url = f"https://{environ.get('ERRBOT_SERVER')}/api/v4"
@@ -31,7 +31,7 @@ class UserDetails(TypedDict):
 def get_user_by_email(token, base_url, email) -> UserDetails:
     url = f"{base_url}/users/email/{email}"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = get_session(url).get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
@@ -39,7 +39,7 @@ def get_user_by_email(token, base_url, email) -> UserDetails:
 def get_user_by_name(token, base_url, user_name) -> UserDetails:
     url = f"{base_url}/users/username/{user_name}"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = get_session(url).get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
@@ -47,7 +47,7 @@ def get_user_by_name(token, base_url, user_name) -> UserDetails:
 def get_user_by_mattermost_id(token, base_url, user_id) -> UserDetails:
     url = f"{base_url}/plugins/github/user?mattermost_user_id={user_id}"
     headers = {"Authorization": f"Bearer {token}"}
-    response = requests.get(url, headers=headers)
+    response = get_session(url).get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
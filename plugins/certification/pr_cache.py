@@ -1,16 +1,120 @@
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import requests
+from cache_readiness import CACHE_FAILED, CACHE_READY, CACHE_RESTORED, CACHE_WARMING
 from dotenv import load_dotenv
-from pr_cache_utils import categorize_pr_for_user
+from http_sessions import get_session
+from pr_cache_utils import (
+    GITHUB_GRAPHQL_URL,
+    GITHUB_SEARCH_ISSUES_URL,
+    CredentialPool,
+    PullRequestRecord,
+    RateLimitTracker,
+    analyze_review_states,
+    build_open_prs_query,
+    build_repo_prs_page_query,
+    categorize_pr_for_user,
+    compact_page,
+    compact_pr_page,
+    compact_search_page,
+    convert_pr_node,
+    github_credentials_from_env,
+    github_rate_limit,
+    iter_pages,
+    merge_pr_changes,
+    needs_review_status,
+    parse_github_timestamp,
+    pr_record_from_dict,
+    pr_revision,
+    relevant_logins,
+    repo_alias,
+    review_status_from_node,
+    search_open_pr_repositories,
+    to_pr_record,
+)
+from snapshot_store import SnapshotStore
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Number of repositories fetched concurrently during a cache refresh
+DEFAULT_FETCH_WORKERS = 8
+
+# Backends used to fetch open PRs: one REST crawl per repository, batched
+# GraphQL queries covering several repositories at once, or a REST crawl of
+# only the repositories an org-wide search finds open PRs in
+FETCH_BACKEND_REST = "rest"
+FETCH_BACKEND_GRAPHQL = "graphql"
+FETCH_BACKEND_SEARCH = "search"
+FETCH_BACKENDS = (FETCH_BACKEND_REST, FETCH_BACKEND_GRAPHQL, FETCH_BACKEND_SEARCH)
+
+# Org repositories without pushes for this many days are not crawled (0 crawls all)
+DEFAULT_INACTIVE_REPO_DAYS = 365
+
+# Fields of org repositories used to pick the repositories to crawl
+REPO_FIELDS = ("name", "archived", "disabled", "pushed_at")
+
+# Later pages of a list fetched concurrently once the last page is known
+DEFAULT_PAGE_WORKERS = 4
+
+# Number of repositories queried per GraphQL request
+DEFAULT_GRAPHQL_BATCH_SIZE = 10
+
+# In incremental mode, a full refresh still runs this often to catch deletions
+DEFAULT_FULL_REFRESH_MINUTES = 60
+
+# Refresh interval used until the rate limit budget is known, and the bounds
+# within which it is adapted to the budget
+DEFAULT_REFRESH_MINUTES = 5
+DEFAULT_MIN_REFRESH_MINUTES = 2
+DEFAULT_MAX_REFRESH_MINUTES = 30
+
+# With webhooks pushing PR changes, polling only reconciles missed events this often
+DEFAULT_RECONCILE_MINUTES = 60
+
+# Repositories that failed to fetch are retried on their own, first after this
+# many minutes and backing off exponentially up to the maximum
+DEFAULT_RETRY_MINUTES = 1
+MAX_RETRY_MINUTES = 15
+
+# Team membership rarely changes; cached members are served for this long and
+# refreshed in the background once half of it has passed
+DEFAULT_TEAM_MEMBERS_TTL_MINUTES = 60
+
+# Conditional request validators not used for this long are dropped after a
+# refresh; covers the full refresh, reconcile and team member intervals
+DEFAULT_VALIDATOR_RETENTION_MINUTES = 120
+
+# Overlap applied to delta windows to tolerate clock skew between us and GitHub
+DELTA_OVERLAP = timedelta(minutes=1)
+
+# Format version of snapshots produced by PullRequestCache.export_snapshot
+SNAPSHOT_VERSION = 2
+
+PR_CATEGORIES = (
+    "assigned",
+    "authored_unassigned",
+    "authored_approved",
+    "authored_changes_requested",
+    "authored_pending_review",
+    "authored_unknown_status",
+)
+
+
+class _CacheSnapshot(NamedTuple):
+    """PR cache contents and the per-user index built from them, swapped together"""
+
+    cache: Dict[str, List[PullRequestRecord]]  # repo_name -> list of PRs
+    # lowercased GitHub login -> category -> categorized PRs; None until built
+    user_index: Optional[Dict[str, Dict[str, List[PullRequestRecord]]]]
+
 
 class PullRequestCache:
     """
@@ -23,28 +127,256 @@ class PullRequestCache:
         repo_filter: Optional[List[str]] = None,
         github_token: str | None = None,
         github_org: str | None = None,
+        fetch_workers: Optional[int] = None,
+        fetch_backend: Optional[str] = None,
+        incremental: Optional[bool] = None,
+        rate_limit: Optional[RateLimitTracker] = None,
+        webhooks: Optional[bool] = None,
+        credentials: Optional[CredentialPool] = None,
     ):
-        self.github_token = github_token or os.environ.get("GITHUB_TOKEN")
         self.github_org = github_org or os.environ.get("GITHUB_ORG")
         self.repo_filter = repo_filter  # If provided, only fetch PRs from these repos
-        self.cache: Dict[str, List[dict]] = {}  # repo_name -> list of PRs
+        # Published contents; refreshes and webhook events publish new snapshots
+        self._store = SnapshotStore(_CacheSnapshot(cache={}, user_index=None))
         self.last_updated: Optional[datetime] = None
+        self.last_refresh_duration: Optional[float] = None  # seconds
+        # Why the last refresh failed, None once a refresh succeeded
+        self.last_refresh_error: Optional[str] = None
         self.cache_expiry_minutes = 15  # Cache expires after 15 minutes
+        self.fetch_workers = fetch_workers or int(
+            os.environ.get("GITHUB_FETCH_WORKERS", DEFAULT_FETCH_WORKERS)
+        )
+        # Each fetch worker may have its page workers requesting at once
+        self.max_connections = self.fetch_workers * DEFAULT_PAGE_WORKERS
+        # (url, query params) -> {"etag", "last_modified", "link", "data", "used_at"}
+        # for conditional requests
+        self._validator_store: Dict[Tuple[str, tuple, str], Dict[str, Any]] = {}
+        self._validator_lock = threading.Lock()
+        self.validator_retention = timedelta(
+            minutes=int(
+                os.environ.get(
+                    "GITHUB_VALIDATOR_RETENTION_MINUTES",
+                    DEFAULT_VALIDATOR_RETENTION_MINUTES,
+                )
+            )
+        )
+        self.not_modified_count = 0  # responses answered with 304 Not Modified
+        self.fetch_backend = (
+            fetch_backend or os.environ.get("GITHUB_FETCH_BACKEND", FETCH_BACKEND_REST)
+        ).lower()
+        self.inactive_repo_days = int(
+            os.environ.get("GITHUB_INACTIVE_REPO_DAYS", DEFAULT_INACTIVE_REPO_DAYS)
+        )
+        self.graphql_batch_size = int(
+            os.environ.get("GITHUB_GRAPHQL_BATCH_SIZE", DEFAULT_GRAPHQL_BATCH_SIZE)
+        )
+        # (repo_name, pr_number) -> (PR revision, review status), computed at refresh
+        self.review_status: Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]] = {}
+        self.last_review_fetch_count = 0  # review statuses fetched by the last refresh
+        # Incremental mode only fetches PRs updated since the previous refresh
+        if incremental is None:
+            incremental = (
+                os.environ.get("GITHUB_INCREMENTAL_REFRESH", "false").lower() == "true"
+            )
+        self.incremental = incremental
+        self.full_refresh_interval = timedelta(
+            minutes=int(
+                os.environ.get("GITHUB_FULL_REFRESH_MINUTES", DEFAULT_FULL_REFRESH_MINUTES)
+            )
+        )
+        self.last_full_refresh: Optional[datetime] = None
+        self.last_refresh_incremental = False
+        # repo_name -> start (UTC) of the last refresh that fetched the repository
+        self.repo_synced_at: Dict[str, datetime] = {}
+        # repo_name -> (consecutive failures, next retry) for repositories whose
+        # last fetch failed; their last known PRs are served meanwhile
+        self.repo_retry: Dict[str, Tuple[int, datetime]] = {}
+        self.retry_minutes = int(
+            os.environ.get("GITHUB_RETRY_MINUTES", DEFAULT_RETRY_MINUTES)
+        )
+        # Save time of the snapshot the cache was restored from, until the next refresh
+        self.snapshot_saved_at: Optional[datetime] = None
+        # Rate limit state, shared with the other GitHub API users by default
+        self.rate_limit = rate_limit or (
+            credentials.rate_limit if credentials else github_rate_limit
+        )
+        # Requests are spread over the credentials by their remaining budget
+        self.credentials = credentials or CredentialPool(
+            github_credentials_from_env(github_token), self.rate_limit
+        )
+        self.refresh_minutes = int(
+            os.environ.get("GITHUB_REFRESH_MINUTES", DEFAULT_REFRESH_MINUTES)
+        )
+        self.min_refresh_minutes = int(
+            os.environ.get("GITHUB_MIN_REFRESH_MINUTES", DEFAULT_MIN_REFRESH_MINUTES)
+        )
+        self.max_refresh_minutes = int(
+            os.environ.get("GITHUB_MAX_REFRESH_MINUTES", DEFAULT_MAX_REFRESH_MINUTES)
+        )
+        # rate limit resource -> requests used by the last refresh
+        self.last_refresh_cost: Dict[str, int] = {}
+        # Webhook events keep the cache current; refreshes only reconcile then
+        if webhooks is None:
+            webhooks = bool(os.environ.get("GITHUB_WEBHOOK_SECRET"))
+        self.webhooks = webhooks
+        self.reconcile_minutes = int(
+            os.environ.get("GITHUB_RECONCILE_MINUTES", DEFAULT_RECONCILE_MINUTES)
+        )
+        if self.webhooks:
+            # Only refresh inline when reconciliation has stalled
+            self.cache_expiry_minutes = max(
+                self.cache_expiry_minutes, 2 * self.reconcile_minutes
+            )
+        self.webhook_event_count = 0  # webhook events applied to the cache
+        self.last_webhook_event: Optional[datetime] = None
+        # Serializes swapping in refreshed contents and applying webhook events
+        self._update_lock = threading.Lock()
+        # (repository, PR JSON, review status entry) of webhook events applied
+        # while a refresh or retry fetches; newer than the fetched contents, so
+        # they are applied again before those are published
+        self._events_during_fetch: Optional[
+            List[Tuple[str, dict, Optional[Tuple[str, Dict[str, bool]]]]]
+        ] = None
+        # Held while a refresh or a retry of failed repositories runs, so that
+        # at most one of them runs at a time
+        self._refresh_lock = threading.Lock()
+        # team slug -> (fetch time, member logins)
+        self.team_members: Dict[str, Tuple[datetime, List[str]]] = {}
+        self.team_members_ttl = timedelta(
+            minutes=int(
+                os.environ.get(
+                    "GITHUB_TEAM_MEMBERS_TTL_MINUTES", DEFAULT_TEAM_MEMBERS_TTL_MINUTES
+                )
+            )
+        )
+        self._team_members_lock = threading.Lock()
 
-        if not self.github_token:
-            raise Exception("GITHUB_TOKEN must be set")
         if not self.github_org:
             raise Exception("GITHUB_ORG must be set")
+        if self.fetch_backend not in FETCH_BACKENDS:
+            raise Exception(
+                f"GITHUB_FETCH_BACKEND must be one of {', '.join(FETCH_BACKENDS)}"
+            )
 
-    def _get_headers(self) -> dict:
-        """Get GitHub API headers with authentication"""
-        return {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json",
+    @property
+    def _snapshot(self) -> _CacheSnapshot:
+        """Current cache contents and user index"""
+        return self._store.current().data
+
+    @property
+    def cache(self) -> Dict[str, List[PullRequestRecord]]:
+        """Cached open PRs, keyed by repository name"""
+        return self._snapshot.cache
+
+    @cache.setter
+    def cache(self, value: Dict[str, List[Any]]):
+        # Directly assigned PRs may be GitHub JSON and are converted to records;
+        # the user index is rebuilt lazily for them
+        cache = {
+            repo_name: (
+                [to_pr_record(pr, repo_name) for pr in prs] if prs is not None else None
+            )
+            for repo_name, prs in value.items()
         }
+        self._store.publish(_CacheSnapshot(cache=cache, user_index=None))
+
+    def _conditional_get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        resource: str = "core",
+        compact: Optional[Callable[[Any], Any]] = None,
+    ) -> Tuple[requests.Response, Any]:
+        """
+        Perform a GET request using ETag/Last-Modified validators from earlier responses.
+
+        Validators are stored per URL, query parameters and credential, as GitHub
+        ETags vary with the Authorization header. When GitHub answers 304 Not
+        Modified (which does not count against the rate limit) the previously
+        parsed page is reused.
+
+        Args:
+            url: URL to request
+            params: Query parameters
+            resource: Rate limit resource the request counts against
+            compact: Reduces the parsed body to what the caller uses; only
+                the result is returned and kept for 304 responses
+
+        Returns:
+            Tuple of (response, parsed JSON body). The body is None for responses
+            other than 200 and 304 with a stored page.
+        """
+        credential = self.credentials.acquire(resource)
+        headers = credential.headers()
+        key = (url, tuple(sorted((params or {}).items())), credential.name)
+
+        with self._validator_lock:
+            stored = self._validator_store.get(key)
+            if stored:
+                stored["used_at"] = datetime.now()
+        if stored:
+            if stored["etag"]:
+                headers["If-None-Match"] = stored["etag"]
+            if stored["last_modified"]:
+                headers["If-Modified-Since"] = stored["last_modified"]
+
+        response = get_session(url, self.max_connections).get(
+            url, headers=headers, params=params
+        )
+        self.rate_limit.update(response, credential.name)
+
+        if response.status_code == 304 and stored:
+            with self._validator_lock:
+                self.not_modified_count += 1
+            # Keep paginating like the original response did
+            if stored.get("link"):
+                response.headers.setdefault("Link", stored["link"])
+            return response, stored["data"]
+
+        if response.status_code != 200:
+            return response, None
+
+        data = response.json()
+        if compact is not None:
+            data = compact(data)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._validator_lock:
+                self._validator_store[key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "link": response.headers.get("Link"),
+                    "data": data,
+                    "used_at": datetime.now(),
+                }
+        return response, data
+
+    def _prune_validators(self) -> int:
+        """
+        Drop the validators of requests not sent for validator_retention, such
+        as the reviews of closed PRs or old delta pages.
+
+        Returns:
+            Number of entries dropped
+        """
+        unused_since = datetime.now() - self.validator_retention
+        with self._validator_lock:
+            unused = [
+                key
+                for key, stored in self._validator_store.items()
+                if stored["used_at"] < unused_since
+            ]
+            for key in unused:
+                del self._validator_store[key]
+        if unused:
+            logger.debug(f"Dropped {len(unused)} unused conditional request validators")
+        return len(unused)
 
     def _get_repositories_to_fetch(self) -> List[str]:
         """Get list of repositories to fetch PRs from"""
+        if self.fetch_backend == FETCH_BACKEND_SEARCH:
+            return self._search_repositories_with_open_prs()
         if self.repo_filter:
             # Use the provided filter list
             return self.repo_filter.copy()
@@ -52,50 +384,108 @@ class PullRequestCache:
             # Fetch all repositories from the organization
             return self._fetch_all_org_repositories()
 
+    def _search_repositories_with_open_prs(self) -> List[str]:
+        """
+        Find the repositories with open non-draft PRs through the search API,
+        restricted to the repository filter if one is set.
+
+        Search results lack requested reviewers and teams, so the PRs of the
+        repositories found are still fetched from the pulls API.
+        """
+
+        def fetch_page(params: dict):
+            return self._conditional_get(
+                GITHUB_SEARCH_ISSUES_URL, params, "search", compact_search_page
+            )
+
+        repositories = search_open_pr_repositories(fetch_page, self.github_org)
+        if repositories is None:
+            raise requests.exceptions.RequestException(
+                f"Search for open PRs of {self.github_org} failed"
+            )
+
+        if self.repo_filter:
+            return [repo for repo in self.repo_filter if repo in repositories]
+        return sorted(repositories)
+
+    def _is_active_repository(self, repo: dict, pushed_after: Optional[datetime]) -> bool:
+        """Whether an org repository may have open PRs worth crawling"""
+        if repo.get("archived") or repo.get("disabled"):
+            return False
+        if pushed_after is None:
+            return True
+        pushed_at = parse_github_timestamp(repo.get("pushed_at"))
+        return pushed_at is None or pushed_at >= pushed_after
+
     def _fetch_all_org_repositories(self) -> List[str]:
-        """Fetch all repository names for the organization"""
-        headers = self._get_headers()
-        repos = []
-        page = 1
-        per_page = 100
+        """
+        Fetch the names of the organization's repositories, leaving out archived
+        repositories and those without pushes in the last inactive_repo_days.
 
-        while True:
-            url = f"https://api.github.com/orgs/{self.github_org}/repos"
-            params = {"page": page, "per_page": per_page, "type": "all"}
+        A listing that fails partway would drop the repositories on the missing
+        pages from the cache, so the cached repositories are fetched instead.
 
-            try:
-                response = requests.get(url, headers=headers, params=params)
-                response.raise_for_status()
+        Raises:
+            requests.exceptions.RequestException if the listing failed and no
+            repositories are cached yet
+        """
+        url = f"https://api.github.com/orgs/{self.github_org}/repos"
+        pushed_after = (
+            datetime.now(timezone.utc) - timedelta(days=self.inactive_repo_days)
+            if self.inactive_repo_days > 0
+            else None
+        )
+        repos = []
+        skipped = 0
 
-                page_repos = response.json()
+        try:
+            for response, page_repos in iter_pages(
+                lambda params: self._conditional_get(
+                    url, params, compact=lambda page: compact_page(page, REPO_FIELDS)
+                ),
+                {"type": "all"},
+                max_workers=DEFAULT_PAGE_WORKERS,
+            ):
+                response.raise_for_status()
                 if not page_repos:
                     break
+                for repo in page_repos:
+                    if self._is_active_repository(repo, pushed_after):
+                        repos.append(repo["name"])
+                    else:
+                        skipped += 1
 
-                repos.extend([repo["name"] for repo in page_repos])
-                page += 1
-
-            except requests.exceptions.RequestException as e:
-                logger.error(
-                    f"Error fetching repositories for org {self.github_org}: {e}"
-                )
-                break
+        except requests.exceptions.RequestException as e:
+            cached = list(self.cache)
+            if not cached:
+                raise
+            logger.error(
+                f"Error fetching repositories for org {self.github_org}, fetching "
+                f"the {len(cached)} cached repositories instead: {e}"
+            )
+            return cached
 
+        if skipped:
+            logger.info(
+                f"Skipping {skipped} archived or inactive repositories of {self.github_org}"
+            )
         return repos
 
-    def _fetch_prs_for_repo(self, repo_name: str) -> Optional[List[dict]]:
+    def _fetch_prs_for_repo(
+        self, repo_name: str
+    ) -> Optional[List[PullRequestRecord]]:
         """Fetch all open PRs for a specific repository"""
-        headers = self._get_headers()
+        url = f"https://api.github.com/repos/{self.github_org}/{repo_name}/pulls"
         prs = []
-        page = 1
-        per_page = 100
-
-        while True:
-            url = f"https://api.github.com/repos/{self.github_org}/{repo_name}/pulls"
-            params = {"state": "open", "page": page, "per_page": per_page}
-
-            try:
-                response = requests.get(url, headers=headers, params=params)
 
+        try:
+            for response, page_prs in iter_pages(
+                lambda params: self._conditional_get(
+                    url, params, compact=lambda page: compact_pr_page(page, repo_name)
+                ),
+                {"state": "open"},
+                max_workers=DEFAULT_PAGE_WORKERS,
+            ):
                 # Handle 404 for repositories that don't exist or are not accessible
                 if response.status_code == 404:
                     logger.warning(
@@ -105,50 +495,829 @@ class PullRequestCache:
 
                 response.raise_for_status()
 
-                page_prs = response.json()
+                if page_prs is None:
+                    logger.error(
+                        f"Error fetching PRs for {self.github_org}/{repo_name}: "
+                        f"HTTP {response.status_code}"
+                    )
+                    return None
                 if not page_prs:
                     break
 
-                # Filter out draft PRs before adding to cache
-                non_draft_prs = [pr for pr in page_prs if not pr.get("draft", False)]
-                prs.extend(non_draft_prs)
-                page += 1
+                # Only open non-draft PRs were compacted to records
+                prs.extend(pr for pr in page_prs if isinstance(pr, PullRequestRecord))
+
+        except requests.exceptions.RequestException as e:
+            logger.error(
+                f"Error fetching PRs for {self.github_org}/{repo_name}: {e}"
+            )
+            return None
+
+        return prs
+
+    def _fetch_pr_changes_for_repo(
+        self, repo_name: str, since: datetime
+    ) -> Optional[List[PullRequestRecord]]:
+        """
+        Fetch PRs of a repository in any state that were updated since a given time.
+
+        Pulls are requested most recently updated first, and paging stops at the
+        first PR older than `since`.
 
-            except requests.exceptions.RequestException as e:
+        Returns:
+            List of changed PRs, or None if an error occurs
+        """
+        url = f"https://api.github.com/repos/{self.github_org}/{repo_name}/pulls"
+        params = {"state": "all", "sort": "updated", "direction": "desc"}
+        changes = []
+
+        try:
+            # Pages are requested one at a time, as the older ones are rarely needed
+            for response, page_prs in iter_pages(
+                lambda page_params: self._conditional_get(
+                    url,
+                    page_params,
+                    compact=lambda page: compact_pr_page(page, repo_name),
+                ),
+                params,
+            ):
+                if response.status_code == 404:
+                    logger.warning(
+                        f"Repository {self.github_org}/{repo_name} not found or not accessible"
+                    )
+                    return None
+
+                response.raise_for_status()
+
+                if page_prs is None:
+                    return None
+
+                for pr in page_prs:
+                    if parse_github_timestamp(pr["updated_at"]) < since:
+                        return changes
+                    changes.append(pr)
+
+        except requests.exceptions.RequestException as e:
+            logger.error(
+                f"Error fetching PR changes for {self.github_org}/{repo_name}: {e}"
+            )
+            return None
+
+        return changes
+
+    def _fetch_repo_delta(
+        self, repo_name: str, previous_prs: List[PullRequestRecord], since: datetime
+    ) -> Optional[List[PullRequestRecord]]:
+        """
+        Bring the cached open PRs of a repository up to date with the PRs changed
+        since the given time. Falls back to a full fetch if the delta fails.
+        """
+        changes = self._fetch_pr_changes_for_repo(repo_name, since)
+        if changes is None:
+            return self._fetch_prs_for_repo(repo_name)
+        return merge_pr_changes(previous_prs, changes, repo_name)
+
+    def _is_full_refresh_due(self) -> bool:
+        """Check whether the next refresh must re-download every open PR"""
+        if not self.incremental or self.last_full_refresh is None:
+            return True
+        return datetime.now() - self.last_full_refresh >= self.full_refresh_interval
+
+    def _fetch_prs_rest(
+        self, repo_names: List[str], executor: ThreadPoolExecutor, full_refresh: bool
+    ) -> Dict[str, Optional[List[PullRequestRecord]]]:
+        """
+        Fetch open PRs for all repositories using the REST API.
+
+        During incremental refreshes, repositories that are already cached only
+        fetch the PRs updated since they were last synced.
+        """
+        cache = self.cache
+
+        def fetch(repo_name: str) -> Optional[List[PullRequestRecord]]:
+            synced_at = self.repo_synced_at.get(repo_name)
+            if full_refresh or repo_name not in cache or synced_at is None:
+                return self._fetch_prs_for_repo(repo_name)
+            return self._fetch_repo_delta(
+                repo_name, cache[repo_name], synced_at - DELTA_OVERLAP
+            )
+
+        return dict(zip(repo_names, executor.map(fetch, repo_names)))
+
+    def _graphql_query(self, query: str, variables: dict) -> dict:
+        """
+        Run a GraphQL query against the GitHub API.
+
+        Returns:
+            The decoded response body with 'data' and optional 'errors' keys
+
+        Raises:
+            requests.exceptions.RequestException on HTTP errors
+        """
+        credential = self.credentials.acquire("graphql")
+        response = get_session(GITHUB_GRAPHQL_URL, self.max_connections).post(
+            GITHUB_GRAPHQL_URL,
+            headers=credential.headers(),
+            json={"query": query, "variables": variables},
+        )
+        self.rate_limit.update(response, credential.name)
+        response.raise_for_status()
+        return response.json()
+
+    def _fetch_remaining_graphql_pages(self, repo_name: str, cursor: str) -> List[dict]:
+        """Fetch the PR nodes of a repository that did not fit in the batch query"""
+        nodes = []
+        query = build_repo_prs_page_query()
+
+        while cursor:
+            body = self._graphql_query(
+                query,
+                {"owner": self.github_org, "name": repo_name, "cursor": cursor},
+            )
+            connection = body["data"]["repository"]["pullRequests"]
+            nodes.extend(connection["nodes"])
+            page_info = connection["pageInfo"]
+            cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+
+        return nodes
+
+    def _fetch_prs_graphql_batch(
+        self, repo_names: List[str]
+    ) -> Tuple[Dict[str, Optional[List[PullRequestRecord]]], Dict[Tuple[str, int], Dict[str, bool]]]:
+        """
+        Fetch open non-draft PRs for a batch of repositories with one GraphQL query.
+
+        Returns:
+            Tuple of (repo_name -> list of PRs or None on failure,
+            (repo_name, pr_number) -> review status)
+        """
+        results: Dict[str, Optional[List[PullRequestRecord]]] = {}
+        review_status: Dict[Tuple[str, int], Dict[str, bool]] = {}
+
+        try:
+            body = self._graphql_query(
+                build_open_prs_query(repo_names), {"owner": self.github_org}
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching PRs via GraphQL for {repo_names}: {e}")
+            return {repo_name: None for repo_name in repo_names}, review_status
+
+        data = body.get("data") or {}
+        errors_by_alias = {
+            error["path"][0]: error
+            for error in body.get("errors", [])
+            if error.get("path")
+        }
+
+        for index, repo_name in enumerate(repo_names):
+            alias = repo_alias(index)
+            repository = data.get(alias)
+
+            if repository is None:
+                error = errors_by_alias.get(alias, {})
+                if error.get("type") == "NOT_FOUND":
+                    logger.warning(
+                        f"Repository {self.github_org}/{repo_name} not found or not accessible"
+                    )
+                    results[repo_name] = []
+                else:
+                    logger.error(
+                        f"Error fetching PRs via GraphQL for {self.github_org}/{repo_name}: "
+                        f"{error.get('message', 'no data returned')}"
+                    )
+                    results[repo_name] = None
+                continue
+
+            connection = repository["pullRequests"]
+            nodes = list(connection["nodes"])
+            page_info = connection["pageInfo"]
+
+            try:
+                if page_info["hasNextPage"]:
+                    nodes.extend(
+                        self._fetch_remaining_graphql_pages(
+                            repo_name, page_info["endCursor"]
+                        )
+                    )
+            except (requests.exceptions.RequestException, KeyError, TypeError) as e:
                 logger.error(
-                    f"Error fetching PRs for {self.github_org}/{repo_name}: {e}"
+                    f"Error fetching further PR pages via GraphQL for "
+                    f"{self.github_org}/{repo_name}: {e}"
                 )
-                return None
+                results[repo_name] = None
+                continue
 
-        return prs
+            prs = []
+            for node in nodes:
+                if node.get("isDraft", False):
+                    continue
+                prs.append(to_pr_record(convert_pr_node(node), repo_name))
+                review_status[(repo_name, node["number"])] = review_status_from_node(node)
+            results[repo_name] = prs
+
+        return results, review_status
+
+    def _fetch_prs_graphql(
+        self, repo_names: List[str], executor: ThreadPoolExecutor
+    ) -> Tuple[Dict[str, Optional[List[PullRequestRecord]]], Dict[Tuple[str, int], Dict[str, bool]]]:
+        """Fetch open PRs for all repositories using concurrent GraphQL batches"""
+        batches = [
+            repo_names[i : i + self.graphql_batch_size]
+            for i in range(0, len(repo_names), self.graphql_batch_size)
+        ]
+        results: Dict[str, Optional[List[PullRequestRecord]]] = {}
+        review_status: Dict[Tuple[str, int], Dict[str, bool]] = {}
+        for batch_results, batch_review_status in executor.map(
+            self._fetch_prs_graphql_batch, batches
+        ):
+            results.update(batch_results)
+            review_status.update(batch_review_status)
+        return results, review_status
+
+    def _collect_review_status(
+        self,
+        cache: Dict[str, List[PullRequestRecord]],
+        known_status: Dict[Tuple[str, int], Dict[str, bool]],
+        executor: ThreadPoolExecutor,
+    ) -> Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]]:
+        """
+        Compute review status for every cached PR that has reviewers or assignees.
+
+        Statuses already delivered by the fetch backend are used as they are.
+        A status cached for the same PR revision (head SHA and updated_at) is
+        reused; only new or changed PRs are fetched, concurrently. Failed fetches
+        are left out so they are retried on the next refresh.
+        """
+        review_status = {}
+        to_fetch = []
+
+        for repo_name, prs in cache.items():
+            for pr in prs:
+                if not needs_review_status(pr):
+                    continue
+                key = (repo_name, pr.number)
+                revision = pr_revision(pr)
+                previous = self.review_status.get(key)
+
+                if key in known_status:
+                    review_status[key] = (revision, known_status[key])
+                elif previous and previous[0] == revision:
+                    review_status[key] = previous
+                else:
+                    to_fetch.append((key, revision))
+
+        statuses = executor.map(
+            lambda item: self._get_pr_review_status(*item[0]), to_fetch
+        )
+        for (key, revision), status in zip(to_fetch, statuses):
+            if status is not None:
+                review_status[key] = (revision, status)
+
+        self.last_review_fetch_count = len(to_fetch)
+        return review_status
+
+    def _review_fetcher(
+        self, review_status: Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]]
+    ):
+        """
+        Build the review status lookup used by the categorizer.
+
+        Only review status precomputed during refresh_cache is used; PRs whose
+        status could not be fetched are categorized as unknown without any
+        request, and retried by get_prs_for_user for the user asking.
+        """
+
+        def review_fetcher(repo, pr_num):
+            cached = review_status.get((repo, pr_num))
+            return cached[1] if cached is not None else None
+
+        return review_fetcher
+
+    def _build_user_index(
+        self,
+        cache: Dict[str, List[PullRequestRecord]],
+        review_status: Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]],
+    ) -> Dict[str, Dict[str, List[PullRequestRecord]]]:
+        """
+        Categorize every cached PR for each user it concerns.
+
+        Returns:
+            Mapping of lowercased GitHub login to PR lists per category
+        """
+        review_fetcher = self._review_fetcher(review_status)
+        index: Dict[str, Dict[str, List[PullRequestRecord]]] = {}
+
+        for repo_name, prs in cache.items():
+            for pr in prs:
+                for login in relevant_logins(pr):
+                    category, categorized_pr = categorize_pr_for_user(
+                        pr, repo_name, login, review_fetcher
+                    )
+                    if category and categorized_pr:
+                        if login not in index:
+                            index[login] = {name: [] for name in PR_CATEGORIES}
+                        index[login][category].append(categorized_pr)
+
+        return index
+
+    def _reindex_pr(
+        self,
+        index: Dict[str, Dict[str, List[PullRequestRecord]]],
+        cache: Dict[str, List[PullRequestRecord]],
+        repo_name: str,
+        previous: Optional[PullRequestRecord],
+        record: Optional[PullRequestRecord],
+        review_status: Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]],
+    ) -> Dict[str, Dict[str, List[PullRequestRecord]]]:
+        """
+        Copy of a user index with one changed PR categorized again.
+
+        Only the entries of the logins the PR concerned before or after the
+        change are replaced; PRs keep the order _build_user_index gives them.
+
+        Args:
+            index: User index built from the cache before the change
+            cache: Cache contents after the change
+            repo_name: Repository of the changed PR
+            previous: The PR before the change, None if it was not cached
+            record: The PR after the change, None if it was removed
+            review_status: Review status after the change
+        """
+        number = (record or previous).number
+        logins = set()
+        for pr in (previous, record):
+            if pr is not None:
+                logins |= relevant_logins(pr)
+
+        repo_order = {name: position for position, name in enumerate(cache)}
+        review_fetcher = self._review_fetcher(review_status)
+        new_index = dict(index)
+        for login in logins:
+            categories = {
+                name: [
+                    pr
+                    for pr in index.get(login, {}).get(name, [])
+                    if not (pr.repository == repo_name and pr.number == number)
+                ]
+                for name in PR_CATEGORIES
+            }
+            if record is not None:
+                category, categorized_pr = categorize_pr_for_user(
+                    record, repo_name, login, review_fetcher
+                )
+                if category and categorized_pr:
+                    categories[category].append(categorized_pr)
+                    categories[category].sort(
+                        key=lambda pr: (repo_order.get(pr.repository, 0), -pr.number)
+                    )
+            if any(categories.values()):
+                new_index[login] = categories
+            else:
+                new_index.pop(login, None)
+        return new_index
 
     def refresh_cache(self) -> bool:
-        """Refresh the entire PR cache with data from specified repositories"""
+        """
+        Refresh the entire PR cache with data from specified repositories.
+        Repositories are fetched concurrently by a bounded pool of workers.
+
+        Only one refresh runs at a time; a refresh requested while another is
+        in progress is skipped and returns False.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            logger.info("PR cache refresh already in progress, skipping")
+            return False
+        try:
+            return self._refresh_cache()
+        finally:
+            self._refresh_lock.release()
+
+    def is_refreshing(self) -> bool:
+        """Whether a refresh is in progress"""
+        return self._refresh_lock.locked()
+
+    def refresh_in_background(self) -> bool:
+        """
+        Start a refresh in a background thread unless one is already running.
+
+        Returns:
+            True if a refresh was started
+        """
+        if self.is_refreshing():
+            return False
+        threading.Thread(
+            target=self.refresh_cache, name="pr-cache-refresh", daemon=True
+        ).start()
+        return True
+
+    def _refresh_cache(self) -> bool:
+        backoff = self.rate_limit.backoff_remaining()
+        if backoff > 0:
+            self.last_refresh_error = (
+                f"backing off from GitHub rate limit for another {backoff:.0f}s"
+            )
+            logger.warning(f"Skipping PR cache refresh, {self.last_refresh_error}")
+            return False
+
+        reserved = self.rate_limit.reserve_remaining(self._refresh_resource())
+        if reserved > 0:
+            self.last_refresh_error = (
+                f"the remaining GitHub budget is reserved for interactive requests "
+                f"for another {reserved:.0f}s"
+            )
+            logger.warning(f"Deferring PR cache refresh, {self.last_refresh_error}")
+            return False
+
         try:
+            started = time.monotonic()
+            budget_before = self.rate_limit.remaining_by_resource()
+            sync_started_at = datetime.now(timezone.utc)
+            full_refresh = (
+                self.fetch_backend == FETCH_BACKEND_GRAPHQL or self._is_full_refresh_due()
+            )
             repo_names = self._get_repositories_to_fetch()
 
+            self._start_event_log()
+            previous_cache = self.cache
             new_cache = {}
             total_prs = 0
             successful_repos = 0
+            failed_repos = []
 
-            # Fetch PRs for each repository
-            for repo_name in repo_names:
-                prs = self._fetch_prs_for_repo(repo_name)
-                if prs is not None:  # Only cache if fetch was successful
-                    new_cache[repo_name] = prs
-                    total_prs += len(prs)
-                    successful_repos += 1
+            workers = max(1, min(self.fetch_workers, len(repo_names)))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="pr-cache"
+            ) as executor:
+                if self.fetch_backend == FETCH_BACKEND_GRAPHQL:
+                    results, known_status = self._fetch_prs_graphql(
+                        repo_names, executor
+                    )
                 else:
-                    logger.warning(f"Failed to fetch PRs for {repo_name}, skipping")
+                    results = self._fetch_prs_rest(repo_names, executor, full_refresh)
+                    known_status = {}
 
-            self.cache = new_cache
+                # Merge results in the original repository order. Stats may be
+                # read concurrently, so the sync times are published as a new dict
+                repo_synced_at = dict(self.repo_synced_at)
+                for repo_name in repo_names:
+                    prs = results.get(repo_name)
+                    if prs is not None:  # Only cache if fetch was successful
+                        new_cache[repo_name] = prs
+                        total_prs += len(prs)
+                        successful_repos += 1
+                        repo_synced_at[repo_name] = sync_started_at
+                    elif repo_name in previous_cache:
+                        # Keep serving the last known PRs until a retry succeeds
+                        new_cache[repo_name] = previous_cache[repo_name]
+                        total_prs += len(new_cache[repo_name])
+                        failed_repos.append(repo_name)
+                        logger.warning(
+                            f"Failed to fetch PRs for {repo_name}, keeping PRs "
+                            f"synced at {repo_synced_at.get(repo_name)}"
+                        )
+                    else:
+                        failed_repos.append(repo_name)
+                        logger.warning(f"Failed to fetch PRs for {repo_name}, skipping")
+
+                if repo_names and not successful_repos:
+                    # e.g. an invalid token; the cache is left as it is
+                    raise requests.exceptions.RequestException(
+                        f"none of the {len(repo_names)} repositories could be fetched"
+                    )
+
+                new_review_status = self._collect_review_status(
+                    new_cache, known_status, executor
+                )
+
+            self._publish_fetched(new_cache, new_review_status)
+            self.repo_synced_at = repo_synced_at
+            self.repo_retry = {
+                repo_name: self._next_retry(repo_name) for repo_name in failed_repos
+            }
             self.last_updated = datetime.now()
+            self.last_refresh_error = None
+            self.last_refresh_duration = time.monotonic() - started
+            self.last_refresh_incremental = not full_refresh
+            if full_refresh:
+                self.last_full_refresh = self.last_updated
+            self.snapshot_saved_at = None
+            self._record_refresh_cost(budget_before)
+            self._refresh_team_members()
+            self._prune_validators()
+
+            logger.info(
+                f"Refreshed PR cache ({'full' if full_refresh else 'incremental'}): "
+                f"{total_prs} PRs from {successful_repos}/"
+                f"{len(repo_names)} repositories in {self.last_refresh_duration:.2f}s "
+                f"using {workers} workers ({self.fetch_backend} backend, "
+                f"{self.last_review_fetch_count} review statuses fetched)"
+            )
 
             return True
 
         except Exception as e:
+            self.last_refresh_error = str(e)
             logger.error(f"Error refreshing PR cache: {e}")
             return False
+        finally:
+            self._events_during_fetch = None
+
+    def _start_event_log(self) -> None:
+        """Record the webhook events applied from now on, until _publish_fetched"""
+        with self._update_lock:
+            self._events_during_fetch = []
+
+    def _publish_fetched(
+        self,
+        cache: Dict[str, List[PullRequestRecord]],
+        review_status: Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]],
+    ) -> None:
+        """
+        Publish fetched cache contents, with the webhook events applied since
+        _start_event_log applied again over them.
+
+        The user index is built without holding the update lock; when another
+        event is applied meanwhile, the contents are merged and indexed again.
+        """
+        while True:
+            with self._update_lock:
+                events = list(self._events_during_fetch or [])
+            merged_cache, merged_status = self._reapply_events(
+                cache, review_status, events
+            )
+            new_index = self._build_user_index(merged_cache, merged_status)
+
+            with self._update_lock:
+                if len(self._events_during_fetch or []) != len(events):
+                    continue
+                self.review_status = merged_status
+                self._store.publish(
+                    _CacheSnapshot(cache=merged_cache, user_index=new_index)
+                )
+                self._events_during_fetch = None
+                return
+
+    @staticmethod
+    def _reapply_events(
+        cache: Dict[str, List[PullRequestRecord]],
+        review_status: Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]],
+        events: List[Tuple[str, dict, Optional[Tuple[str, Dict[str, bool]]]]],
+    ) -> Tuple[
+        Dict[str, List[PullRequestRecord]],
+        Dict[Tuple[str, int], Tuple[str, Dict[str, bool]]],
+    ]:
+        """Apply logged webhook PR states over fetched contents that are older"""
+        if not events:
+            return cache, review_status
+        cache = dict(cache)
+        review_status = dict(review_status)
+        for repo_name, pr, status in events:
+            prs = cache.get(repo_name)
+            if prs is None or PullRequestCache._is_outdated(pr, prs):
+                continue
+            cache[repo_name] = merge_pr_changes(prs, [pr], repo_name)
+            key = (repo_name, pr["number"])
+            if status is None:
+                review_status.pop(key, None)
+            else:
+                review_status[key] = status
+        return cache, review_status
+
+    @staticmethod
+    def _is_outdated(pr: dict, prs: List[PullRequestRecord]) -> bool:
+        """Whether a received PR state is older than the cached one"""
+        cached = next((p for p in prs if p.number == pr["number"]), None)
+        received_updated_at = parse_github_timestamp(pr.get("updated_at"))
+        cached_updated_at = parse_github_timestamp(cached.updated_at) if cached else None
+        return bool(
+            received_updated_at
+            and cached_updated_at
+            and received_updated_at < cached_updated_at
+        )
+
+    def _next_retry(self, repo_name: str) -> Tuple[int, datetime]:
+        """Retry state of a repository after another failed fetch"""
+        failures = self.repo_retry.get(repo_name, (0, None))[0] + 1
+        delay = min(self.retry_minutes * 2 ** (failures - 1), MAX_RETRY_MINUTES)
+        return failures, datetime.now() + timedelta(minutes=delay)
+
+    def retry_failed_repositories(self) -> bool:
+        """
+        Fetch again the repositories whose last fetch failed and are due for a
+        retry, without waiting for the next refresh of all repositories.
+
+        Retries are skipped while a refresh is in progress, which fetches those
+        repositories anyway.
+
+        Returns:
+            True if any repository was fetched successfully
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            return self._retry_failed_repositories()
+        finally:
+            self._refresh_lock.release()
+
+    def _retry_failed_repositories(self) -> bool:
+        now = datetime.now()
+        due = [
+            repo_name
+            for repo_name, (_, next_retry) in self.repo_retry.items()
+            if next_retry <= now
+        ]
+        if (
+            not due
+            or self.rate_limit.backoff_remaining()
+            or self.rate_limit.reserve_remaining()
+        ):
+            return False
+
+        sync_started_at = datetime.now(timezone.utc)
+        self._start_event_log()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.fetch_workers, len(due))),
+                thread_name_prefix="pr-cache-retry",
+            ) as executor:
+                results = self._fetch_prs_rest(due, executor, full_refresh=False)
+                fetched = {repo: prs for repo, prs in results.items() if prs is not None}
+                fetched_review_status = self._collect_review_status(
+                    fetched, {}, executor
+                )
+
+            new_cache = dict(self.cache)
+            new_cache.update(fetched)
+            review_status = {
+                key: status
+                for key, status in self.review_status.items()
+                if key[0] not in fetched
+            }
+            review_status.update(fetched_review_status)
+            self._publish_fetched(new_cache, review_status)
+        finally:
+            self._events_during_fetch = None
+
+        # Published as new dicts, as stats may iterate over them meanwhile
+        repo_synced_at = dict(self.repo_synced_at)
+        repo_retry = dict(self.repo_retry)
+        for repo_name in due:
+            if repo_name in fetched:
+                repo_synced_at[repo_name] = sync_started_at
+                repo_retry.pop(repo_name, None)
+            elif repo_name in repo_retry:
+                repo_retry[repo_name] = self._next_retry(repo_name)
+        self.repo_synced_at = repo_synced_at
+        self.repo_retry = repo_retry
+
+        logger.info(
+            f"Retried {len(due)} failed repositories, {len(fetched)} fetched successfully"
+        )
+        return bool(fetched)
+
+    def _refresh_resource(self) -> str:
+        """Rate limit resource most refresh requests are counted against"""
+        if self.fetch_backend == FETCH_BACKEND_GRAPHQL:
+            return "graphql"
+        return "core"
+
+    def _record_refresh_cost(self, budget_before: Dict[str, Dict[str, int]]) -> None:
+        """Record the rate limit budget a refresh used, per resource"""
+        for resource, after in self.rate_limit.remaining_by_resource().items():
+            before = budget_before.get(resource)
+            if before is None:
+                # First response seen for this resource; the budget used so far
+                # in this window is an upper bound for the refresh cost
+                self.last_refresh_cost[resource] = after["limit"] - after["remaining"]
+            elif before["reset"] == after["reset"]:
+                self.last_refresh_cost[resource] = before["remaining"] - after["remaining"]
+            # Otherwise the window reset during the refresh; keep the previous cost
+
+    def next_refresh_interval(self) -> float:
+        """
+        Seconds until the next scheduled refresh, adapted to the remaining rate
+        limit budget and any rate limit backoff.
+        """
+        if self.webhooks:
+            reconcile_seconds = self.reconcile_minutes * 60
+            return self.rate_limit.suggest_interval(
+                base_seconds=reconcile_seconds,
+                min_seconds=reconcile_seconds,
+                max_seconds=max(reconcile_seconds, self.max_refresh_minutes * 60),
+                cost_by_resource=self.last_refresh_cost,
+            )
+        return self.rate_limit.suggest_interval(
+            base_seconds=self.refresh_minutes * 60,
+            min_seconds=self.min_refresh_minutes * 60,
+            max_seconds=self.max_refresh_minutes * 60,
+            cost_by_resource=self.last_refresh_cost,
+        )
+
+    def apply_webhook_event(self, event: str, payload: dict) -> bool:
+        """
+        Apply a GitHub pull_request or pull_request_review webhook event.
+
+        The PR in the payload is inserted, updated or removed like in a delta
+        refresh. Its review status is fetched again after a review, or when the
+        PR revision changed. Events for repositories that are not cached yet
+        are ignored; the next refresh picks those up.
+
+        Args:
+            event: Value of the X-GitHub-Event header
+            payload: Event payload
+
+        Returns:
+            True if the event was applied to the cache
+        """
+        repository = payload.get("repository") or {}
+        repo_name = repository.get("name")
+        owner = (repository.get("owner") or {}).get("login", "")
+        pr = payload.get("pull_request")
+        if not repo_name or not pr or owner.lower() != self.github_org.lower():
+            return False
+
+        # The review status and user index entries are computed without holding
+        # the update lock, as GitHub times deliveries out after 10 seconds; should
+        # another update be published meanwhile, they are computed again over it
+        key = (repo_name, pr["number"])
+        fetched_status = None
+        while True:
+            with self._update_lock:
+                current = self._store.current()
+                review_status = dict(self.review_status)
+            prs = current.data.cache.get(repo_name)
+            if prs is None:
+                logger.debug(f"Ignoring {event} event for uncached repository {repo_name}")
+                return False
+
+            # Deliveries can arrive out of order; never go back to an older PR state
+            if self._is_outdated(pr, prs):
+                logger.debug(
+                    f"Ignoring outdated {event} event for {repo_name}#{pr['number']}"
+                )
+                return False
+
+            new_cache = dict(current.data.cache)
+            new_cache[repo_name] = merge_pr_changes(prs, [pr], repo_name)
+            cached = next((p for p in prs if p.number == pr["number"]), None)
+            record = next(
+                (p for p in new_cache[repo_name] if p.number == pr["number"]), None
+            )
+
+            if record is None or not needs_review_status(record):
+                review_status.pop(key, None)
+            else:
+                revision = pr_revision(record)
+                previous = review_status.get(key)
+                if (
+                    event == "pull_request_review"
+                    or previous is None
+                    or previous[0] != revision
+                ):
+                    if fetched_status is None or fetched_status[0] != revision:
+                        fetched_status = (
+                            revision,
+                            self._get_pr_review_status(repo_name, record.number),
+                        )
+                    if fetched_status[1] is not None:
+                        review_status[key] = fetched_status
+                    else:
+                        # Unknown until the author looks it up or the next
+                        # refresh fetches it again
+                        review_status.pop(key, None)
+
+            new_index = None
+            if current.data.user_index is not None:
+                new_index = self._reindex_pr(
+                    current.data.user_index,
+                    new_cache,
+                    repo_name,
+                    cached,
+                    record,
+                    review_status,
+                )
+
+            with self._update_lock:
+                published = self._store.publish(
+                    _CacheSnapshot(cache=new_cache, user_index=new_index),
+                    expected_version=current.version,
+                )
+                if published is None:
+                    continue
+                self.review_status = review_status
+                if self._events_during_fetch is not None:
+                    self._events_during_fetch.append(
+                        (repo_name, pr, review_status.get(key))
+                    )
+                self.webhook_event_count += 1
+                self.last_webhook_event = datetime.now()
+            break
+
+        logger.info(
+            f"Applied {event} event ({payload.get('action')}) "
+            f"for {repo_name}#{pr['number']} to PR cache"
+        )
+        return True
 
     def is_cache_expired(self) -> bool:
         """Check if the cache has expired"""
@@ -158,38 +1327,97 @@ class PullRequestCache:
         expiry_time = self.last_updated + timedelta(minutes=self.cache_expiry_minutes)
         return datetime.now() > expiry_time
 
+    def readiness(self) -> str:
+        """Get the readiness state of the cache (see cache_readiness)"""
+        if self.snapshot_saved_at is not None:
+            return CACHE_RESTORED
+        if self.last_updated is None:
+            # Until a refresh succeeds, report why the last one failed
+            return CACHE_FAILED if self.last_refresh_error else CACHE_WARMING
+        return CACHE_READY
+
     def get_prs_for_user(self, github_username: str) -> dict:
         """
         Get PRs relevant to a specific GitHub user.
         Returns dict with 'assigned', 'authored_unassigned', 'authored_approved', 
         'authored_changes_requested', 'authored_pending_review', and 'authored_unknown_status' lists.
+
+        The review status of the user's PRs that the last refresh could not
+        fetch is fetched again, from the interactive budget.
         """
-        # Refresh cache if expired
-        if self.is_cache_expired():
-            self.refresh_cache()
-
-        pr_categories = {
-            "assigned": [],
-            "authored_unassigned": [],
-            "authored_approved": [],
-            "authored_changes_requested": [],
-            "authored_pending_review": [],
-            "authored_unknown_status": [],
-        }
-        
-        def review_fetcher(repo, pr_num):
-            return self._get_pr_review_status(repo, pr_num)
-        
-        # Categorize each PR
-        for repo_name, prs in self.cache.items():
-            for pr in prs:
-                category, categorized_pr = categorize_pr_for_user(
-                    pr, repo_name, github_username, review_fetcher
-                )
-                if category and categorized_pr:
-                    pr_categories[category].append(categorized_pr)
-        
-        return pr_categories
+        # Refresh cache if expired; data restored from a snapshot is served as is
+        # while the refresh scheduled at startup catches up, and so is stale data
+        # while backing off from a rate limit
+        if (
+            self.is_cache_expired()
+            and self.snapshot_saved_at is None
+            and not self.rate_limit.backoff_remaining()
+        ):
+            if self.last_updated is None:
+                # Nothing to serve yet: wait for the first refresh, joining one
+                # that is already running
+                if not self.refresh_cache():
+                    with self._refresh_lock:
+                        pass
+            else:
+                # Serve the stale data now and revalidate in the background
+                self.refresh_in_background()
+
+        # Look up the user's PRs in the index built at refresh time; the index is
+        # only built here when the cache contents were assigned directly
+        current = self._store.current()
+        snapshot = current.data
+        user_index = snapshot.user_index
+        if user_index is None:
+            user_index = self._build_user_index(snapshot.cache, self.review_status)
+            # Unless a newer snapshot was published meanwhile
+            self._store.publish(
+                _CacheSnapshot(cache=snapshot.cache, user_index=user_index),
+                expected_version=current.version,
+            )
+
+        login = github_username.lower()
+        user_prs = user_index.get(login, {})
+        result = {category: list(user_prs.get(category, [])) for category in PR_CATEGORIES}
+        if result["authored_unknown_status"]:
+            # Review status the refresh could not fetch is retried for the waiting user
+            with self.rate_limit.interactive():
+                self._retry_unknown_review_status(login, result)
+        return result
+
+    def _retry_unknown_review_status(self, login: str, result: dict) -> None:
+        """
+        Fetch the review status of a user's PRs categorized as unknown, moving
+        those fetched to their category and keeping their status for the index.
+        """
+        fetched = {}
+        unknown = []
+        for pr in result["authored_unknown_status"]:
+            status = self._get_pr_review_status(pr.repository, pr.number)
+            if status is None:
+                unknown.append(pr)
+                continue
+            fetched[(pr.repository, pr.number)] = (pr_revision(pr), status)
+            category, categorized_pr = categorize_pr_for_user(
+                pr, pr.repository, login, lambda repo, number: status
+            )
+            result[category].append(categorized_pr)
+        result["authored_unknown_status"] = unknown
+        if not fetched:
+            return
+
+        with self._update_lock:
+            review_status = dict(self.review_status)
+            for key, entry in fetched.items():
+                # Unless a refresh fetched it meanwhile
+                review_status.setdefault(key, entry)
+            self.review_status = review_status
+            # The index is built again from the fetched status on the next lookup
+            current = self._store.current()
+            self._store.publish(
+                _CacheSnapshot(cache=current.data.cache, user_index=None),
+                expected_version=current.version,
+            )
 
     def get_cache_stats(self) -> dict:
         """Get statistics about the current cache"""
@@ -199,29 +1427,153 @@ class PullRequestCache:
             "total_repositories": len(self.cache),
             "total_prs": total_prs,
             "cache_expired": self.is_cache_expired(),
+            "last_refresh_duration": self.last_refresh_duration,
+            "last_refresh_error": self.last_refresh_error,
+            "not_modified_responses": self.not_modified_count,
+            "stored_validators": len(self._validator_store),
+            "cached_review_statuses": len(self.review_status),
+            "cached_teams": len(self.team_members),
+            "failed_repositories": {
+                repo_name: {
+                    "failures": failures,
+                    "next_retry": next_retry,
+                    "synced_at": self.repo_synced_at.get(repo_name),
+                }
+                for repo_name, (failures, next_retry) in self.repo_retry.items()
+            },
+            "last_review_fetch_count": self.last_review_fetch_count,
+            "indexed_users": len(self._snapshot.user_index or {}),
+            "snapshot_version": self._store.version,
+            "last_refresh_incremental": self.last_refresh_incremental,
+            "last_full_refresh": self.last_full_refresh,
+            "readiness": self.readiness(),
+            "refreshing": self.is_refreshing(),
+            "rate_limit": self.rate_limit.stats(),
+            "last_refresh_cost": dict(self.last_refresh_cost),
+            "next_refresh_seconds": self.next_refresh_interval(),
+            "webhooks": self.webhooks,
+            "webhook_events": self.webhook_event_count,
+            "last_webhook_event": self.last_webhook_event,
+            "snapshot_age_seconds": (
+                (datetime.now() - self.snapshot_saved_at).total_seconds()
+                if self.snapshot_saved_at
+                else None
+            ),
+        }
+
+    def export_snapshot(self) -> dict:
+        """
+        Export the cache contents as plain data that can be persisted.
+
+        Returns:
+            Dictionary accepted by restore_snapshot
+        """
+        return {
+            "cache": {
+                repo_name: [pr.to_dict() for pr in prs]
+                for repo_name, prs in self.cache.items()
+            },
+            "review_status": dict(self.review_status),
+            "repo_synced_at": dict(self.repo_synced_at),
+            "last_updated": self.last_updated,
+            "last_full_refresh": self.last_full_refresh,
         }
 
+    def restore_snapshot(self, snapshot: dict, saved_at: datetime) -> None:
+        """
+        Restore the cache from data produced by export_snapshot.
+
+        The restored data is served until the next successful refresh, even
+        if it is older than the cache expiry.
+
+        Args:
+            snapshot: Exported cache data
+            saved_at: When the snapshot was saved
+        """
+        self.review_status = dict(snapshot["review_status"])
+        self.cache = {
+            repo_name: [pr_record_from_dict(pr) for pr in prs]
+            for repo_name, prs in snapshot["cache"].items()
+        }
+        self.repo_synced_at = dict(snapshot["repo_synced_at"])
+        self.last_updated = snapshot["last_updated"]
+        self.last_full_refresh = snapshot["last_full_refresh"]
+        self.snapshot_saved_at = saved_at
+        logger.info(
+            f"Restored PR cache snapshot from {saved_at}: "
+            f"{sum(len(prs) for prs in self.cache.values())} PRs "
+            f"from {len(self.cache)} repositories"
+        )
+
     def get_team_members(self, team_name: str) -> List[str]:
         """
         Get list of GitHub usernames for members of a specific team.
+
+        Members are cached for team_members_ttl and kept fresh by the PR cache
+        refresh. Members missing from the cache are fetched with the caller's
+        request priority. When fetching fails, the last known members are returned.
+
         Returns list of usernames, empty list if team not found or error occurs.
         """
         if not team_name:
             logger.warning("No team name provided")
             return []
 
-        headers = self._get_headers()
-        members = []
-        page = 1
-        per_page = 100
+        with self._team_members_lock:
+            cached = self.team_members.get(team_name)
+        if cached and datetime.now() - cached[0] < self.team_members_ttl:
+            return list(cached[1])
 
-        while True:
-            url = f"https://api.github.com/orgs/{self.github_org}/teams/{team_name}/members"
-            params = {"page": page, "per_page": per_page}
+        members = self._fetch_team_members(team_name)
+        if members is not None:
+            with self._team_members_lock:
+                self.team_members[team_name] = (datetime.now(), members)
+            return list(members)
 
-            try:
-                response = requests.get(url, headers=headers, params=params)
+        if cached:
+            logger.warning(
+                f"Serving team members of {self.github_org}/{team_name} "
+                f"cached at {cached[0]}"
+            )
+            return list(cached[1])
+        return []
+
+    def _refresh_team_members(self) -> None:
+        """Refetch cached teams once half of their TTL has passed"""
+        with self._team_members_lock:
+            due = [
+                team_name
+                for team_name, (fetched_at, _) in self.team_members.items()
+                if datetime.now() - fetched_at >= self.team_members_ttl / 2
+            ]
+
+        for team_name in due:
+            members = self._fetch_team_members(team_name)
+            if members is not None:
+                with self._team_members_lock:
+                    self.team_members[team_name] = (datetime.now(), members)
+
+    def _fetch_team_members(self, team_name: str) -> Optional[List[str]]:
+        """
+        Fetch the members of a team from GitHub.
+
+        Pages are revalidated with conditional requests, so an unchanged team
+        does not use up the rate limit.
+
+        Returns:
+            Member logins, an empty list if the team does not exist, or None if
+            fetching failed
+        """
+        url = f"https://api.github.com/orgs/{self.github_org}/teams/{team_name}/members"
+        members = []
 
+        try:
+            for response, page_members in iter_pages(
+                lambda params: self._conditional_get(
+                    url, params, compact=lambda page: compact_page(page, ("login",))
+                ),
+                max_workers=DEFAULT_PAGE_WORKERS,
+            ):
                 # Handle 404 for teams that don't exist or are not accessible
                 if response.status_code == 404:
                     logger.warning(
@@ -231,18 +1583,16 @@ class PullRequestCache:
 
                 response.raise_for_status()
 
-                page_members = response.json()
                 if not page_members:
                     break
 
                 members.extend([member["login"] for member in page_members])
-                page += 1
 
-            except requests.exceptions.RequestException as e:
-                logger.error(
-                    f"Error fetching team members for {self.github_org}/{team_name}: {e}"
-                )
-                return []
+        except requests.exceptions.RequestException as e:
+            logger.error(
+                f"Error fetching team members for {self.github_org}/{team_name}: {e}"
+            )
+            return None
 
         return members
 
@@ -256,42 +1606,35 @@ class PullRequestCache:
             dict with 'has_approvals' and 'has_changes_requested' booleans on success,
             None if an error occurs.
         """
-        headers = self._get_headers()
+        url = f"https://api.github.com/repos/{self.github_org}/{repo_name}/pulls/{pr_number}/reviews"
+        reviews = []
 
         try:
-            url = f"https://api.github.com/repos/{self.github_org}/{repo_name}/pulls/{pr_number}/reviews"
-            response = requests.get(url, headers=headers)
-
-            if response.status_code == 200:
-                reviews = response.json()
-                has_approvals = False
-                has_changes_requested = False
-
-                # Check review states
-                for review in reviews:
-                    state = review.get("state")
-                    if state == "APPROVED":
-                        has_approvals = True
-                    elif state == "CHANGES_REQUESTED":
-                        has_changes_requested = True
-
-                return {
-                    "has_approvals": has_approvals,
-                    "has_changes_requested": has_changes_requested,
-                }
-            elif response.status_code == 404:
-                logger.warning(f"PR {repo_name}#{pr_number} not found or not accessible (404)")
-                return None
-            else:
-                logger.warning(
-                    f"Error fetching reviews for {repo_name}#{pr_number}: HTTP {response.status_code}"
+            # Page through all reviews, not only the default first 30
+            for response, page_reviews in iter_pages(
+                lambda params: self._conditional_get(
+                    url, params, compact=lambda page: compact_page(page, ("state",))
                 )
-                return None
+            ):
+                if page_reviews is None:
+                    if response.status_code == 404:
+                        logger.warning(
+                            f"PR {repo_name}#{pr_number} not found or not accessible (404)"
+                        )
+                    else:
+                        logger.warning(
+                            f"Error fetching reviews for {repo_name}#{pr_number}: HTTP {response.status_code}"
+                        )
+                    return None
+
+                reviews.extend(page_reviews)
 
         except requests.exceptions.RequestException as e:
             logger.warning(f"Error fetching reviews for {repo_name}#{pr_number}: {e}")
             return None
 
+        return analyze_review_states(reviews)
+
     def _check_pr_has_approvals(self, repo_name: str, pr_number: int) -> bool:
         """
         Legacy method for backward compatibility.
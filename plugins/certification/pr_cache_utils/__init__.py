@@ -2,7 +2,84 @@
 PR Cache utility modules for reducing complexity
 """
 
-from .pr_categorizer import categorize_pr_for_user
-from .review_checker import get_pr_review_status
+from .credentials import (
+    AppInstallationCredential,
+    CredentialPool,
+    GitHubCredential,
+    TokenCredential,
+    github_credentials_from_env,
+)
+from .delta_merge import (
+    compact_pr_page,
+    is_cacheable_pr,
+    merge_pr_changes,
+    parse_github_timestamp,
+)
+from .graphql_batch import (
+    GITHUB_GRAPHQL_URL,
+    build_open_prs_query,
+    build_repo_prs_page_query,
+    convert_pr_node,
+    repo_alias,
+    review_status_from_node,
+)
+from .org_search import (
+    GITHUB_SEARCH_ISSUES_URL,
+    build_open_prs_search_query,
+    compact_search_page,
+    search_open_pr_repositories,
+)
+from .pagination import PER_PAGE, compact_page, iter_pages, parse_link_header
+from .pr_categorizer import (
+    categorize_pr_for_user,
+    needs_review_status,
+    pr_revision,
+    relevant_logins,
+)
+from .pr_record import PullRequestRecord, pr_record_from_dict, to_pr_record
+from .rate_limit import (
+    BudgetReserved,
+    RateLimitBackoff,
+    RateLimitTracker,
+    github_rate_limit,
+)
+from .review_checker import analyze_review_states, get_pr_review_status
 
-__all__ = ["categorize_pr_for_user", "get_pr_review_status"]
\ No newline at end of file
+__all__ = [
+    "categorize_pr_for_user",
+    "needs_review_status",
+    "pr_revision",
+    "relevant_logins",
+    "get_pr_review_status",
+    "analyze_review_states",
+    "GITHUB_GRAPHQL_URL",
+    "build_open_prs_query",
+    "build_repo_prs_page_query",
+    "convert_pr_node",
+    "repo_alias",
+    "review_status_from_node",
+    "compact_pr_page",
+    "is_cacheable_pr",
+    "merge_pr_changes",
+    "parse_github_timestamp",
+    "BudgetReserved",
+    "RateLimitBackoff",
+    "RateLimitTracker",
+    "github_rate_limit",
+    "GitHubCredential",
+    "TokenCredential",
+    "AppInstallationCredential",
+    "CredentialPool",
+    "github_credentials_from_env",
+    "PullRequestRecord",
+    "pr_record_from_dict",
+    "to_pr_record",
+    "PER_PAGE",
+    "compact_page",
+    "iter_pages",
+    "parse_link_header",
+    "GITHUB_SEARCH_ISSUES_URL",
+    "build_open_prs_search_query",
+    "compact_search_page",
+    "search_open_pr_repositories",
+]
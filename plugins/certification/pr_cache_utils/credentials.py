@@ -0,0 +1,207 @@
+"""
+GitHub API credentials
+
+GitHub counts rate limits per credential. A CredentialPool holds several of
+them, personal access tokens or GitHub App installations, and sends every
+request with the credential that has the most budget left, so that their
+budgets add up.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import jwt
+import requests
+from http_sessions import get_session
+
+from .delta_merge import parse_github_timestamp
+from .rate_limit import RateLimitTracker
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Installation tokens are valid for an hour and renewed this long before expiry
+TOKEN_RENEW_MARGIN = timedelta(minutes=5)
+# GitHub accepts app JWTs valid for at most 10 minutes
+APP_JWT_LIFETIME_SECONDS = 9 * 60
+
+
+class GitHubCredential(ABC):
+    """A credential to authenticate GitHub API requests with"""
+
+    def __init__(self, name: str):
+        # Identifies the credential in rate limit tracking and logs
+        self.name = name
+
+    @abstractmethod
+    def token(self) -> str:
+        """Token to send with the next request"""
+
+    def headers(self) -> dict:
+        """GitHub API headers authenticating with this credential"""
+        return {
+            "Authorization": f"token {self.token()}",
+            "Accept": "application/vnd.github.v3+json",
+        }
+
+
+class TokenCredential(GitHubCredential):
+    """A personal access token"""
+
+    def __init__(self, token: str):
+        # Named after a digest so that the token does not end up in logs
+        digest = hashlib.sha256(token.encode()).hexdigest()[:8]
+        super().__init__(f"token-{digest}")
+        self._token = token
+
+    def token(self) -> str:
+        return self._token
+
+
+class AppInstallationCredential(GitHubCredential):
+    """
+    Installation tokens of a GitHub App, minted with the app's private key and
+    renewed before they expire.
+    """
+
+    def __init__(self, app_id: str, private_key: str, installation_id: str):
+        super().__init__(f"app-installation-{installation_id}")
+        self.app_id = app_id
+        self.installation_id = installation_id
+        self._private_key = private_key
+        self._token: Optional[str] = None
+        self._expires_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def _app_jwt(self) -> str:
+        """JWT authenticating as the app itself"""
+        now = int(time.time())
+        return jwt.encode(
+            # Backdated against clock drift, as GitHub recommends
+            {"iat": now - 60, "exp": now + APP_JWT_LIFETIME_SECONDS, "iss": self.app_id},
+            self._private_key,
+            algorithm="RS256",
+        )
+
+    def _renew(self) -> None:
+        url = f"{GITHUB_API_URL}/app/installations/{self.installation_id}/access_tokens"
+        response = get_session(url).post(
+            url,
+            headers={
+                "Authorization": f"Bearer {self._app_jwt()}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+        )
+        response.raise_for_status()
+        body = response.json()
+        self._token = body["token"]
+        self._expires_at = parse_github_timestamp(body["expires_at"])
+        logger.info(
+            f"Renewed GitHub App installation token {self.name}, "
+            f"valid until {self._expires_at}"
+        )
+
+    def expires_at(self) -> Optional[datetime]:
+        """Expiry of the current installation token, None before the first one"""
+        return self._expires_at
+
+    def token(self) -> str:
+        with self._lock:
+            now = datetime.now(timezone.utc)
+            if self._token is None or self._expires_at - now < TOKEN_RENEW_MARGIN:
+                try:
+                    self._renew()
+                except requests.exceptions.RequestException as e:
+                    if self._token is None or self._expires_at <= now:
+                        raise
+                    logger.warning(
+                        f"Renewing GitHub App installation token {self.name} failed, "
+                        f"using the current one until {self._expires_at}: {e}"
+                    )
+            return self._token
+
+
+class CredentialPool:
+    """
+    Credentials sharing the GitHub API traffic.
+
+    The rate limit tracker picks the credential for every request, based on the
+    budget each one has left.
+    """
+
+    def __init__(self, credentials: List[GitHubCredential], rate_limit: RateLimitTracker):
+        if not credentials:
+            raise Exception("GITHUB_TOKEN must be set")
+        self._credentials: Dict[str, GitHubCredential] = {
+            credential.name: credential for credential in credentials
+        }
+        self.rate_limit = rate_limit
+        rate_limit.register_credentials(list(self._credentials))
+
+    def __len__(self) -> int:
+        return len(self._credentials)
+
+    def names(self) -> List[str]:
+        """Names of the credentials in the pool"""
+        return list(self._credentials)
+
+    def acquire(self, resource: str = "core") -> GitHubCredential:
+        """
+        Pick the credential for a request to a rate limit resource. A
+        credential whose token cannot be obtained backs off and the next one
+        is picked instead.
+
+        Raises:
+            RateLimitBackoff if no credential may send the request now
+        """
+        while True:
+            credential = self._credentials[self.rate_limit.check(resource, self.names())]
+            try:
+                credential.token()
+            except (requests.exceptions.RequestException, jwt.PyJWTError) as e:
+                # E.g. an app installation token failing to renew
+                self.rate_limit.back_off(credential.name, str(e))
+                continue
+            return credential
+
+
+def github_credentials_from_env(token: Optional[str] = None) -> List[GitHubCredential]:
+    """
+    Build the GitHub credentials configured in the environment.
+
+    Args:
+        token: Primary token, GITHUB_TOKEN by default
+
+    Returns:
+        The primary token, the additional GITHUB_TOKENS and the GitHub App
+        installation if GITHUB_APP_ID is set
+    """
+    tokens = [token or os.environ.get("GITHUB_TOKEN") or ""]
+    tokens += os.environ.get("GITHUB_TOKENS", "").split(",")
+    # Ignore empty entries and tokens listed twice
+    unique_tokens = dict.fromkeys(value.strip() for value in tokens if value.strip())
+    credentials: List[GitHubCredential] = [TokenCredential(value) for value in unique_tokens]
+
+    app_id = os.environ.get("GITHUB_APP_ID")
+    if app_id:
+        installation_id = os.environ.get("GITHUB_APP_INSTALLATION_ID")
+        private_key = os.environ.get("GITHUB_APP_PRIVATE_KEY")
+        private_key_path = os.environ.get("GITHUB_APP_PRIVATE_KEY_PATH")
+        if private_key_path:
+            with open(private_key_path) as key_file:
+                private_key = key_file.read()
+        if not installation_id or not private_key:
+            raise Exception(
+                "GITHUB_APP_INSTALLATION_ID and GITHUB_APP_PRIVATE_KEY or "
+                "GITHUB_APP_PRIVATE_KEY_PATH must be set with GITHUB_APP_ID"
+            )
+        credentials.append(AppInstallationCredential(app_id, private_key, installation_id))
+
+    return credentials
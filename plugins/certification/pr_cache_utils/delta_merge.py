@@ -0,0 +1,78 @@
+"""
+Merging of changed PRs into the cached list of open PRs of a repository
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from .pr_record import PullRequestRecord, to_pr_record
+
+
+def parse_github_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp such as '2026-10-01T10:00:00Z'."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def is_cacheable_pr(pr: dict) -> bool:
+    """Check whether a PR belongs in the cache, i.e. it is open and not a draft."""
+    return pr.get("state", "open") == "open" and not pr.get("draft", False)
+
+
+def compact_pr_page(prs: Any, repo_name: str) -> Any:
+    """
+    Compact a page of the pulls API to keep between conditional requests.
+
+    Open non-draft PRs become records; other PRs keep only what merging
+    changes needs, so that the page still has one entry per PR.
+
+    Args:
+        prs: Pulls API page
+        repo_name: Repository the PRs belong to
+
+    Returns:
+        List of records and small dicts, or the page itself if it is not a list
+    """
+    if not isinstance(prs, list):
+        return prs
+    return [
+        to_pr_record(pr, repo_name)
+        if is_cacheable_pr(pr)
+        else {
+            "number": pr["number"],
+            "updated_at": pr.get("updated_at"),
+            "state": pr.get("state", "open"),
+            "draft": pr.get("draft", False),
+        }
+        for pr in prs
+    ]
+
+
+def merge_pr_changes(
+    prs: List[PullRequestRecord], changes: List[dict], repo_name: str
+) -> List[PullRequestRecord]:
+    """
+    Merge changed PRs into a list of cached open PRs.
+
+    Open non-draft PRs are inserted or replace the cached version; closed,
+    merged and draft PRs are dropped.
+
+    Args:
+        prs: Currently cached open PRs of a repository
+        changes: PRs of the same repository that changed since the last refresh,
+            as returned by the pulls API or compacted by compact_pr_page
+        repo_name: Repository the PRs belong to
+
+    Returns:
+        New list of open PRs, newest PR first like the pulls API returns them
+    """
+    prs_by_number = {pr["number"]: pr for pr in prs}
+
+    for pr in changes:
+        if is_cacheable_pr(pr):
+            prs_by_number[pr["number"]] = to_pr_record(pr, repo_name)
+        else:
+            prs_by_number.pop(pr["number"], None)
+
+    return sorted(prs_by_number.values(), key=lambda pr: pr["number"], reverse=True)
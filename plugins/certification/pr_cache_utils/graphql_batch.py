@@ -0,0 +1,131 @@
+"""
+GraphQL queries for fetching open PRs of several repositories in one request
+"""
+
+import json
+from typing import Any, Dict, List
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Limits for nested connections; GitHub caps every connection at 100 nodes
+PRS_PER_PAGE = 100
+NESTED_PER_PAGE = 50
+
+_PULL_REQUEST_FRAGMENT = f"""
+fragment OpenPullRequests on PullRequestConnection {{
+  pageInfo {{ hasNextPage endCursor }}
+  nodes {{
+    number
+    title
+    url
+    isDraft
+    updatedAt
+    headRefOid
+    author {{ login }}
+    assignees(first: {NESTED_PER_PAGE}) {{ nodes {{ login }} }}
+    reviewRequests(first: {NESTED_PER_PAGE}) {{
+      nodes {{
+        requestedReviewer {{
+          __typename
+          ... on User {{ login }}
+          ... on Team {{ slug name }}
+        }}
+      }}
+    }}
+    approvals: reviews(states: APPROVED) {{ totalCount }}
+    changesRequested: reviews(states: CHANGES_REQUESTED) {{ totalCount }}
+  }}
+}}
+"""
+
+
+def repo_alias(index: int) -> str:
+    """GraphQL alias used for the repository at the given batch position."""
+    return f"repo{index}"
+
+
+def build_open_prs_query(repo_names: List[str]) -> str:
+    """
+    Build a query returning the first page of open PRs for each repository.
+
+    Args:
+        repo_names: Repository names within the organization given as $owner
+
+    Returns:
+        GraphQL query string with one aliased repository field per name
+    """
+    fields = []
+    for index, repo_name in enumerate(repo_names):
+        fields.append(
+            f"  {repo_alias(index)}: repository(owner: $owner, name: {json.dumps(repo_name)}) {{\n"
+            f"    pullRequests(states: OPEN, first: {PRS_PER_PAGE}) {{ ...OpenPullRequests }}\n"
+            f"  }}"
+        )
+    return (
+        "query($owner: String!) {\n"
+        + "\n".join(fields)
+        + "\n}\n"
+        + _PULL_REQUEST_FRAGMENT
+    )
+
+
+def build_repo_prs_page_query() -> str:
+    """Build a query for a subsequent page of open PRs of a single repository."""
+    return (
+        "query($owner: String!, $name: String!, $cursor: String) {\n"
+        "  repository(owner: $owner, name: $name) {\n"
+        f"    pullRequests(states: OPEN, first: {PRS_PER_PAGE}, after: $cursor) "
+        "{ ...OpenPullRequests }\n"
+        "  }\n"
+        "}\n" + _PULL_REQUEST_FRAGMENT
+    )
+
+
+def convert_pr_node(node: Dict[str, Any]) -> dict:
+    """
+    Convert a GraphQL pull request node to the shape of the REST pulls API.
+
+    Only the fields used by the categorizer and formatters are filled in.
+    """
+    requested_reviewers = []
+    requested_teams = []
+    for request in node.get("reviewRequests", {}).get("nodes", []):
+        reviewer = request.get("requestedReviewer") or {}
+        if reviewer.get("__typename") == "Team":
+            requested_teams.append({"slug": reviewer["slug"], "name": reviewer["name"]})
+        elif reviewer.get("login"):
+            requested_reviewers.append({"login": reviewer["login"]})
+
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "html_url": node["url"],
+        "draft": node.get("isDraft", False),
+        "updated_at": node.get("updatedAt"),
+        "head": {"sha": node.get("headRefOid")},
+        "user": {"login": (node.get("author") or {}).get("login", "")},
+        "requested_reviewers": requested_reviewers,
+        "requested_teams": requested_teams,
+        "assignees": [
+            {"login": assignee["login"]}
+            for assignee in node.get("assignees", {}).get("nodes", [])
+        ],
+    }
+
+
+def review_status_from_node(node: Dict[str, Any]) -> Dict[str, bool]:
+    """
+    Derive review status from a GraphQL pull request node.
+
+    Like analyze_review_states on the reviews listed by the REST API, every
+    approving or change requesting review counts, even if the reviewer later
+    reviewed again, so that PRs are categorized the same with either backend.
+    """
+    return {
+        "has_approvals": _review_count(node, "approvals") > 0,
+        "has_changes_requested": _review_count(node, "changesRequested") > 0,
+    }
+
+
+def _review_count(node: Dict[str, Any], alias: str) -> int:
+    return (node.get(alias) or {}).get("totalCount", 0)
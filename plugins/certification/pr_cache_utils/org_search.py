@@ -0,0 +1,109 @@
+"""
+Org-wide enumeration of open PRs through the GitHub search API
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Callable, Optional, Set, Tuple
+
+import requests
+
+from .pagination import iter_pages
+
+logger = logging.getLogger(__name__)
+
+GITHUB_SEARCH_ISSUES_URL = "https://api.github.com/search/issues"
+
+# The search API returns at most this many results per query
+SEARCH_RESULT_CAP = 1000
+
+# No PR was created before GitHub launched
+SEARCH_START_DATE = date(2008, 1, 1)
+
+
+def build_open_prs_search_query(org: str, start: date, end: date) -> str:
+    """
+    Search query for open non-draft PRs of an org created within a date range,
+    leaving out archived repositories like the REST backend does
+    """
+    return (
+        f"is:pr is:open org:{org} archived:false -is:draft "
+        f"created:{start.isoformat()}..{end.isoformat()}"
+    )
+
+
+def repository_from_search_item(item: dict) -> str:
+    """Name of the repository of a search result, from its repository_url"""
+    return item["repository_url"].rstrip("/").rsplit("/", 1)[-1]
+
+
+def compact_search_page(body: Optional[dict]) -> Optional[dict]:
+    """Keep only the parts of a search results page used to find repositories"""
+    if not isinstance(body, dict):
+        return body
+    return {
+        "total_count": body.get("total_count", 0),
+        "incomplete_results": body.get("incomplete_results", False),
+        "items": [
+            {"repository_url": item["repository_url"]} for item in body.get("items", [])
+        ],
+    }
+
+
+def search_open_pr_repositories(
+    fetch_page: Callable[[dict], Tuple[requests.Response, Optional[dict]]],
+    org: str,
+    start: date = SEARCH_START_DATE,
+    end: Optional[date] = None,
+) -> Optional[Set[str]]:
+    """
+    Find the repositories of an org that have open non-draft PRs.
+
+    Date ranges matching more than SEARCH_RESULT_CAP PRs are split in half by
+    creation date until every shard can be paged through completely.
+
+    Args:
+        fetch_page: Function running a search for the given query parameters,
+            returning (response, parsed JSON body or None)
+        org: GitHub organization
+        start: First creation date to search
+        end: Last creation date to search, today by default
+
+    Returns:
+        Repository names, or None if a search request failed
+    """
+    repositories = set()
+    shards = [(start, end or date.today())]
+
+    while shards:
+        shard_start, shard_end = shards.pop()
+        query = build_open_prs_search_query(org, shard_start, shard_end)
+
+        for page_number, (response, data) in enumerate(
+            iter_pages(lambda params: fetch_page({"q": query, **params}))
+        ):
+            if data is None:
+                logger.warning(
+                    f"Search for open PRs of {org} failed: HTTP {response.status_code}"
+                )
+                return None
+
+            if page_number == 0 and data.get("total_count", 0) > SEARCH_RESULT_CAP:
+                if shard_start < shard_end:
+                    middle = shard_start + (shard_end - shard_start) / 2
+                    shards.append((shard_start, middle))
+                    shards.append((middle + timedelta(days=1), shard_end))
+                    break
+                logger.warning(
+                    f"More than {SEARCH_RESULT_CAP} open PRs of {org} were created "
+                    f"on {shard_start}, some repositories may be missed"
+                )
+
+            if data.get("incomplete_results"):
+                logger.warning(f"Search for open PRs of {org} returned incomplete results")
+
+            repositories.update(
+                repository_from_search_item(item) for item in data.get("items", [])
+            )
+
+    return repositories
@@ -0,0 +1,128 @@
+"""
+Pagination of GitHub list endpoints following the Link response header
+"""
+
+import contextvars
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+# Largest page size the GitHub REST API accepts
+PER_PAGE = 100
+
+_LINK_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+# Fetches one page: query parameters -> (response, parsed JSON body or None)
+PageFetcher = Callable[[dict], Tuple[requests.Response, Any]]
+
+
+def parse_link_header(value: Optional[str]) -> Dict[str, str]:
+    """
+    Parse a Link header such as '<https://...&page=2>; rel="next", ...'.
+
+    Returns:
+        Mapping of relation ("next", "last", ...) to URL
+    """
+    if not isinstance(value, str):
+        return {}
+    return {rel: url for url, rel in _LINK_PATTERN.findall(value)}
+
+
+def compact_page(items: Any, field_names: Sequence[str]) -> Any:
+    """
+    Keep only the given top-level fields of every item of a list page.
+
+    Returns:
+        The compacted list, or the page itself if it is not a list
+    """
+    if not isinstance(items, list):
+        return items
+    return [{name: item.get(name) for name in field_names} for item in items]
+
+
+def _page_number(url: str) -> Optional[int]:
+    pages = parse_qs(urlsplit(url).query).get("page")
+    try:
+        return int(pages[0]) if pages else None
+    except ValueError:
+        return None
+
+
+def _has_next_page(response: requests.Response, data: Any, per_page: int) -> bool:
+    """
+    Whether another page follows. Without a Link header, which GitHub leaves out
+    for single-page results, only a full page can have a successor.
+    """
+    links = parse_link_header(response.headers.get("Link"))
+    if links:
+        return "next" in links
+    return isinstance(data, list) and len(data) >= per_page
+
+
+def iter_pages(
+    fetch_page: PageFetcher,
+    params: Optional[dict] = None,
+    per_page: int = PER_PAGE,
+    max_workers: int = 1,
+) -> Iterator[Tuple[requests.Response, Any]]:
+    """
+    Iterate over the pages of a GitHub list endpoint.
+
+    Pages are streamed to the caller, which may stop early. Iteration ends after
+    the page without a rel="next" link, an empty page or an unsuccessful
+    response, which is yielded so the caller can handle it. When the first
+    response links to the last page and max_workers > 1, the remaining pages
+    are fetched concurrently and yielded in order. Page workers run in a copy
+    of the caller's context, so that they send requests with its priority.
+
+    Args:
+        fetch_page: Function fetching one page for the given query parameters
+        params: Query parameters other than page and per_page
+        per_page: Page size to request
+        max_workers: Pages fetched concurrently once the last page is known
+
+    Yields:
+        Tuples of (response, parsed JSON body or None)
+    """
+    params = dict(params or {})
+
+    def fetch(page: int) -> Tuple[requests.Response, Any]:
+        return fetch_page({**params, "page": page, "per_page": per_page})
+
+    response, data = fetch(1)
+    yield response, data
+    if not data or not _has_next_page(response, data, per_page):
+        return
+
+    last_url = parse_link_header(response.headers.get("Link")).get("last")
+    last_page = _page_number(last_url) if last_url else None
+
+    if max_workers > 1 and last_page and last_page > 2:
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, last_page - 1),
+            thread_name_prefix="github-pages",
+        )
+        try:
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch, page)
+                for page in range(2, last_page + 1)
+            ]
+            for future in futures:
+                response, data = future.result()
+                yield response, data
+                if data is None:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return
+
+    page = 2
+    while True:
+        response, data = fetch(page)
+        yield response, data
+        if not data or not _has_next_page(response, data, per_page):
+            return
+        page += 1
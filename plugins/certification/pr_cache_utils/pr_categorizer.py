@@ -2,103 +2,112 @@
 PR categorization logic extracted from PullRequestCache.get_prs_for_user
 """
 
-from typing import List, Tuple
+from typing import Optional, Set, Tuple
+
+from .pr_record import PullRequestRecord
 
 
 def categorize_pr_for_user(
-    pr: dict,
+    pr: PullRequestRecord,
     repo_name: str,
     github_username: str,
     review_status_fetcher=None
-) -> Tuple[str, dict]:
+) -> Tuple[Optional[str], Optional[PullRequestRecord]]:
     """
     Categorize a PR for a specific user.
     
     Args:
-        pr: Pull request data
+        pr: Pull request record
         repo_name: Repository name
         github_username: GitHub username to check
         review_status_fetcher: Callable to fetch review status (repo_name, pr_number) -> Optional[Dict]
     
     Returns:
-        Tuple of (category_name, pr_with_metadata) or (None, None) if not relevant
+        Tuple of (category_name, pr) or (None, None) if not relevant. PRs
+        assigned to the user are copies carrying the user's roles.
     """
-    requested_reviewers = pr.get("requested_reviewers", [])
-    assignees = pr.get("assignees", [])
-    author = pr.get("user", {}).get("login", "")
-    
-    is_requested_reviewer = _is_user_in_list(github_username, requested_reviewers)
-    is_assignee = _is_user_in_list(github_username, assignees)
+    login = github_username.lower()
+    is_requested_reviewer = _is_user_in_list(login, pr.reviewers)
+    is_assignee = _is_user_in_list(login, pr.assignees)
     
     if is_requested_reviewer or is_assignee:
-        pr_with_repo = _add_pr_metadata(pr, repo_name)
-        pr_with_repo["user_role"] = _get_user_roles(is_requested_reviewer, is_assignee)
-        return ("assigned", pr_with_repo)
+        roles = _get_user_roles(is_requested_reviewer, is_assignee)
+        return ("assigned", pr.with_user_role(roles))
     
-    if author.lower() == github_username.lower():
-        pr_with_repo = _add_pr_metadata(pr, repo_name)
-        return _categorize_authored_pr(pr, pr_with_repo, review_status_fetcher, repo_name)
+    if pr.author.lower() == login:
+        return _categorize_authored_pr(pr, review_status_fetcher, repo_name)
     
     return (None, None)
 
 
-def _is_user_in_list(username: str, user_list: List[dict]) -> bool:
-    """Check if username is in a list of user objects."""
-    return any(
-        user["login"].lower() == username.lower()
-        for user in user_list
-    )
+def needs_review_status(pr: PullRequestRecord) -> bool:
+    """Check whether a PR has reviewers, teams or assignees and so a review status."""
+    return bool(pr.reviewers or pr.teams or pr.assignees)
+
+
+def pr_revision(pr: PullRequestRecord) -> str:
+    """
+    Identify the revision of a PR from its head SHA and last update time.
+
+    Both change whenever commits are pushed or reviews are submitted, so a
+    review status computed for one revision stays valid until it changes.
+    """
+    return f"{pr.head_sha}:{pr.updated_at or ''}"
+
+
+def relevant_logins(pr: PullRequestRecord) -> Set[str]:
+    """
+    Get the lowercased logins of everyone a PR can be categorized for:
+    requested reviewers, assignees and the author.
+    """
+    logins = {login.lower() for login in pr.reviewers + pr.assignees}
+    if pr.author:
+        logins.add(pr.author.lower())
+    return logins
 
 
-def _add_pr_metadata(pr: dict, repo_name: str) -> dict:
-    """Add repository metadata to PR."""
-    pr_with_repo = pr.copy()
-    pr_with_repo["repository"] = repo_name
-    return pr_with_repo
+def _is_user_in_list(login: str, logins: Tuple[str, ...]) -> bool:
+    """Check if a lowercased login is in a list of logins."""
+    return any(user.lower() == login for user in logins)
 
 
-def _get_user_roles(is_reviewer: bool, is_assignee: bool) -> List[str]:
-    """Get list of user roles for a PR."""
+def _get_user_roles(is_reviewer: bool, is_assignee: bool) -> Tuple[str, ...]:
+    """Get the user roles for a PR."""
     roles = []
     if is_reviewer:
         roles.append("reviewer")
     if is_assignee:
         roles.append("assignee")
-    return roles
+    return tuple(roles)
 
 
 def _categorize_authored_pr(
-    pr: dict,
-    pr_with_repo: dict,
+    pr: PullRequestRecord,
     review_status_fetcher,
     repo_name: str
-) -> Tuple[str, dict]:
+) -> Tuple[str, PullRequestRecord]:
     """
     Categorize a PR authored by the user.
     
     Returns:
-        Tuple of (category_name, pr_data)
+        Tuple of (category_name, pr)
     """
-    requested_reviewers = pr.get("requested_reviewers", [])
-    requested_teams = pr.get("requested_teams", [])
-    assignees = pr.get("assignees", [])
-    
-    if not any([requested_reviewers, requested_teams, assignees]):
-        return ("authored_unassigned", pr_with_repo)
+    if not needs_review_status(pr):
+        return ("authored_unassigned", pr)
     
     if review_status_fetcher:
-        review_status = review_status_fetcher(repo_name, pr["number"])
+        review_status = review_status_fetcher(repo_name, pr.number)
         
         if review_status is None:
             # Error fetching review status
-            return ("authored_unknown_status", pr_with_repo)
+            return ("authored_unknown_status", pr)
         elif review_status.get("has_changes_requested"):
-            return ("authored_changes_requested", pr_with_repo)
+            return ("authored_changes_requested", pr)
         elif review_status.get("has_approvals"):
-            return ("authored_approved", pr_with_repo)
+            return ("authored_approved", pr)
         else:
             # Has reviewers/assignees but no review activity yet
-            return ("authored_pending_review", pr_with_repo)
+            return ("authored_pending_review", pr)
     
     # No review status fetcher provided, treat as pending
-    return ("authored_pending_review", pr_with_repo)
\ No newline at end of file
+    return ("authored_pending_review", pr)
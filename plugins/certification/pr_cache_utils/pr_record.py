@@ -0,0 +1,105 @@
+"""
+Compact immutable PR records kept in the PR cache instead of GitHub JSON
+"""
+
+import sys
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Any, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class PullRequestRecord:
+    """
+    The fields of an open PR used by the categorizer and the formatters.
+
+    Records also support read-only item access (pr["title"], pr.get(...),
+    "user_role" in pr) so code written for GitHub JSON dicts keeps working.
+    """
+
+    number: int
+    title: str
+    html_url: str
+    author: str
+    reviewers: Tuple[str, ...]  # logins of requested reviewers
+    teams: Tuple[str, ...]  # slugs of requested teams
+    assignees: Tuple[str, ...]  # logins of assignees
+    updated_at: Optional[str]
+    repository: str
+    head_sha: str = ""  # with updated_at, identifies the revision for review status
+    user_role: Optional[Tuple[str, ...]] = None  # set on categorized copies only
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_NAMES:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None and key == "user_role":
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_NAMES and getattr(self, key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def with_user_role(self, roles: Tuple[str, ...]) -> "PullRequestRecord":
+        """Copy of the record with the roles of the user it was categorized for"""
+        return replace(self, user_role=roles)
+
+    def to_dict(self) -> dict:
+        """Plain dictionary of the record fields, e.g. for persisting"""
+        return asdict(self)
+
+
+_FIELD_NAMES = frozenset(field.name for field in fields(PullRequestRecord))
+
+
+def _logins(users) -> Tuple[str, ...]:
+    return tuple(sys.intern(user["login"]) for user in users or [])
+
+
+def to_pr_record(pr, repo_name: str) -> PullRequestRecord:
+    """
+    Convert a PR from the GitHub pulls API to a PullRequestRecord.
+
+    Logins and repository names are interned, since the same few strings
+    repeat across every PR of an organization.
+
+    Args:
+        pr: Pull request JSON, or a record which is returned unchanged
+        repo_name: Repository the PR belongs to
+
+    Returns:
+        Record holding only the fields the bot uses
+    """
+    if isinstance(pr, PullRequestRecord):
+        return pr
+
+    return PullRequestRecord(
+        number=pr["number"],
+        title=pr.get("title", ""),
+        html_url=pr.get("html_url", ""),
+        author=sys.intern((pr.get("user") or {}).get("login", "")),
+        reviewers=_logins(pr.get("requested_reviewers")),
+        teams=tuple(
+            sys.intern(team.get("slug") or team.get("name", ""))
+            for team in pr.get("requested_teams") or []
+        ),
+        assignees=_logins(pr.get("assignees")),
+        updated_at=pr.get("updated_at"),
+        repository=sys.intern(repo_name),
+        head_sha=(pr.get("head") or {}).get("sha", ""),
+    )
+
+
+def pr_record_from_dict(data: dict) -> PullRequestRecord:
+    """Rebuild a record from PullRequestRecord.to_dict output"""
+    values = {name: data[name] for name in _FIELD_NAMES if name in data}
+    for name in ("reviewers", "teams", "assignees"):
+        values[name] = tuple(values.get(name, ()))
+    if values.get("user_role") is not None:
+        values["user_role"] = tuple(values["user_role"])
+    return PullRequestRecord(**values)
@@ -0,0 +1,382 @@
+"""
+GitHub rate limit tracking
+
+Every GitHub response carries the remaining budget of its rate limit resource
+(core, graphql, search, ...). The tracker records it, backs off when GitHub
+answers with a secondary rate limit, and suggests how often the PR cache can
+be refreshed without running out of budget.
+
+Requests are sent either for a user waiting on a command (interactive) or for
+background work such as cache refreshes. A slice of every resource budget is
+reserved for interactive requests: once only the reserve is left, background
+requests are refused until the window resets.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Backoff used when a rate limited response has no Retry-After header
+BASE_BACKOFF_SECONDS = 60
+MAX_BACKOFF_SECONDS = 15 * 60
+
+# Fraction of every resource budget reserved for interactive requests
+DEFAULT_INTERACTIVE_RESERVE = 0.1
+
+# Credential of callers that do not use a credential pool
+DEFAULT_CREDENTIAL = "default"
+
+PRIORITY_BACKGROUND = "background"
+PRIORITY_INTERACTIVE = "interactive"
+
+
+class RateLimitBackoff(requests.exceptions.RequestException):
+    """Raised instead of sending a request while backing off from a rate limit"""
+
+
+class BudgetReserved(RateLimitBackoff):
+    """Raised instead of sending a background request that would eat into the interactive reserve"""
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitTracker:
+    """
+    Thread-safe record of the GitHub rate limit state seen in responses.
+
+    State is kept per credential, as GitHub counts rate limits per token.
+    Callers that use a single token never name it and share DEFAULT_CREDENTIAL.
+    """
+
+    def __init__(self, interactive_reserve: float = DEFAULT_INTERACTIVE_RESERVE):
+        self._lock = threading.Lock()
+        # credential -> resource -> {"limit", "remaining", "reset"} with reset
+        # as epoch seconds
+        self._resources: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._backoff_until: Dict[str, float] = {}  # credential -> epoch seconds
+        self._consecutive_limited: Dict[str, int] = {}
+        # Credentials requests may be sent with, registered by credential pools
+        self._credentials: List[str] = []
+        self.interactive_reserve = interactive_reserve
+        # Priority of the requests sent in the current context; threads start
+        # as background unless they run in a copy of an interactive context,
+        # like the page workers of iter_pages
+        self._priority: ContextVar[str] = ContextVar(
+            "github_request_priority", default=PRIORITY_BACKGROUND
+        )
+        self.deferred_count = 0
+        self.interactive_count = 0
+
+    def register_credentials(self, names: List[str]) -> None:
+        """Add credentials that requests may be sent with"""
+        with self._lock:
+            for name in names:
+                if name not in self._credentials:
+                    self._credentials.append(name)
+
+    def _known_credentials(self) -> List[str]:
+        """Registered credentials and any others seen in responses, under _lock"""
+        names = list(
+            dict.fromkeys([*self._credentials, *self._resources, *self._backoff_until])
+        )
+        return names or [DEFAULT_CREDENTIAL]
+
+    @contextmanager
+    def interactive(self):
+        """Mark the requests the current thread sends meanwhile as interactive"""
+        token = self._priority.set(PRIORITY_INTERACTIVE)
+        try:
+            yield
+        finally:
+            self._priority.reset(token)
+
+    def priority(self) -> str:
+        """Priority of the requests sent by the current thread"""
+        return self._priority.get()
+
+    def _backoff_locked(self, credential: str, now: float) -> float:
+        return max(0.0, self._backoff_until.get(credential, 0.0) - now)
+
+    def _reserved_locked(self, credential: str, resource: str, now: float) -> float:
+        state = self._resources.get(credential, {}).get(resource)
+        if not state or state["remaining"] > state["limit"] * self.interactive_reserve:
+            return 0.0
+        return max(0.0, state["reset"] - now)
+
+    def reserve_remaining(
+        self, resource: str = "core", credential: Optional[str] = None
+    ) -> float:
+        """
+        Seconds until background requests to a resource may be sent again,
+        0 while the remaining budget of a credential is above the interactive
+        reserve. Without a credential, any known credential will do.
+        """
+        now = time.time()
+        with self._lock:
+            credentials = [credential] if credential else self._known_credentials()
+            return min(
+                self._reserved_locked(name, resource, now) for name in credentials
+            )
+
+    def update(self, response, credential: str = DEFAULT_CREDENTIAL) -> None:
+        """
+        Record the rate limit headers of a GitHub response sent with a
+        credential and start backing off if the response says we were rate
+        limited.
+        """
+        headers = getattr(response, "headers", None) or {}
+        resource = headers.get("X-RateLimit-Resource", "core")
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset = _int_header(headers, "X-RateLimit-Reset")
+
+        with self._lock:
+            if remaining is not None and reset is not None:
+                self._resources.setdefault(credential, {})[resource] = {
+                    "limit": limit if limit is not None else remaining,
+                    "remaining": remaining,
+                    "reset": reset,
+                }
+
+            if response.status_code not in (403, 429):
+                self._consecutive_limited[credential] = 0
+                return
+
+            retry_after = _int_header(headers, "Retry-After")
+            consecutive_limited = self._consecutive_limited.get(credential, 0)
+            if retry_after is not None:
+                # Secondary rate limit: wait as told, plus jitter so concurrent
+                # workers do not all retry at the same moment
+                self._consecutive_limited[credential] = consecutive_limited + 1
+                delay = retry_after + random.uniform(0, min(retry_after, 30) or 1)
+            elif remaining == 0 and reset is not None:
+                # Primary rate limit exhausted until the window resets
+                delay = max(0, reset - time.time()) + random.uniform(0, 5)
+            elif response.status_code == 429 or "rate limit" in (
+                getattr(response, "text", "") or ""
+            ).lower():
+                consecutive_limited += 1
+                self._consecutive_limited[credential] = consecutive_limited
+                delay = min(
+                    MAX_BACKOFF_SECONDS,
+                    BASE_BACKOFF_SECONDS * 2 ** (consecutive_limited - 1),
+                )
+                delay += random.uniform(0, delay / 2)
+            else:
+                return  # a plain 403, e.g. missing permissions
+
+            backoff_until = time.time() + delay
+            if backoff_until > self._backoff_until.get(credential, 0.0):
+                self._backoff_until[credential] = backoff_until
+                logger.warning(
+                    f"GitHub rate limit hit ({resource}, {credential}), "
+                    f"backing off for {delay:.0f}s"
+                )
+
+    def back_off(self, credential: str, reason: str) -> None:
+        """
+        Back off from a credential that cannot send requests for another
+        reason than a rate limit, e.g. a GitHub App token that failed to renew.
+        The backoff grows while the credential keeps failing.
+        """
+        with self._lock:
+            failures = self._consecutive_limited.get(credential, 0) + 1
+            self._consecutive_limited[credential] = failures
+            delay = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2 ** (failures - 1))
+            backoff_until = time.time() + delay
+            if backoff_until > self._backoff_until.get(credential, 0.0):
+                self._backoff_until[credential] = backoff_until
+                logger.warning(
+                    f"GitHub credential {credential} unusable, "
+                    f"backing off for {delay:.0f}s: {reason}"
+                )
+
+    def backoff_remaining(self, credential: Optional[str] = None) -> float:
+        """
+        Seconds left until requests may be sent again with a credential, or
+        without one, with any known credential
+        """
+        now = time.time()
+        with self._lock:
+            credentials = [credential] if credential else self._known_credentials()
+            return min(self._backoff_locked(name, now) for name in credentials)
+
+    def check(
+        self, resource: str = "core", credentials: Optional[List[str]] = None
+    ) -> str:
+        """
+        Pick the credential to send a request to a resource with: the one with
+        the most remaining budget among those not backing off from a rate limit
+        and, for background requests, not down to the interactive reserve.
+
+        Args:
+            resource: Rate limit resource the request counts against
+            credentials: Credentials to choose from, DEFAULT_CREDENTIAL by default
+
+        Returns:
+            Name of the credential to use
+
+        Raises:
+            RateLimitBackoff while all credentials back off from a rate limit,
+            BudgetReserved for background requests once only the interactive
+            reserve is left
+        """
+        interactive = self.priority() == PRIORITY_INTERACTIVE
+        now = time.time()
+        with self._lock:
+            candidates = credentials or [DEFAULT_CREDENTIAL]
+            backoff = min(self._backoff_locked(name, now) for name in candidates)
+            if backoff > 0:
+                raise RateLimitBackoff(
+                    f"Backing off from GitHub rate limit for another {backoff:.0f}s"
+                )
+
+            available = [
+                name for name in candidates if not self._backoff_locked(name, now)
+            ]
+            if interactive:
+                self.interactive_count += 1
+            else:
+                reserved = min(
+                    self._reserved_locked(name, resource, now) for name in available
+                )
+                if reserved > 0:
+                    self.deferred_count += 1
+                    raise BudgetReserved(
+                        f"GitHub {resource} budget reserved for interactive requests "
+                        f"for another {reserved:.0f}s"
+                    )
+                available = [
+                    name
+                    for name in available
+                    if not self._reserved_locked(name, resource, now)
+                ]
+
+            def remaining(name: str) -> float:
+                state = self._resources.get(name, {}).get(resource)
+                # Credentials not used yet for the resource are tried first
+                return state["remaining"] if state else float("inf")
+
+            return max(available, key=remaining)
+
+    def remaining_by_resource(
+        self, credential: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Copy of the last seen state of every rate limit resource of a
+        credential, or summed up over all credentials. Summed up states reset
+        when the last of their credentials does.
+        """
+        with self._lock:
+            if credential:
+                return {
+                    name: dict(state)
+                    for name, state in self._resources.get(credential, {}).items()
+                }
+            totals: Dict[str, Dict[str, int]] = {}
+            for resources in self._resources.values():
+                for name, state in resources.items():
+                    total = totals.setdefault(name, {"limit": 0, "remaining": 0, "reset": 0})
+                    total["limit"] += state["limit"]
+                    total["remaining"] += state["remaining"]
+                    total["reset"] = max(total["reset"], state["reset"])
+            return totals
+
+    def suggest_interval(
+        self,
+        base_seconds: float,
+        min_seconds: float,
+        max_seconds: float,
+        cost_by_resource: Dict[str, int],
+    ) -> float:
+        """
+        Suggest the delay until the next refresh.
+
+        Spreads the remaining budget of every resource over the time left
+        until it resets, keeping the interactive reserve of it unused.
+
+        Args:
+            base_seconds: Interval used when the budget is unknown
+            min_seconds: Shortest interval to suggest
+            max_seconds: Longest interval to suggest, unless backing off for longer
+            cost_by_resource: Requests one refresh used per resource
+
+        Returns:
+            Seconds until the next refresh
+        """
+        resources = self.remaining_by_resource()
+        now = time.time()
+        interval = None
+
+        for resource, cost in cost_by_resource.items():
+            state = resources.get(resource)
+            if not state or cost <= 0:
+                continue
+            until_reset = max(0.0, state["reset"] - now)
+            budget = state["remaining"] - state["limit"] * self.interactive_reserve
+            if budget < cost:
+                needed = until_reset  # wait for the window to reset
+            else:
+                needed = until_reset / (budget / cost)
+            interval = max(interval or 0.0, needed)
+
+        if interval is None:
+            interval = base_seconds
+        interval = min(max(interval, min_seconds), max_seconds)
+        return max(interval, self.backoff_remaining())
+
+    def stats(self) -> Dict[str, Any]:
+        """Rate limit state for cache statistics"""
+        resources = self.remaining_by_resource()
+        backoff = self.backoff_remaining()
+        with self._lock:
+            credentials = self._known_credentials()
+        return {
+            "resources": {
+                name: {
+                    "limit": state["limit"],
+                    "remaining": state["remaining"],
+                    "reset": datetime.fromtimestamp(state["reset"]),
+                }
+                for name, state in resources.items()
+            },
+            "backoff_until": (
+                datetime.fromtimestamp(time.time() + backoff) if backoff else None
+            ),
+            "credentials": {
+                name: {
+                    resource: state["remaining"]
+                    for resource, state in self.remaining_by_resource(name).items()
+                }
+                for name in credentials
+            },
+            "interactive_reserve": self.interactive_reserve,
+            "interactive_requests": self.interactive_count,
+            "deferred_background_requests": self.deferred_count,
+        }
+
+
+# Shared by everything that talks to GitHub with the configured credentials
+github_rate_limit = RateLimitTracker(
+    float(
+        os.environ.get("GITHUB_INTERACTIVE_RESERVE", str(DEFAULT_INTERACTIVE_RESERVE))
+    )
+)
@@ -6,6 +6,10 @@ import logging
 from typing import Dict, Optional
 
 import requests
+from http_sessions import get_session
+
+from .pagination import iter_pages
+from .rate_limit import github_rate_limit
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +33,30 @@ def get_pr_review_status(
         dict with 'has_approvals' and 'has_changes_requested' booleans on success,
         None if an error occurs.
     """
-    try:
-        url = f"https://api.github.com/repos/{github_org}/{repo_name}/pulls/{pr_number}/reviews"
-        response = requests.get(url, headers=headers)
-        
+    url = f"https://api.github.com/repos/{github_org}/{repo_name}/pulls/{pr_number}/reviews"
+    reviews = []
+
+    def fetch_page(params):
+        github_rate_limit.check()
+        response = get_session(url).get(url, headers=headers, params=params)
+        github_rate_limit.update(response)
         if response.status_code != 200:
-            logger.warning(
-                f"Failed to fetch reviews for {repo_name}#{pr_number}: "
-                f"status {response.status_code}"
-            )
-            return None
-        
-        reviews = response.json()
-        return _analyze_review_states(reviews)
+            return response, None
+        return response, response.json()
+
+    try:
+        # Page through all reviews, not only the default first 30
+        for response, page_reviews in iter_pages(fetch_page):
+            if page_reviews is None:
+                logger.warning(
+                    f"Failed to fetch reviews for {repo_name}#{pr_number}: "
+                    f"status {response.status_code}"
+                )
+                return None
+
+            reviews.extend(page_reviews)
+
+        return analyze_review_states(reviews)
         
     except requests.exceptions.RequestException as e:
         logger.error(
@@ -55,7 +70,7 @@ def get_pr_review_status(
         return None
 
 
-def _analyze_review_states(reviews: list) -> Dict[str, bool]:
+def analyze_review_states(reviews: list) -> Dict[str, bool]:
     """
     Analyze review states to determine approval/changes requested status.
     
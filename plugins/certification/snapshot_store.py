@@ -0,0 +1,61 @@
+"""
+Versioned in-memory snapshots of cache contents
+
+Refreshes build a complete new snapshot and publish it with a single reference
+swap. Readers take the current snapshot without locking and keep a consistent
+view for as long as they hold it, since published snapshots are never mutated.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class VersionedSnapshot(Generic[T]):
+    """Cache contents published by a SnapshotStore"""
+
+    version: int  # increases with every publish, starting at 0
+    published_at: datetime
+    data: T
+
+
+class SnapshotStore(Generic[T]):
+    """Holds the current snapshot of a cache"""
+
+    def __init__(self, initial: T):
+        self._current = VersionedSnapshot(0, datetime.now(), initial)
+        # Only writers lock, to hand out unique versions
+        self._publish_lock = threading.Lock()
+
+    def current(self) -> VersionedSnapshot[T]:
+        """Get the current snapshot"""
+        return self._current
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot"""
+        return self._current.version
+
+    def publish(
+        self, data: T, expected_version: Optional[int] = None
+    ) -> Optional[VersionedSnapshot[T]]:
+        """
+        Publish new contents, which must not be mutated afterwards.
+
+        Args:
+            data: New cache contents
+            expected_version: Only publish if this is still the current version
+
+        Returns:
+            The published snapshot, or None if expected_version was outdated
+        """
+        with self._publish_lock:
+            if expected_version is not None and expected_version != self._current.version:
+                return None
+            snapshot = VersionedSnapshot(self._current.version + 1, datetime.now(), data)
+            self._current = snapshot
+            return snapshot
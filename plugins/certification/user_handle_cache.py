@@ -13,6 +13,23 @@ logger = logging.getLogger(__name__)
 user_cache_by_email: dict[str, UserDetails | None] = {}
 user_cache_by_username: dict[str, str | None] = {}
 
+# Format version of snapshots produced by export_user_cache
+USER_CACHE_SNAPSHOT_VERSION = 1
+
+
+def export_user_cache() -> dict:
+    """Export successful lookups as plain data; failed lookups are retried after a restart."""
+    return {
+        "by_email": {k: v for k, v in user_cache_by_email.items() if v is not None},
+        "by_username": {k: v for k, v in user_cache_by_username.items() if v is not None},
+    }
+
+
+def restore_user_cache(snapshot: dict) -> None:
+    """Restore lookups exported by export_user_cache."""
+    user_cache_by_email.update(snapshot["by_email"])
+    user_cache_by_username.update(snapshot["by_username"])
+
 
 def get_user_handle(email: str) -> UserDetails | None:
     if email in user_cache_by_email:
@@ -0,0 +1,24 @@
+"""
+Mocked GitHub API responses shared by the tests
+"""
+
+import time
+from unittest.mock import MagicMock
+
+
+def make_response(status_code, body=None, headers=None, text=""):
+    mock_response = MagicMock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body
+    mock_response.headers = headers or {}
+    mock_response.text = text
+    return mock_response
+
+
+def rate_limit_headers(remaining, limit=5000, reset_in=3600, resource="core"):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+        "X-RateLimit-Resource": resource,
+    }
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test for readiness states of the PR and Jira caches
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import requests
+from jira.exceptions import JIRAError
+
+from plugins.certification.cache_readiness import (
+    CACHE_FAILED,
+    CACHE_READY,
+    CACHE_RESTORED,
+    CACHE_WARMING,
+    format_load_failed_notice,
+    format_warming_up_notice,
+)
+from plugins.certification.jira_integration import cache as jira_cache
+from plugins.certification.pr_cache import PullRequestCache
+
+
+class TestPRCacheReadiness(unittest.TestCase):
+    """Test cases for PR cache readiness"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+
+    def test_warming_until_first_refresh(self):
+        """Test that a new cache is warming up"""
+        self.assertEqual(self.pr_cache.readiness(), CACHE_WARMING)
+        self.assertEqual(self.pr_cache.get_cache_stats()["readiness"], CACHE_WARMING)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_ready_after_refresh(self, mock_get):
+        """Test that the cache is ready after a successful refresh"""
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = []
+        mock_get.return_value.headers = {}
+
+        self.pr_cache.refresh_cache()
+
+        self.assertEqual(self.pr_cache.readiness(), CACHE_READY)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_failed_until_refresh_succeeds(self, mock_get):
+        """Test that a failed initial load is reported with its error, not as warming"""
+        mock_get.return_value.status_code = 401
+        mock_get.return_value.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError("401 Unauthorized")
+        )
+        mock_get.return_value.headers = {}
+
+        self.assertFalse(self.pr_cache.refresh_cache())
+
+        self.assertEqual(self.pr_cache.readiness(), CACHE_FAILED)
+        self.assertIn("could be fetched", self.pr_cache.last_refresh_error)
+
+        mock_get.return_value = MagicMock(status_code=200, headers={})
+        mock_get.return_value.json.return_value = []
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual(self.pr_cache.readiness(), CACHE_READY)
+        self.assertIsNone(self.pr_cache.get_cache_stats()["last_refresh_error"])
+
+    def test_restored_snapshot(self):
+        """Test that a restored snapshot is reported until the next refresh"""
+        self.pr_cache.restore_snapshot(
+            {
+                "cache": {"repo1": []},
+                "review_status": {},
+                "repo_synced_at": {},
+                "last_updated": datetime.now(),
+                "last_full_refresh": None,
+            },
+            datetime.now(),
+        )
+
+        self.assertEqual(self.pr_cache.readiness(), CACHE_RESTORED)
+
+
+class TestJiraCacheReadiness(unittest.TestCase):
+    """Test cases for Jira cache readiness"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.readiness = jira_cache._jira_cache_readiness
+        jira_cache._jira_cache_readiness = CACHE_WARMING
+
+    def tearDown(self):
+        jira_cache._jira_cache_readiness = self.readiness
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    @patch("plugins.certification.jira_integration.cache.get_jira_client")
+    def test_ready_after_refresh(self, mock_get_client):
+        """Test that the Jira cache is ready after a successful refresh"""
+        client = MagicMock()
+        client.filter.return_value.jql = "project = TEST"
+        client.search_issues.return_value = []
+        mock_get_client.return_value = client
+
+        self.assertEqual(jira_cache.get_jira_cache_readiness(), CACHE_WARMING)
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+        self.assertEqual(jira_cache.get_jira_cache_readiness(), CACHE_READY)
+
+    @patch.dict("plugins.certification.jira_integration.client._filter_jql", clear=True)
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    @patch("plugins.certification.jira_integration.cache.get_jira_client")
+    def test_failed_until_refresh_succeeds(self, mock_get_client):
+        """Test that a failed initial load is reported with its error, not as warming"""
+        client = MagicMock()
+        client.filter.side_effect = JIRAError(status_code=401)
+        mock_get_client.return_value = client
+
+        self.assertFalse(jira_cache.refresh_jira_issues_cache())
+
+        self.assertEqual(jira_cache.get_jira_cache_readiness(), CACHE_FAILED)
+        self.assertEqual(jira_cache.get_jira_cache_error(), "Jira answered HTTP 401")
+
+        client.filter.side_effect = None
+        client.filter.return_value.jql = "project = TEST"
+        client.search_issues.return_value = []
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+
+        self.assertEqual(jira_cache.get_jira_cache_readiness(), CACHE_READY)
+        self.assertIsNone(jira_cache.get_jira_cache_error())
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    def test_restored_snapshot(self):
+        """Test that restoring a snapshot marks the Jira cache as restored"""
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+        self.assertEqual(jira_cache.get_jira_cache_readiness(), CACHE_RESTORED)
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", None)
+    def test_ready_without_filter(self):
+        """Test that the Jira cache is ready when no filter is configured"""
+        self.assertEqual(jira_cache.get_jira_cache_readiness(), CACHE_READY)
+
+
+class TestWarmingUpNotice(unittest.TestCase):
+    """Test cases for the warming up notice"""
+
+    def test_notice(self):
+        """Test the notice shown instead of results"""
+        notice = format_warming_up_notice(["PRs"])
+
+        self.assertIn("PRs are still loading", notice)
+        self.assertIn("try again", notice)
+
+    def test_partial_notice(self):
+        """Test the label prepended to partial results"""
+        notice = format_warming_up_notice(["PRs", "Jira issues"], partial=True)
+
+        self.assertIn("Partial results", notice)
+        self.assertIn("PRs and Jira issues are still loading", notice)
+
+    def test_load_failed_notice(self):
+        """Test the notice shown instead of results when loading failed"""
+        notice = format_load_failed_notice({"PRs": "401 Unauthorized"})
+
+        self.assertIn("PRs could not be loaded (PRs: 401 Unauthorized)", notice)
+        self.assertNotIn("try again in a minute", notice)
+
+
+if __name__ == "__main__":
+    unittest.main()
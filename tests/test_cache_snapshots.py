@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test for persisted cache snapshots used for warm restarts
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from plugins.certification.cache_snapshots import load_snapshot, save_snapshot
+from plugins.certification.jira_integration import cache as jira_cache
+from plugins.certification.pr_cache import SNAPSHOT_VERSION, PullRequestCache
+
+
+class TestSnapshotStorage(unittest.TestCase):
+    """Test cases for saving and loading versioned snapshots"""
+
+    def test_round_trip(self):
+        """Test that a saved snapshot loads with its save time"""
+        storage = {}
+        save_snapshot(storage, "pr_cache", 1, {"cache": {}})
+
+        saved_at, data = load_snapshot(storage, "pr_cache", 1)
+
+        self.assertEqual(data, {"cache": {}})
+        self.assertLessEqual(saved_at, datetime.now())
+
+    def test_other_version_is_ignored(self):
+        """Test that snapshots of another format version are not loaded"""
+        storage = {}
+        save_snapshot(storage, "pr_cache", 1, {"cache": {}})
+
+        self.assertIsNone(load_snapshot(storage, "pr_cache", 2))
+
+    def test_missing_snapshot(self):
+        """Test that loading without a saved snapshot returns None"""
+        self.assertIsNone(load_snapshot({}, "pr_cache", 1))
+
+
+class TestPRCacheSnapshot(unittest.TestCase):
+    """Test cases for exporting and restoring the PR cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr = {
+            "number": 1,
+            "title": "PR 1",
+            "draft": False,
+            "user": {"login": "author1"},
+            "requested_reviewers": [{"login": "reviewer1"}],
+            "assignees": [],
+        }
+        self.source = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+        self.source.cache = {"repo1": [self.pr]}
+        self.source.review_status = {
+            ("repo1", 1): (":", {"has_approvals": False, "has_changes_requested": False})
+        }
+        self.source.last_updated = datetime.now() - timedelta(hours=3)
+
+    def _restored_cache(self):
+        storage = {}
+        save_snapshot(storage, "pr_cache", SNAPSHOT_VERSION, self.source.export_snapshot())
+        saved_at, data = load_snapshot(storage, "pr_cache", SNAPSHOT_VERSION)
+
+        restored = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+        restored.restore_snapshot(data, saved_at - timedelta(minutes=10))
+        return restored
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_restored_cache_is_served_without_refresh(self, mock_get):
+        """Test that restored stale data is served instead of refreshing inline"""
+        restored = self._restored_cache()
+
+        prs = restored.get_prs_for_user("reviewer1")
+
+        mock_get.assert_not_called()
+        self.assertEqual(len(prs["assigned"]), 1)
+        self.assertTrue(restored.get_cache_stats()["cache_expired"])
+
+    def test_snapshot_age_in_stats(self):
+        """Test that the age of the restored snapshot is reported"""
+        restored = self._restored_cache()
+
+        age = restored.get_cache_stats()["snapshot_age_seconds"]
+
+        self.assertGreaterEqual(age, 600)
+        self.assertIsNone(self.source.get_cache_stats()["snapshot_age_seconds"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_clears_snapshot_age(self, mock_get):
+        """Test that a successful refresh replaces the restored data"""
+        restored = self._restored_cache()
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = []
+        mock_get.return_value.headers = {}
+
+        self.assertTrue(restored.refresh_cache())
+
+        self.assertIsNone(restored.get_cache_stats()["snapshot_age_seconds"])
+        self.assertEqual(restored.cache, {"repo1": []})
+
+
+class TestJiraCacheSnapshot(unittest.TestCase):
+    """Test cases for exporting and restoring the Jira issues cache"""
+
+    def tearDown(self):
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+    def test_round_trip(self):
+        """Test that restoring publishes the exported contents as a new snapshot"""
+        jira_cache.restore_jira_snapshot(
+            {
+                "issues": {"user@example.com": [{"key": "PROJ-1"}]},
+                "account_to_email": {"account-1": "user@example.com"},
+            }
+        )
+        snapshot = jira_cache.export_jira_snapshot()
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+        version = jira_cache.get_jira_snapshot().version
+
+        jira_cache.restore_jira_snapshot(snapshot)
+
+        current = jira_cache.get_jira_snapshot()
+        self.assertEqual(current.version, version + 1)
+        self.assertEqual(
+            dict(current.data.issues), {"user@example.com": ({"key": "PROJ-1"},)}
+        )
+        self.assertEqual(
+            dict(current.data.account_to_email), {"account-1": "user@example.com"}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,6 +26,13 @@ class TestCertificationBotCommands(unittest.TestCase):
         self.plugin.pr_cache = MagicMock()
         self.msg = MagicMock()
         self.msg.frm.username = "testuser"
+        # Treat the Jira cache as loaded unless a test says otherwise
+        jira_readiness = patch(
+            "plugins.certification.certification.get_jira_cache_readiness",
+            return_value="ready",
+        )
+        self.mock_jira_readiness = jira_readiness.start()
+        self.addCleanup(jira_readiness.stop)
 
     @patch("plugins.certification.certification.reply_with_artefacts_summary")
     def test_artefacts_command(self, mock_reply):
@@ -111,6 +118,40 @@ class TestCertificationBotCommands(unittest.TestCase):
         self.assertIn("XPS", result)
         self.assertIn("Manual", result)
 
+    @patch.object(CertificationPlugin, "_get_github_username_for_user")
+    def test_prs_command_warming_up(self, mock_get_github):
+        """Test !prs command while the PR cache is still loading"""
+        mock_get_github.return_value = "github_user"
+        self.plugin.pr_cache.readiness.return_value = "warming"
+
+        result = self.plugin.prs(self.msg, [])
+
+        self.assertIn("PRs are still loading", result)
+        self.plugin.pr_cache.get_prs_for_user.assert_not_called()
+
+    @patch.object(CertificationPlugin, "_get_github_username_for_user")
+    def test_prs_command_load_failed(self, mock_get_github):
+        """Test !prs command when the PR cache could not be loaded"""
+        mock_get_github.return_value = "github_user"
+        self.plugin.pr_cache.readiness.return_value = "failed"
+        self.plugin.pr_cache.last_refresh_error = "401 Unauthorized"
+
+        result = self.plugin.prs(self.msg, [])
+
+        self.assertIn("PRs could not be loaded (PRs: 401 Unauthorized)", result)
+        self.assertNotIn("still loading", result)
+        self.plugin.pr_cache.get_prs_for_user.assert_not_called()
+
+    @patch("plugins.certification.certification.get_jira_issues_for_mattermost_handle")
+    def test_jira_command_warming_up(self, mock_get_issues):
+        """Test !jira command while the Jira cache is still loading"""
+        self.mock_jira_readiness.return_value = "warming"
+
+        result = self.plugin.jira(self.msg, [])
+
+        self.assertIn("Jira issues are still loading", result)
+        mock_get_issues.assert_not_called()
+
     @patch("plugins.certification.certification.get_jira_issues_for_mattermost_handle")
     def test_jira_command_no_issues(self, mock_get_issues):
         """Test !jira command with no issues"""
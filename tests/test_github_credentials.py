@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test for spreading GitHub requests over a pool of credentials
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import jwt
+import requests
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import (
+    AppInstallationCredential,
+    CredentialPool,
+    GitHubCredential,
+    RateLimitBackoff,
+    RateLimitTracker,
+    TokenCredential,
+    github_credentials_from_env,
+)
+from tests.github_responses import make_response, rate_limit_headers
+
+
+def _expires_in(minutes):
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+    return expires_at.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class TestCredentialPool(unittest.TestCase):
+    """Test cases for CredentialPool"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = RateLimitTracker()
+        self.first = TokenCredential("ghp_first")
+        self.second = TokenCredential("ghp_second")
+        self.pool = CredentialPool([self.first, self.second], self.tracker)
+
+    def test_credential_with_most_budget_is_used(self):
+        """Test that requests go to the credential with the most budget left"""
+        self.tracker.update(
+            make_response(200, headers=rate_limit_headers(1000)), self.first.name
+        )
+        self.tracker.update(
+            make_response(200, headers=rate_limit_headers(3000)), self.second.name
+        )
+
+        self.assertIs(self.pool.acquire(), self.second)
+        self.assertEqual(self.tracker.remaining_by_resource()["core"]["remaining"], 4000)
+
+    def test_credential_backing_off_is_skipped(self):
+        """Test that a credential backing off from a rate limit is not used"""
+        self.tracker.update(
+            make_response(429, headers={"Retry-After": "60"}), self.second.name
+        )
+
+        self.assertIs(self.pool.acquire(), self.first)
+        self.assertEqual(self.tracker.backoff_remaining(), 0)
+
+    def test_all_credentials_backing_off(self):
+        """Test that requests are refused while every credential backs off"""
+        for credential in (self.first, self.second):
+            self.tracker.update(
+                make_response(429, headers={"Retry-After": "60"}), credential.name
+            )
+
+        with self.assertRaises(RateLimitBackoff):
+            self.pool.acquire()
+
+    @patch("plugins.certification.pr_cache_utils.credentials.requests.Session.post")
+    def test_credential_failing_to_renew_is_skipped(self, mock_post):
+        """Test that requests fall through to the next credential while one cannot renew"""
+        failed = make_response(502)
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError("502")
+        mock_post.return_value = failed
+        app = AppInstallationCredential("123", "private-key", "456")
+        patcher = patch.object(app, "_app_jwt", return_value="app-jwt")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        pool = CredentialPool([self.first, app], self.tracker)
+        self.tracker.update(
+            make_response(200, headers=rate_limit_headers(1000)), self.first.name
+        )
+
+        for _ in range(5):
+            self.assertIs(pool.acquire(), self.first)
+
+        # Renewal is not retried while the app credential backs off
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertGreater(self.tracker.backoff_remaining(app.name), 0)
+
+    def test_token_is_not_part_of_name(self):
+        """Test that credential names do not reveal their token"""
+        self.assertNotIn("ghp_first", self.first.name)
+        self.assertNotEqual(self.first.name, self.second.name)
+
+    def test_credential_must_provide_token(self):
+        """Test that credentials without a token cannot be created"""
+        with self.assertRaises(TypeError):
+            GitHubCredential("incomplete")
+
+    @patch.dict(os.environ, {"GITHUB_TOKENS": "ghp_second, ghp_first,", "GITHUB_APP_ID": ""})
+    def test_tokens_from_env(self):
+        """Test that additional tokens are added once each after the primary one"""
+        credentials = github_credentials_from_env("ghp_first")
+
+        self.assertEqual(
+            [credential.token() for credential in credentials], ["ghp_first", "ghp_second"]
+        )
+
+
+class TestAppInstallationCredential(unittest.TestCase):
+    """Test cases for GitHub App installation tokens"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.credential = AppInstallationCredential("123", "private-key", "456")
+        patcher = patch.object(self.credential, "_app_jwt", return_value="app-jwt")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "plugins.certification.pr_cache_utils.credentials.requests.Session.post"
+        )
+        self.mock_post = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_token_is_minted_and_reused(self):
+        """Test that an installation token is minted once and reused while valid"""
+        self.mock_post.return_value = make_response(
+            201, {"token": "installation-1", "expires_at": _expires_in(60)}
+        )
+
+        self.assertEqual(self.credential.token(), "installation-1")
+        self.assertEqual(self.credential.token(), "installation-1")
+
+        self.assertEqual(self.mock_post.call_count, 1)
+        url = self.mock_post.call_args.args[0]
+        self.assertTrue(url.endswith("/app/installations/456/access_tokens"))
+        self.assertEqual(
+            self.mock_post.call_args.kwargs["headers"]["Authorization"], "Bearer app-jwt"
+        )
+
+    def test_token_is_renewed_before_expiry(self):
+        """Test that a token about to expire is replaced by a new one"""
+        self.mock_post.side_effect = [
+            make_response(201, {"token": "installation-1", "expires_at": _expires_in(2)}),
+            make_response(201, {"token": "installation-2", "expires_at": _expires_in(60)}),
+        ]
+
+        self.assertEqual(self.credential.token(), "installation-1")
+        self.assertEqual(self.credential.token(), "installation-2")
+
+    def test_failed_renewal_keeps_valid_token(self):
+        """Test that the current token is used while renewing it fails"""
+        failed = make_response(502)
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError("502")
+        self.mock_post.side_effect = [
+            make_response(201, {"token": "installation-1", "expires_at": _expires_in(2)}),
+            failed,
+        ]
+
+        self.assertEqual(self.credential.token(), "installation-1")
+        self.assertEqual(self.credential.token(), "installation-1")
+
+    def test_app_jwt_is_signed_with_private_key(self):
+        """Test that the app JWT is signed with RS256 and names the app as issuer"""
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode()
+
+        token = AppInstallationCredential("123", pem, "456")._app_jwt()
+
+        claims = jwt.decode(token, private_key.public_key(), algorithms=["RS256"])
+        self.assertEqual(claims["iss"], "123")
+        self.assertLessEqual(claims["exp"] - claims["iat"], 10 * 60)
+
+
+class TestPRCacheCredentials(unittest.TestCase):
+    """Test cases for PR cache requests spread over credentials"""
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_spreads_requests_by_budget(self, mock_get):
+        """Test that refresh requests go to the credential with the most budget"""
+        tracker = RateLimitTracker()
+        credentials = CredentialPool(
+            [TokenCredential("ghp_first"), TokenCredential("ghp_second")], tracker
+        )
+        pr_cache = PullRequestCache(
+            repo_filter=["repo1", "repo2", "repo3"],
+            github_org="test-org",
+            fetch_workers=1,
+            credentials=credentials,
+        )
+        remaining = {"token ghp_first": 3000, "token ghp_second": 4000}
+
+        def side_effect(url, headers=None, **kwargs):
+            authorization = headers["Authorization"]
+            remaining[authorization] -= 1
+            return make_response(
+                200, [], rate_limit_headers(remaining[authorization])
+            )
+
+        mock_get.side_effect = side_effect
+
+        self.assertTrue(pr_cache.refresh_cache())
+
+        used = [call.kwargs["headers"]["Authorization"] for call in mock_get.call_args_list]
+        self.assertEqual(used, ["token ghp_first", "token ghp_second", "token ghp_second"])
+        self.assertIs(pr_cache.rate_limit, tracker)
+
+
+if __name__ == "__main__":
+    unittest.main()
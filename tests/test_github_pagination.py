@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test for Link header pagination of GitHub list endpoints
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import iter_pages, parse_link_header
+from tests.github_responses import make_response
+
+URL = "https://api.github.com/repos/test-org/repo1/pulls"
+
+
+def _links(page, last_page):
+    links = []
+    if page < last_page:
+        links.append(f'<{URL}?page={page + 1}>; rel="next"')
+        links.append(f'<{URL}?page={last_page}>; rel="last"')
+    if page > 1:
+        links.append(f'<{URL}?page=1>; rel="first"')
+    return ", ".join(links)
+
+
+def _paged_fetcher(last_page, requested):
+    def fetch_page(params):
+        page = params["page"]
+        requested.append(page)
+        headers = {"Link": _links(page, last_page)} if last_page > 1 else {}
+        return make_response(200, [f"item-{page}"], headers), [f"item-{page}"]
+
+    return fetch_page
+
+
+class TestParseLinkHeader(unittest.TestCase):
+    """Test cases for parse_link_header"""
+
+    def test_parses_relations(self):
+        """Test that every relation of the header is returned"""
+        links = parse_link_header(_links(2, 5))
+
+        self.assertEqual(links["next"], f"{URL}?page=3")
+        self.assertEqual(links["last"], f"{URL}?page=5")
+        self.assertEqual(links["first"], f"{URL}?page=1")
+
+    def test_missing_header(self):
+        """Test that a missing header has no relations"""
+        self.assertEqual(parse_link_header(None), {})
+
+
+class TestIterPages(unittest.TestCase):
+    """Test cases for iter_pages"""
+
+    def test_single_page_needs_one_request(self):
+        """Test that a result without Link header is not followed by an empty page"""
+        requested = []
+
+        pages = list(iter_pages(_paged_fetcher(1, requested)))
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(requested, [1])
+
+    def test_follows_next_links(self):
+        """Test that pages are requested until no rel="next" link is left"""
+        requested = []
+
+        data = [page for _, page in iter_pages(_paged_fetcher(3, requested))]
+
+        self.assertEqual(data, [["item-1"], ["item-2"], ["item-3"]])
+        self.assertEqual(requested, [1, 2, 3])
+
+    def test_concurrent_pages_keep_order(self):
+        """Test that pages fetched concurrently are yielded in page order"""
+        requested = []
+
+        data = [
+            page
+            for _, page in iter_pages(_paged_fetcher(6, requested), max_workers=4)
+        ]
+
+        self.assertEqual(data, [[f"item-{page}"] for page in range(1, 7)])
+        self.assertEqual(sorted(requested), [1, 2, 3, 4, 5, 6])
+
+    def test_caller_can_stop_early(self):
+        """Test that no further pages are requested once the caller stops"""
+        requested = []
+
+        for _, page in iter_pages(_paged_fetcher(5, requested)):
+            break
+
+        self.assertEqual(requested, [1])
+
+    def test_stops_after_failed_page(self):
+        """Test that an unsuccessful response ends the iteration"""
+        pages = list(
+            iter_pages(lambda params: (make_response(500, headers={}), None))
+        )
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0][0].status_code, 500)
+
+
+class TestPRCachePagination(unittest.TestCase):
+    """Test cases for paginated list calls of the PR cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_without_empty_page_requests(self, mock_get):
+        """Test that a repository with one page of PRs costs one request"""
+        mock_get.return_value = make_response(
+            200,
+            [{"number": 1, "title": "PR 1", "user": {"login": "author1"}}],
+        )
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
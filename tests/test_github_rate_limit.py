@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test for GitHub rate limit tracking and the adaptive PR refresh interval
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import RateLimitBackoff, RateLimitTracker
+from tests.github_responses import make_response, rate_limit_headers
+
+
+class TestRateLimitTracker(unittest.TestCase):
+    """Test cases for RateLimitTracker"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = RateLimitTracker()
+
+    def test_records_budget_per_resource(self):
+        """Test that rate limit headers are recorded per resource"""
+        self.tracker.update(make_response(200, headers=rate_limit_headers(4000)))
+        self.tracker.update(
+            make_response(200, headers=rate_limit_headers(10, limit=30, resource="search"))
+        )
+
+        resources = self.tracker.remaining_by_resource()
+
+        self.assertEqual(resources["core"]["remaining"], 4000)
+        self.assertEqual(resources["search"]["limit"], 30)
+
+    def test_retry_after_backs_off_with_jitter(self):
+        """Test that Retry-After starts a backoff of at least the given delay"""
+        self.tracker.update(make_response(403, headers={"Retry-After": "60"}))
+
+        backoff = self.tracker.backoff_remaining()
+
+        self.assertGreater(backoff, 59)
+        self.assertLessEqual(backoff, 90)
+        with self.assertRaises(RateLimitBackoff):
+            self.tracker.check()
+
+    def test_secondary_limit_without_retry_after_grows(self):
+        """Test that repeated secondary limits back off exponentially"""
+        response = make_response(403, text="You have exceeded a secondary rate limit")
+
+        self.tracker.update(response)
+        first = self.tracker.backoff_remaining()
+        self.tracker.update(response)
+        second = self.tracker.backoff_remaining()
+
+        self.assertGreaterEqual(first, 60)
+        self.assertGreaterEqual(second, 120)
+
+    def test_permission_error_does_not_back_off(self):
+        """Test that a 403 unrelated to rate limits does not start a backoff"""
+        self.tracker.update(make_response(403, text="Resource not accessible"))
+
+        self.assertEqual(self.tracker.backoff_remaining(), 0)
+
+    def test_interval_shrinks_with_ample_budget(self):
+        """Test that a large budget yields the minimum interval"""
+        self.tracker.update(make_response(200, headers=rate_limit_headers(5000)))
+
+        interval = self.tracker.suggest_interval(300, 120, 1800, {"core": 50})
+
+        self.assertEqual(interval, 120)
+
+    def test_interval_stretches_with_low_budget(self):
+        """Test that a low budget stretches the interval"""
+        self.tracker.update(make_response(200, headers=rate_limit_headers(1000)))
+
+        interval = self.tracker.suggest_interval(300, 120, 1800, {"core": 200})
+
+        # 500 usable requests over an hour allow 2.5 refreshes
+        self.assertAlmostEqual(interval, 1440, delta=5)
+
+    def test_interval_without_budget_information(self):
+        """Test that the base interval is used until the budget is known"""
+        self.assertEqual(self.tracker.suggest_interval(300, 120, 1800, {}), 300)
+
+
+class TestPRCacheRateLimit(unittest.TestCase):
+    """Test cases for rate limit handling in PullRequestCache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = RateLimitTracker()
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_token="test-token",
+            github_org="test-org",
+            rate_limit=self.tracker,
+        )
+        self.credential = self.pr_cache.credentials.names()[0]
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_records_cost_and_budget(self, mock_get):
+        """Test that a refresh reports the budget it used and what is left"""
+        remaining = iter([4999, 4998])
+        mock_get.side_effect = lambda url, **kwargs: make_response(
+            200, [], rate_limit_headers(next(remaining), reset_in=1800)
+        )
+        self.tracker.update(
+            make_response(200, headers=rate_limit_headers(5000, reset_in=1800)),
+            self.credential,
+        )
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        stats = self.pr_cache.get_cache_stats()
+        self.assertEqual(stats["last_refresh_cost"], {"core": 1})
+        self.assertEqual(stats["rate_limit"]["resources"]["core"]["remaining"], 4999)
+        self.assertIsNone(stats["rate_limit"]["backoff_until"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_skipped_while_backing_off(self, mock_get):
+        """Test that no refresh runs while backing off from a rate limit"""
+        self.tracker.update(
+            make_response(429, headers={"Retry-After": "120"}), self.credential
+        )
+
+        self.assertFalse(self.pr_cache.refresh_cache())
+        mock_get.assert_not_called()
+        self.assertGreaterEqual(self.pr_cache.next_refresh_interval(), 120)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_secondary_limit_stops_remaining_requests(self, mock_get):
+        """Test that requests stop once GitHub answers with a secondary limit"""
+        self.pr_cache.repo_filter = ["repo1", "repo2"]
+        self.pr_cache.fetch_workers = 1
+        mock_get.return_value = make_response(403, headers={"Retry-After": "30"})
+
+        self.pr_cache.refresh_cache()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertGreater(self.tracker.backoff_remaining(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test for reserving part of the GitHub rate limit budget for interactive requests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import BudgetReserved, RateLimitTracker
+from tests.github_responses import make_response, rate_limit_headers
+
+
+def _pr(number):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "user": {"login": "author1"},
+        "requested_reviewers": [{"login": "reviewer1"}],
+        "assignees": [],
+    }
+
+
+class TestInteractiveReserve(unittest.TestCase):
+    """Test cases for the interactive reserve of RateLimitTracker"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = RateLimitTracker(interactive_reserve=0.1)
+        self.tracker.update(make_response(200, headers=rate_limit_headers(400)))
+
+    def test_background_request_refused_within_reserve(self):
+        """Test that background requests are refused once only the reserve is left"""
+        with self.assertRaises(BudgetReserved):
+            self.tracker.check()
+
+        self.assertGreater(self.tracker.reserve_remaining(), 3500)
+        self.assertEqual(self.tracker.stats()["deferred_background_requests"], 1)
+
+    def test_interactive_request_uses_reserve(self):
+        """Test that interactive requests may use the reserved budget"""
+        with self.tracker.interactive():
+            self.tracker.check()
+
+        self.assertEqual(self.tracker.stats()["interactive_requests"], 1)
+
+    def test_reserve_is_per_resource(self):
+        """Test that a low budget of one resource does not hold back another"""
+        self.tracker.check("search")
+        self.tracker.check("graphql")
+
+    def test_priority_is_per_thread(self):
+        """Test that only the thread marked interactive sends interactive requests"""
+        priorities = []
+
+        with self.tracker.interactive():
+            worker = threading.Thread(
+                target=lambda: priorities.append(self.tracker.priority())
+            )
+            worker.start()
+            worker.join()
+            priorities.append(self.tracker.priority())
+        priorities.append(self.tracker.priority())
+
+        self.assertEqual(priorities, ["background", "interactive", "background"])
+
+
+class TestPRCacheRequestBudget(unittest.TestCase):
+    """Test cases for PR cache requests within the interactive reserve"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = RateLimitTracker(interactive_reserve=0.1)
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_token="test-token",
+            github_org="test-org",
+            rate_limit=self.tracker,
+        )
+        self.tracker.update(
+            make_response(200, headers=rate_limit_headers(100)),
+            self.pr_cache.credentials.names()[0],
+        )
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_deferred_within_reserve(self, mock_get):
+        """Test that the refresh is deferred while only the reserve is left"""
+        self.pr_cache.cache = {"repo1": [_pr(1)]}
+
+        self.assertFalse(self.pr_cache.refresh_cache())
+
+        mock_get.assert_not_called()
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_user_lookup_fetches_review_status_within_reserve(self, mock_get):
+        """Test that review status a user is waiting for is fetched from the reserve"""
+        mock_get.return_value = make_response(
+            200, [{"state": "APPROVED", "user": {"login": "reviewer1"}}]
+        )
+        self.pr_cache.cache = {"repo1": [_pr(1)]}
+        self.pr_cache.last_updated = datetime.now()
+
+        result = self.pr_cache.get_prs_for_user("author1")
+
+        self.assertEqual(len(result["authored_approved"]), 1)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_team_pages_fetched_within_reserve(self, mock_get):
+        """Test that page workers fetch the pages of a waiting user's team from the reserve"""
+        url = "https://api.github.com/orgs/test-org/teams/large-team/members"
+        link = f'<{url}?page=2>; rel="next", <{url}?page=3>; rel="last"'
+        threads = set()
+
+        def side_effect(url, **kwargs):
+            threads.add(threading.current_thread().name)
+            page = kwargs["params"]["page"]
+            members = [{"login": f"user{page}-{i}"} for i in range(100)]
+            return make_response(200, members, {"Link": link} if page == 1 else {})
+
+        mock_get.side_effect = side_effect
+
+        with self.tracker.interactive():
+            members = self.pr_cache.get_team_members("large-team")
+
+        self.assertEqual(len(members), 300)
+        self.assertTrue(any(name.startswith("github-pages") for name in threads))
+        self.assertEqual(self.tracker.stats()["interactive_requests"], 3)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_team_members_for_background_jobs_deferred_within_reserve(self, mock_get):
+        """Test that background jobs looking up a team do not use the reserve"""
+        self.assertEqual(self.pr_cache.get_team_members("large-team"), [])
+
+        mock_get.assert_not_called()
+        self.assertEqual(self.tracker.stats()["interactive_requests"], 0)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_retry_deferred_within_reserve(self, mock_get):
+        """Test that failed repositories are not retried from the reserve"""
+        self.pr_cache.repo_retry["repo1"] = (1, datetime.now() - timedelta(seconds=1))
+
+        self.assertFalse(self.pr_cache.retry_failed_repositories())
+        mock_get.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
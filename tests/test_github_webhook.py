@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Test for applying GitHub webhook deliveries to the PR cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+import hmac
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from plugins.certification.github_webhook import handle_github_webhook, verify_signature
+from plugins.certification.pr_cache import PullRequestCache
+
+SECRET = "webhook-secret"
+
+
+def _pr(number, updated_at, state="open", reviewers=(), head_sha="abc"):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "html_url": f"https://github.com/test-org/repo1/pull/{number}",
+        "state": state,
+        "draft": False,
+        "updated_at": updated_at,
+        "user": {"login": "author1"},
+        "requested_reviewers": [{"login": login} for login in reviewers],
+        "requested_teams": [],
+        "assignees": [],
+        "head": {"sha": head_sha},
+    }
+
+
+def _payload(action, pr, repo="repo1", org="test-org", review_state=None):
+    # Trimmed down from recorded deliveries, keeping the fields the cache reads
+    payload = {
+        "action": action,
+        "pull_request": pr,
+        "repository": {"name": repo, "owner": {"login": org}},
+        "sender": {"login": "someone"},
+    }
+    if review_state:
+        payload["review"] = {"state": review_state, "user": {"login": "reviewer1"}}
+    return payload
+
+
+def _delivery(event, payload, secret=SECRET):
+    body = json.dumps(payload).encode()
+    signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    headers = {
+        "X-GitHub-Event": event,
+        "X-GitHub-Delivery": "72d3162e-cc78-11e3-81ab-4c9367dc0958",
+        "X-Hub-Signature-256": f"sha256={signature}",
+    }
+    return headers, body
+
+
+class TestVerifySignature(unittest.TestCase):
+    """Test cases for webhook signature verification"""
+
+    def test_valid_signature(self):
+        """Test that a body signed with the secret is accepted"""
+        headers, body = _delivery("ping", {})
+
+        self.assertTrue(verify_signature(SECRET, body, headers["X-Hub-Signature-256"]))
+
+    def test_invalid_signatures(self):
+        """Test that wrong, missing and legacy SHA-1 signatures are rejected"""
+        headers, body = _delivery("ping", {}, secret="other-secret")
+
+        self.assertFalse(verify_signature(SECRET, body, headers["X-Hub-Signature-256"]))
+        self.assertFalse(verify_signature(SECRET, body, None))
+        self.assertFalse(verify_signature(SECRET, body, "sha1=0123"))
+
+
+class TestGitHubWebhook(unittest.TestCase):
+    """Test cases for replaying webhook deliveries against the PR cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_token="test-token",
+            github_org="test-org",
+            webhooks=True,
+        )
+        self.pr_cache.cache = {"repo1": [_pr(1, "2024-01-01T00:00:00Z")]}
+        self.pr_cache.last_updated = datetime.now()
+
+    def _replay(self, event, payload, secret=SECRET):
+        headers, body = _delivery(event, payload)
+        return handle_github_webhook(self.pr_cache, secret, headers, body)
+
+    def test_rejects_invalid_signature(self):
+        """Test that deliveries with a wrong signature do not touch the cache"""
+        headers, body = _delivery(
+            "pull_request",
+            _payload("opened", _pr(2, "2024-01-02T00:00:00Z")),
+            secret="other-secret",
+        )
+
+        _, status = handle_github_webhook(self.pr_cache, SECRET, headers, body)
+
+        self.assertEqual(status, 401)
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)
+
+    def test_disabled_without_secret(self):
+        """Test that the endpoint is disabled when no secret is configured"""
+        _, status = self._replay("ping", {}, secret=None)
+
+        self.assertEqual(status, 404)
+
+    def test_opened_pr_is_inserted(self):
+        """Test that an opened PR shows up for its author"""
+        _, status = self._replay(
+            "pull_request", _payload("opened", _pr(2, "2024-01-02T00:00:00Z"))
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual([pr.number for pr in self.pr_cache.cache["repo1"]], [2, 1])
+        user_prs = self.pr_cache.get_prs_for_user("author1")
+        self.assertEqual(len(user_prs["authored_unassigned"]), 2)
+        self.assertEqual(self.pr_cache.get_cache_stats()["webhook_events"], 1)
+
+    def test_closed_pr_is_removed(self):
+        """Test that a closed PR is dropped from the cache"""
+        self._replay(
+            "pull_request",
+            _payload("closed", _pr(1, "2024-01-02T00:00:00Z", state="closed")),
+        )
+
+        self.assertEqual(self.pr_cache.cache["repo1"], [])
+
+    def test_outdated_event_is_ignored(self):
+        """Test that a delivery older than the cached PR is not applied"""
+        message, _ = self._replay(
+            "pull_request",
+            _payload("closed", _pr(1, "2023-12-31T00:00:00Z", state="closed")),
+        )
+
+        self.assertIn("Ignored", message)
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)
+
+    def test_other_repositories_are_ignored(self):
+        """Test that events for uncached repositories or other orgs are ignored"""
+        self._replay(
+            "pull_request",
+            _payload("opened", _pr(2, "2024-01-02T00:00:00Z"), repo="repo2"),
+        )
+        self._replay(
+            "pull_request",
+            _payload("opened", _pr(3, "2024-01-02T00:00:00Z"), org="other-org"),
+        )
+
+        self.assertEqual(list(self.pr_cache.cache), ["repo1"])
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)
+
+    @patch("plugins.certification.pr_cache.PullRequestCache._get_pr_review_status")
+    def test_review_updates_review_status(self, mock_review_status):
+        """Test that a submitted review moves the PR to the matching category"""
+        mock_review_status.return_value = {
+            "has_approvals": True,
+            "has_changes_requested": False,
+        }
+        pr = _pr(1, "2024-01-01T00:00:00Z", reviewers=("reviewer1",))
+
+        self._replay("pull_request_review", _payload("submitted", pr, review_state="approved"))
+
+        mock_review_status.assert_called_once_with("repo1", 1)
+        user_prs = self.pr_cache.get_prs_for_user("author1")
+        self.assertEqual(len(user_prs["authored_approved"]), 1)
+        self.assertEqual(len(user_prs["assigned"]), 0)
+        self.assertEqual(len(self.pr_cache.get_prs_for_user("reviewer1")["assigned"]), 1)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_event_updates_only_concerned_index_entries(self, mock_get):
+        """Test that an event re-categorizes its PR for the users it concerns only"""
+        self.pr_cache.cache = {
+            "repo1": [
+                _pr(1, "2024-01-01T00:00:00Z"),
+                _pr(3, "2024-01-01T00:00:00Z", reviewers=("reviewer2",)),
+            ]
+        }
+        self.pr_cache.review_status = {
+            ("repo1", 3): ("abc:2024-01-01T00:00:00Z", {"has_approvals": False})
+        }
+        self.pr_cache.get_prs_for_user("author1")
+        before = self.pr_cache._snapshot.user_index
+
+        pr = _pr(2, "2024-01-02T00:00:00Z", reviewers=("reviewer1",))
+        pr["user"] = {"login": "author2"}
+        self._replay("pull_request", _payload("opened", pr))
+        pr = _pr(1, "2024-01-02T00:00:00Z", state="closed")
+        self._replay("pull_request", _payload("closed", pr))
+
+        # The new PR's review status is fetched once; failing, it is not fetched
+        # again while indexing
+        self.assertEqual(mock_get.call_count, 1)
+        index = self.pr_cache._snapshot.user_index
+        self.assertIs(index["reviewer2"], before["reviewer2"])
+        self.assertEqual(
+            index,
+            self.pr_cache._build_user_index(
+                self.pr_cache.cache, self.pr_cache.review_status
+            ),
+        )
+
+    @patch("plugins.certification.pr_cache.PullRequestCache._get_pr_review_status")
+    def test_review_status_fetched_outside_update_lock(self, mock_review_status):
+        """Test that a concurrent update neither waits for nor loses to the review fetch"""
+        def review_status(repo_name, number):
+            self.assertFalse(self.pr_cache._update_lock.locked())
+            # Another delivery is published while the review status is fetched
+            self.pr_cache.apply_webhook_event(
+                "pull_request", _payload("opened", _pr(2, "2024-01-02T00:00:00Z"))
+            )
+            return {"has_approvals": True, "has_changes_requested": False}
+
+        mock_review_status.side_effect = review_status
+        pr = _pr(1, "2024-01-01T00:00:00Z", reviewers=("reviewer1",))
+
+        self._replay("pull_request_review", _payload("submitted", pr, review_state="approved"))
+
+        self.assertEqual([pr.number for pr in self.pr_cache.cache["repo1"]], [2, 1])
+        user_prs = self.pr_cache.get_prs_for_user("author1")
+        self.assertEqual(len(user_prs["authored_approved"]), 1)
+        self.assertEqual(self.pr_cache.get_cache_stats()["webhook_events"], 2)
+
+    @patch("plugins.certification.pr_cache.PullRequestCache._collect_review_status")
+    @patch("plugins.certification.pr_cache.PullRequestCache._fetch_prs_rest")
+    def test_events_during_refresh_survive_it(self, mock_fetch, mock_review_status):
+        """Test that a refresh does not publish PR states older than applied events"""
+        fetched = list(self.pr_cache.cache["repo1"])
+
+        def fetch_prs(repo_names, executor, full_refresh):
+            # PR 1 is closed after the refresh fetched it
+            self._replay(
+                "pull_request",
+                _payload("closed", _pr(1, "2024-01-02T00:00:00Z", state="closed")),
+            )
+            return {"repo1": fetched}
+
+        mock_fetch.side_effect = fetch_prs
+        mock_review_status.return_value = {}
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual(self.pr_cache.cache["repo1"], [])
+        self.assertEqual(self.pr_cache.get_prs_for_user("author1")["authored_unassigned"], [])
+
+    def test_refresh_interval_reconciles_with_webhooks(self):
+        """Test that polling slows down to reconciliation with webhooks enabled"""
+        self.assertEqual(
+            self.pr_cache.next_refresh_interval(), self.pr_cache.reconcile_minutes * 60
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
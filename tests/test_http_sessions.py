@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test for the shared per-host HTTP sessions
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+
+from plugins.certification.http_sessions import close_sessions, get_session
+
+
+class TestHTTPSessions(unittest.TestCase):
+    """Test cases for get_session"""
+
+    def tearDown(self):
+        close_sessions()
+
+    def test_same_host_shares_session(self):
+        """Test that URLs on the same host share one session"""
+        first = get_session("https://api.github.com/repos/org/repo/pulls")
+        second = get_session("https://api.github.com/graphql")
+
+        self.assertIs(first, second)
+
+    def test_hosts_get_separate_sessions(self):
+        """Test that different hosts get different sessions"""
+        github = get_session("https://api.github.com/graphql")
+        mattermost = get_session("https://chat.example.com/api/v4/users")
+
+        self.assertIsNot(github, mattermost)
+
+    @patch.dict(os.environ, {"HTTP_POOL_MAXSIZE": "32"})
+    def test_pool_size_from_environment(self):
+        """Test that the connection pool size can be configured"""
+        session = get_session("https://api.github.com/graphql")
+
+        adapter = session.get_adapter("https://api.github.com/graphql")
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_pool_grown_for_concurrent_callers(self):
+        """Test that a caller needing more connections grows the pool of the host"""
+        first = get_session("https://api.github.com/graphql")
+        second = get_session("https://api.github.com/graphql", pool_maxsize=32)
+        get_session("https://api.github.com/graphql", pool_maxsize=8)
+
+        self.assertIs(first, second)
+        adapter = second.get_adapter("https://api.github.com/graphql")
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_close_sessions(self):
+        """Test that closed sessions are replaced by new ones"""
+        first = get_session("https://api.github.com/graphql")
+        close_sessions()
+
+        self.assertIsNot(get_session("https://api.github.com/graphql"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,12 @@ from plugins.certification.jira_integration import (
     get_priority_sort_key,
     is_review_status,
 )
+from plugins.certification.jira_integration.cache import _freeze_contents
+
+
+def _publish_issues(mock_store, issues):
+    """Make the patched Jira snapshot store serve the given issues by email"""
+    mock_store.current.return_value.data = _freeze_contents(issues, {})
 
 
 class TestJiraPrioritySorting(unittest.TestCase):
@@ -112,12 +118,11 @@ class TestJiraAPI(unittest.TestCase):
         self.assertTrue(is_review_status("IN REVIEW"))
         self.assertTrue(is_review_status("code REVIEW"))
 
-    @patch("plugins.certification.jira_integration.cache.jira_issues_cache")
-    def test_get_jira_issues_for_user_success(self, mock_cache):
+    @patch("plugins.certification.jira_integration.cache._jira_store")
+    def test_get_jira_issues_for_user_success(self, mock_store):
         """Test successful retrieval of Jira issues for a user from cache"""
         # Mock cached issues
-        mock_cache.__contains__ = lambda self, key: key == "test@example.com"
-        mock_cache.__getitem__ = lambda self, key: [
+        _publish_issues(mock_store, {"test@example.com": [
             {
                 "key": "TEST-1",
                 "summary": "Test Issue 1",
@@ -136,7 +141,7 @@ class TestJiraAPI(unittest.TestCase):
                 "is_completed": True,
                 "is_in_review": False
             }
-        ]
+        ]})
         
         result = get_jira_issues_for_user("test@example.com")
         
@@ -147,22 +152,21 @@ class TestJiraAPI(unittest.TestCase):
         self.assertEqual(result["active"][0]["key"], "TEST-1")
         self.assertEqual(result["completed"][0]["key"], "TEST-2")
 
-    @patch("plugins.certification.jira_integration.cache.jira_issues_cache")
-    def test_get_jira_issues_for_user_no_cache(self, mock_cache):
+    @patch("plugins.certification.jira_integration.cache._jira_store")
+    def test_get_jira_issues_for_user_no_cache(self, mock_store):
         """Test get_jira_issues_for_user when user not in cache"""
         # Mock empty cache
-        mock_cache.__contains__ = lambda self, key: False
+        _publish_issues(mock_store, {})
         
         result = get_jira_issues_for_user("test@example.com")
         
         self.assertEqual(result, {"active": [], "review": [], "completed": [], "untriaged": []})
 
-    @patch("plugins.certification.jira_integration.cache.jira_issues_cache")
-    def test_get_jira_issues_for_user_with_review_issues(self, mock_cache):
+    @patch("plugins.certification.jira_integration.cache._jira_store")
+    def test_get_jira_issues_for_user_with_review_issues(self, mock_store):
         """Test get_jira_issues_for_user correctly categorizes review issues"""
         # Mock cached issues with review status
-        mock_cache.__contains__ = lambda self, key: key == "test@example.com"
-        mock_cache.__getitem__ = lambda self, key: [
+        _publish_issues(mock_store, {"test@example.com": [
             {
                 "key": "TEST-3",
                 "summary": "Review Issue",
@@ -172,7 +176,7 @@ class TestJiraAPI(unittest.TestCase):
                 "is_completed": False,
                 "is_in_review": True
             }
-        ]
+        ]})
         
         result = get_jira_issues_for_user("test@example.com")
         
@@ -268,12 +272,11 @@ class TestJiraAPI(unittest.TestCase):
 class TestJiraReviewStatus(unittest.TestCase):
     """Test cases for review status detection"""
 
-    @patch("plugins.certification.jira_integration.cache.jira_issues_cache")
-    def test_issues_categorized_by_review_status(self, mock_cache):
+    @patch("plugins.certification.jira_integration.cache._jira_store")
+    def test_issues_categorized_by_review_status(self, mock_store):
         """Test that issues are correctly categorized based on review status"""
         # Mock cached issues with different categories
-        mock_cache.__contains__ = lambda self, key: key == "test@example.com"
-        mock_cache.__getitem__ = lambda self, key: [
+        _publish_issues(mock_store, {"test@example.com": [
             # Active issue (not in review, not done, has priority)
             {
                 "key": "TEST-1",
@@ -314,7 +317,7 @@ class TestJiraReviewStatus(unittest.TestCase):
                 "is_completed": False,
                 "is_in_review": False
             }
-        ]
+        ]})
         
         result = get_jira_issues_for_user("test@example.com")
         
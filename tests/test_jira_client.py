@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test for the shared Jira client and the cached saved filter JQL
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import requests
+from jira.exceptions import JIRAError
+
+from plugins.certification.jira_integration import client as jira_client
+
+CLIENT = "plugins.certification.jira_integration.client"
+
+
+@patch(f"{CLIENT}.JIRA_SERVER", "https://jira.example.com")
+@patch(f"{CLIENT}.JIRA_TOKEN", "token")
+@patch(f"{CLIENT}.JIRA_EMAIL", "bot@example.com")
+@patch(f"{CLIENT}._client", None)
+@patch(f"{CLIENT}.JIRA")
+class TestSharedJiraClient(unittest.TestCase):
+    """Test cases for reusing the Jira client across refreshes"""
+
+    def test_client_is_reused(self, mock_jira):
+        """Test that the client is created once and shared"""
+        first = jira_client.get_jira_client()
+        second = jira_client.get_jira_client()
+
+        self.assertIs(first, second)
+        mock_jira.assert_called_once()
+
+    def test_client_recreated_after_auth_error(self, mock_jira):
+        """Test that an authentication error makes the next call create a new client"""
+        mock_jira.side_effect = [MagicMock(), MagicMock()]
+        first = jira_client.get_jira_client()
+
+        self.assertTrue(jira_client.reset_jira_client(JIRAError(status_code=401)))
+
+        self.assertIsNot(jira_client.get_jira_client(), first)
+
+    def test_client_recreated_after_connection_error(self, mock_jira):
+        """Test that a broken connection makes the next call create a new client"""
+        jira_client.get_jira_client()
+
+        self.assertTrue(
+            jira_client.reset_jira_client(requests.exceptions.ConnectionError("reset"))
+        )
+        jira_client.get_jira_client()
+
+        self.assertEqual(mock_jira.call_count, 2)
+
+    def test_client_kept_after_query_error(self, mock_jira):
+        """Test that errors unrelated to the client keep it"""
+        jira_client.get_jira_client()
+
+        self.assertFalse(jira_client.reset_jira_client(JIRAError(status_code=400)))
+        jira_client.get_jira_client()
+
+        mock_jira.assert_called_once()
+
+
+@patch.dict(f"{CLIENT}._filter_jql", clear=True)
+class TestFilterJQLCache(unittest.TestCase):
+    """Test cases for caching the JQL of the saved filter"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = MagicMock()
+        self.client.filter.return_value.jql = "project = TEST"
+
+    def test_jql_is_cached(self):
+        """Test that the filter is fetched once within its TTL"""
+        self.assertEqual(jira_client.get_filter_jql(self.client, "10000"), "project = TEST")
+        self.assertEqual(jira_client.get_filter_jql(self.client, "10000"), "project = TEST")
+
+        self.client.filter.assert_called_once_with("10000")
+
+    def test_expired_jql_is_fetched_again(self):
+        """Test that the filter is fetched again once its TTL has passed"""
+        jira_client._filter_jql["10000"] = (datetime.now() - timedelta(hours=2), "old")
+
+        self.assertEqual(jira_client.get_filter_jql(self.client, "10000"), "project = TEST")
+
+    def test_stale_jql_served_when_fetch_fails(self):
+        """Test that the last known JQL is used while the filter cannot be fetched"""
+        jira_client._filter_jql["10000"] = (datetime.now() - timedelta(hours=2), "old")
+        self.client.filter.side_effect = JIRAError(status_code=503)
+
+        self.assertEqual(jira_client.get_filter_jql(self.client, "10000"), "old")
+
+
+if __name__ == "__main__":
+    unittest.main()
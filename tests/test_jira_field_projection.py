@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test for fetching only the needed Jira issue fields and the cached story points field
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from jira.exceptions import JIRAError
+
+from plugins.certification.jira_integration import cache as jira_cache
+from plugins.certification.jira_integration import client as jira_client
+
+
+def _issue(key, email, story_points):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.summary = f"Issue {key}"
+    issue.fields.status.name = "In Progress"
+    issue.fields.status.statusCategory.name = "In Progress"
+    issue.fields.priority.name = "High"
+    issue.fields.customfield_10016 = story_points
+    issue.fields.assignee.accountId = f"account-{email}"
+    issue.fields.assignee.emailAddress = email
+    return issue
+
+
+@patch.dict("plugins.certification.jira_integration.client._filter_jql", clear=True)
+@patch("plugins.certification.jira_integration.client._story_points_field", None)
+class TestJiraFieldProjection(unittest.TestCase):
+    """Test cases for the issue fields fetched by a Jira cache refresh"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = MagicMock()
+        self.client.filter.return_value.jql = "project = TEST"
+        self.client.fields.return_value = [
+            {"id": "summary", "name": "Summary"},
+            {"id": "customfield_10016", "name": "Story Points"},
+        ]
+        self.client.search_issues.return_value = [_issue("TEST-1", "a@example.com", 5)]
+
+    def tearDown(self):
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    @patch("plugins.certification.jira_integration.cache.get_jira_client")
+    def test_only_extracted_fields_are_fetched(self, mock_get_client):
+        """Test that the search asks for the extracted fields and the story points field"""
+        mock_get_client.return_value = self.client
+
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+
+        fields = self.client.search_issues.call_args.kwargs["fields"].split(",")
+        self.assertEqual(
+            sorted(fields),
+            ["assignee", "customfield_10016", "priority", "status", "summary"],
+        )
+        issues = jira_cache.get_jira_issues_for_user("a@example.com")
+        self.assertEqual(issues["active"][0]["story_points"], 5)
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    @patch("plugins.certification.jira_integration.cache.get_jira_client")
+    def test_story_points_field_identified_once(self, mock_get_client):
+        """Test that the story points field is looked up on the first refresh only"""
+        mock_get_client.return_value = self.client
+
+        jira_cache.refresh_jira_issues_cache()
+        jira_cache.refresh_jira_issues_cache()
+
+        self.client.fields.assert_called_once()
+
+    def test_failed_identification_is_retried(self):
+        """Test that the default field is used, but not kept, when identification fails"""
+        self.client.fields.side_effect = JIRAError("Service unavailable")
+
+        self.assertEqual(
+            jira_client.get_story_points_field(self.client),
+            jira_client.DEFAULT_STORY_POINTS_FIELD,
+        )
+
+        self.client.fields.side_effect = None
+        self.assertEqual(
+            jira_client.get_story_points_field(self.client), "customfield_10016"
+        )
+
+    def test_sprint_field_is_not_story_points(self):
+        """Test that fields merely containing a story points name are not picked"""
+        self.client.fields.return_value = [
+            {"id": "customfield_10020", "name": "Sprint"},
+            {"id": "customfield_10030", "name": "Spike Notes"},
+            *self.client.fields.return_value,
+        ]
+
+        self.assertEqual(
+            jira_client.identify_story_points_field(self.client), "customfield_10016"
+        )
+
+    def test_default_field_preferred_among_story_points_fields(self):
+        """Test that the default field wins when several fields are named after story points"""
+        self.client.fields.return_value = [
+            *self.client.fields.return_value,
+            {"id": jira_client.DEFAULT_STORY_POINTS_FIELD, "name": "Story point estimate"},
+        ]
+
+        self.assertEqual(
+            jira_client.identify_story_points_field(self.client),
+            jira_client.DEFAULT_STORY_POINTS_FIELD,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
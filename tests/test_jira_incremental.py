@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test for incremental Jira cache refreshes fetching only recently updated issues
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from plugins.certification.jira_integration import cache as jira_cache
+
+
+def _issue(key, email, status="In Progress"):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.summary = f"Issue {key}"
+    issue.fields.status.name = status
+    issue.fields.status.statusCategory.name = status
+    issue.fields.priority.name = "High"
+    issue.fields.customfield_10024 = 3
+    if email:
+        issue.fields.assignee.accountId = f"account-{email}"
+        issue.fields.assignee.emailAddress = email
+    else:
+        issue.fields.assignee = None
+    return issue
+
+
+def _keys(email):
+    issues = jira_cache.get_jira_snapshot().data.issues.get(email, ())
+    return sorted(issue["key"] for issue in issues)
+
+
+class TestJiraQueryConditions(unittest.TestCase):
+    """Test cases for adding conditions to the filter JQL"""
+
+    def test_condition_keeps_order_by_last(self):
+        """Test that added conditions go before ORDER BY and group the filter"""
+        jql = jira_cache._add_jql_condition(
+            "project = A OR project = B order by priority DESC", "updated >= -7m"
+        )
+
+        self.assertEqual(
+            jql, "(project = A OR project = B) AND updated >= -7m ORDER BY priority DESC"
+        )
+
+    def test_updated_since_condition(self):
+        """Test that the delta covers the time since the last refresh plus an overlap"""
+        now = datetime.now(timezone.utc)
+
+        condition = jira_cache._updated_since_condition(
+            now - timedelta(minutes=5, seconds=10), now
+        )
+
+        self.assertEqual(condition, f"updated >= -{6 + jira_cache.DELTA_OVERLAP_MINUTES}m")
+
+
+@patch.dict("plugins.certification.jira_integration.client._filter_jql", clear=True)
+@patch.dict(
+    os.environ, {"JIRA_INCREMENTAL_REFRESH": "true", "JIRA_FULL_REFRESH_MINUTES": "60"}
+)
+@patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+@patch("plugins.certification.jira_integration.cache.get_jira_client")
+class TestJiraIncrementalRefresh(unittest.TestCase):
+    """Test cases for incremental Jira cache refreshes"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+        self.client = MagicMock()
+        self.client.filter.return_value.jql = "project = TEST ORDER BY rank"
+        self.client.search_issues.return_value = [
+            _issue("TEST-1", "a@example.com"),
+            _issue("TEST-2", "a@example.com"),
+            _issue("TEST-3", "b@example.com"),
+        ]
+
+    def tearDown(self):
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+    def test_delta_is_merged_by_key(self, mock_get_client):
+        """Test that updated issues replace their cached version and move assignee"""
+        mock_get_client.return_value = self.client
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+        self.client.search_issues.return_value = [
+            _issue("TEST-1", "b@example.com"),
+            _issue("TEST-2", None),
+            _issue("TEST-4", "a@example.com", status="Done"),
+        ]
+
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+
+        jql = self.client.search_issues.call_args.kwargs["jql_str"]
+        self.assertRegex(jql, r"^\(project = TEST\) AND updated >= -\d+m ORDER BY rank$")
+        self.assertEqual(_keys("a@example.com"), ["TEST-4"])
+        self.assertEqual(_keys("b@example.com"), ["TEST-1", "TEST-3"])
+
+    def test_full_refresh_drops_issues_that_left_the_filter(self, mock_get_client):
+        """Test that the periodic full refresh reloads the whole filter"""
+        mock_get_client.return_value = self.client
+        jira_cache.refresh_jira_issues_cache()
+        jira_cache._last_full_refresh_at -= timedelta(minutes=61)
+        self.client.search_issues.return_value = [_issue("TEST-3", "b@example.com")]
+
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+
+        jql = self.client.search_issues.call_args.kwargs["jql_str"]
+        self.assertEqual(jql, "project = TEST ORDER BY rank")
+        self.assertEqual(_keys("a@example.com"), [])
+        self.assertEqual(_keys("b@example.com"), ["TEST-3"])
+
+    def test_restored_snapshot_is_reconciled_by_full_refresh(self, mock_get_client):
+        """Test that the first refresh after restoring a snapshot is a full one"""
+        mock_get_client.return_value = self.client
+        jira_cache.refresh_jira_issues_cache()
+        jira_cache.restore_jira_snapshot(
+            {"issues": {"c@example.com": [{"key": "OLD-1"}]}, "account_to_email": {}}
+        )
+
+        jira_cache.refresh_jira_issues_cache()
+
+        self.assertEqual(_keys("c@example.com"), [])
+        self.assertNotIn("updated", self.client.search_issues.call_args.kwargs["jql_str"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test for fetching the result pages of large Jira filters concurrently
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from plugins.certification.jira_integration import cache as jira_cache
+
+
+class _Page(list):
+    """Search results page with the total like the jira library's ResultList"""
+
+    def __init__(self, issues, total):
+        super().__init__(issues)
+        self.total = total
+
+
+def _issue(number):
+    issue = MagicMock()
+    issue.key = f"TEST-{number}"
+    return issue
+
+
+def _keys(issues):
+    return [issue.key for issue in issues]
+
+
+class FakeJiraSearch:
+    """search_issues over a list of issues, recording the requested pages"""
+
+    def __init__(self, issues, page_limit=None):
+        self.issues = issues
+        self.page_limit = page_limit
+        self.starts = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, jql_str, startAt, maxResults, fields):
+        with self._lock:
+            self.starts.append(startAt)
+            self.threads.add(threading.current_thread().name)
+        size = min(maxResults, self.page_limit or maxResults)
+        return _Page(self.issues[startAt:startAt + size], len(self.issues))
+
+
+class TestParallelJiraPages(unittest.TestCase):
+    """Test cases for _fetch_all_issues"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = MagicMock()
+
+    def test_remaining_pages_fetched_concurrently_in_order(self):
+        """Test that pages after the first are fetched by workers and merged in order"""
+        issues = [_issue(number) for number in range(250)]
+        search = FakeJiraSearch(issues)
+        self.client.search_issues.side_effect = search
+
+        result = jira_cache._fetch_all_issues(self.client, "project = TEST", "summary")
+
+        self.assertEqual(_keys(result), _keys(issues))
+        self.assertEqual(sorted(search.starts), [0, 100, 200])
+        self.assertTrue(any(name.startswith("jira-pages") for name in search.threads))
+
+    def test_smaller_server_pages(self):
+        """Test that pages capped by the server below the requested size are followed"""
+        issues = [_issue(number) for number in range(120)]
+        search = FakeJiraSearch(issues, page_limit=50)
+        self.client.search_issues.side_effect = search
+
+        result = jira_cache._fetch_all_issues(self.client, "project = TEST", "summary")
+
+        self.assertEqual(_keys(result), _keys(issues))
+        self.assertEqual(sorted(search.starts), [0, 50, 100])
+
+    def test_shifted_results_are_fetched_again(self):
+        """Test that duplicates from results shifting between pages trigger a refetch"""
+        issues = [_issue(number) for number in range(150)]
+        shifted = [issues[0], *issues]  # an issue showing up twice, another missed
+        search = FakeJiraSearch(issues)
+        calls = []
+
+        def side_effect(**kwargs):
+            calls.append(kwargs["startAt"])
+            if kwargs["startAt"] == 100 and calls.count(100) == 1:
+                return _Page(shifted[100:150], 150)
+            return search(**kwargs)
+
+        self.client.search_issues.side_effect = side_effect
+
+        result = jira_cache._fetch_all_issues(self.client, "project = TEST", "summary")
+
+        self.assertEqual(_keys(result), _keys(issues))
+        self.assertEqual(calls.count(0), 2)
+
+    def test_pages_without_total_are_fetched_serially(self):
+        """Test that results without a total are paged until a page is not full"""
+        issues = [_issue(number) for number in range(150)]
+        self.client.search_issues.side_effect = lambda **kwargs: issues[
+            kwargs["startAt"]:kwargs["startAt"] + kwargs["maxResults"]
+        ]
+
+        result = jira_cache._fetch_all_issues(self.client, "project = TEST", "summary")
+
+        self.assertEqual(_keys(result), _keys(issues))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test for the per-user Jira views categorized and sorted when the cache is published
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+
+from plugins.certification.jira_integration import cache as jira_cache
+
+
+def _issue(key, priority, is_completed=False, is_in_review=False):
+    return {
+        "key": key,
+        "summary": f"Issue {key}",
+        "priority": priority,
+        "is_completed": is_completed,
+        "is_in_review": is_in_review,
+    }
+
+
+class TestJiraUserViews(unittest.TestCase):
+    """Test cases for the views published with the Jira cache contents"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        jira_cache.restore_jira_snapshot(
+            {
+                "issues": {
+                    "user@example.com": [
+                        _issue("TEST-1", "Low"),
+                        _issue("TEST-2", "Highest"),
+                        _issue("TEST-3", "High", is_in_review=True),
+                        _issue("TEST-4", "None"),
+                        _issue("TEST-5", "Medium"),
+                        _issue("TEST-6", "High", is_completed=True),
+                    ]
+                },
+                "account_to_email": {},
+            }
+        )
+
+    def tearDown(self):
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+    def test_views_are_built_on_publish(self):
+        """Test that every assignee's issues are categorized and sorted once published"""
+        view = jira_cache.get_jira_snapshot().data.views["user@example.com"]
+
+        self.assertEqual(
+            [issue["key"] for issue in view["active"]], ["TEST-2", "TEST-5", "TEST-1"]
+        )
+        self.assertEqual([issue["key"] for issue in view["review"]], ["TEST-3"])
+        self.assertEqual([issue["key"] for issue in view["completed"]], ["TEST-6"])
+        self.assertEqual([issue["key"] for issue in view["untriaged"]], ["TEST-4"])
+
+    def test_lookup_does_not_categorize_again(self):
+        """Test that lookups serve the published view without sorting"""
+        with patch(
+            "plugins.certification.jira_integration.cache._categorize_issues"
+        ) as mock_categorize:
+            result = jira_cache.get_jira_issues_for_user("user@example.com", max_results=2)
+
+        mock_categorize.assert_not_called()
+        self.assertEqual([issue["key"] for issue in result["active"]], ["TEST-2", "TEST-5"])
+        self.assertEqual(list(result), list(jira_cache.JIRA_CATEGORIES))
+
+    def test_lookup_results_can_be_modified(self):
+        """Test that callers get lists they may change without touching the view"""
+        result = jira_cache.get_jira_issues_for_user("user@example.com")
+        result["active"].clear()
+
+        self.assertEqual(
+            len(jira_cache.get_jira_issues_for_user("user@example.com")["active"]), 3
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
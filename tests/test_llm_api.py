@@ -25,7 +25,7 @@ class TestLLMAPIClient(unittest.TestCase):
             model_name="test-model",
         )
 
-    @patch("plugins.certification.llm_api.requests.post")
+    @patch("plugins.certification.http_sessions.requests.Session.post")
     def test_generate_completion_ollama_success(self, mock_post):
         """Test generate_completion with successful Ollama format"""
         # Mock successful Ollama response
@@ -39,7 +39,7 @@ class TestLLMAPIClient(unittest.TestCase):
         self.assertEqual(result, "Generated text response")
         mock_post.assert_called()
 
-    @patch("plugins.certification.llm_api.requests.post")
+    @patch("plugins.certification.http_sessions.requests.Session.post")
     def test_generate_completion_openai_success(self, mock_post):
         """Test generate_completion with OpenAI format when Ollama fails"""
         # First call (Ollama) fails, second call (OpenAI) succeeds
@@ -57,7 +57,7 @@ class TestLLMAPIClient(unittest.TestCase):
         self.assertEqual(result, "OpenAI response")
         self.assertEqual(mock_post.call_count, 2)
 
-    @patch("plugins.certification.llm_api.requests.post")
+    @patch("plugins.certification.http_sessions.requests.Session.post")
     def test_generate_completion_both_formats_fail(self, mock_post):
         """Test generate_completion returns None when both formats fail"""
         # Both API calls fail
@@ -70,7 +70,7 @@ class TestLLMAPIClient(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("plugins.certification.llm_api.requests.post")
+    @patch("plugins.certification.http_sessions.requests.Session.post")
     def test_generate_completion_network_error(self, mock_post):
         """Test generate_completion handles network errors gracefully"""
         import requests
@@ -81,7 +81,7 @@ class TestLLMAPIClient(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("plugins.certification.llm_api.requests.post")
+    @patch("plugins.certification.http_sessions.requests.Session.post")
     def test_generate_completion_timeout(self, mock_post):
         """Test generate_completion handles timeout"""
         import requests
@@ -92,7 +92,7 @@ class TestLLMAPIClient(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("plugins.certification.llm_api.requests.post")
+    @patch("plugins.certification.http_sessions.requests.Session.post")
     def test_generate_completion_json_decode_error(self, mock_post):
         """Test generate_completion handles invalid JSON responses"""
         mock_response = MagicMock()
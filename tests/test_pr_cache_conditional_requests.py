@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test for ETag / Last-Modified conditional requests made by PullRequestCache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import (
+    CredentialPool,
+    RateLimitTracker,
+    TokenCredential,
+)
+from tests.github_responses import make_response, rate_limit_headers
+
+
+class TestPRCacheConditionalRequests(unittest.TestCase):
+    """Test cases for conditional GitHub requests"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_token="test-token",
+            github_org="test-org"
+        )
+        self.pulls = [
+            {
+                "number": 1,
+                "title": "PR 1",
+                "draft": False,
+                "user": {"login": "author1"},
+                "requested_reviewers": [],
+                "assignees": []
+            }
+        ]
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_second_refresh_reuses_pages_on_304(self, mock_get):
+        """Test that a 304 response reuses the previously parsed page"""
+        sent_headers = []
+
+        def first_refresh(url, **kwargs):
+            sent_headers.append(kwargs["headers"])
+            page = kwargs.get("params", {}).get("page", 1)
+            if page == 1:
+                link = '<https://api.github.com/repos/test-org/repo1/pulls?page=2>; rel="next"'
+                return make_response(
+                    200, self.pulls, {"ETag": '"etag-page-1"', "Link": link}
+                )
+            return make_response(200, [], {"ETag": '"etag-page-2"'})
+
+        def second_refresh(url, **kwargs):
+            sent_headers.append(kwargs["headers"])
+            return make_response(304)
+
+        mock_get.side_effect = first_refresh
+        self.assertTrue(self.pr_cache.refresh_cache())
+        self.assertNotIn("If-None-Match", sent_headers[0])
+
+        sent_headers.clear()
+        mock_get.side_effect = second_refresh
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual(sent_headers[0]["If-None-Match"], '"etag-page-1"')
+        self.assertEqual(sent_headers[1]["If-None-Match"], '"etag-page-2"')
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)
+        self.assertEqual(self.pr_cache.cache["repo1"][0]["number"], 1)
+        self.assertEqual(self.pr_cache.get_cache_stats()["not_modified_responses"], 2)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_stored_pages_share_cached_records(self, mock_get):
+        """Test that stored pulls pages hold the cached records instead of raw JSON"""
+        draft = {**self.pulls[0], "number": 2, "draft": True, "body": "x" * 1000}
+        mock_get.return_value = make_response(
+            200, [draft, *self.pulls], {"ETag": '"pulls"'}
+        )
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        url = "https://api.github.com/repos/test-org/repo1/pulls"
+        params = (("page", 1), ("per_page", 100), ("state", "open"))
+        credential = self.pr_cache.credentials.names()[0]
+        stored = self.pr_cache._validator_store[(url, params, credential)]
+        self.assertIs(stored["data"][1], self.pr_cache.cache["repo1"][0])
+        self.assertNotIn("body", stored["data"][0])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_last_modified_validator_is_sent(self, mock_get):
+        """Test that Last-Modified is replayed as If-Modified-Since"""
+        last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        mock_get.return_value = make_response(
+            200, [{"login": "user1"}], {"Last-Modified": last_modified}
+        )
+        self.pr_cache._conditional_get(
+            "https://api.github.com/orgs/test-org/teams/team/members", {"page": 1}
+        )
+
+        mock_get.return_value = make_response(304)
+        response, data = self.pr_cache._conditional_get(
+            "https://api.github.com/orgs/test-org/teams/team/members", {"page": 1}
+        )
+
+        headers = mock_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-Modified-Since"], last_modified)
+        self.assertEqual(data, [{"login": "user1"}])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_validators_are_stored_per_page(self, mock_get):
+        """Test that validators for different pages of the same URL do not collide"""
+        url = "https://api.github.com/repos/test-org/repo1/pulls"
+        mock_get.return_value = make_response(200, ["page-1"], {"ETag": '"a"'})
+        self.pr_cache._conditional_get(url, {"page": 1})
+        mock_get.return_value = make_response(200, ["page-2"], {"ETag": '"b"'})
+        self.pr_cache._conditional_get(url, {"page": 2})
+
+        mock_get.return_value = make_response(304)
+        _, page_1 = self.pr_cache._conditional_get(url, {"page": 1})
+        _, page_2 = self.pr_cache._conditional_get(url, {"page": 2})
+
+        self.assertEqual(page_1, ["page-1"])
+        self.assertEqual(page_2, ["page-2"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_validators_are_stored_per_credential(self, mock_get):
+        """Test that a validator is only sent with the credential it was issued to"""
+        first = TokenCredential("ghp_first")
+        second = TokenCredential("ghp_second")
+        tracker = RateLimitTracker()
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_org="test-org",
+            credentials=CredentialPool([first, second], tracker),
+        )
+        url = "https://api.github.com/orgs/test-org/teams/team/members"
+        sent = []
+
+        def get(url, **kwargs):
+            headers = kwargs["headers"]
+            sent.append((headers["Authorization"], headers.get("If-None-Match")))
+            # Each request leaves its credential with less budget than the other
+            remaining = 1000 - len(sent)
+            return make_response(
+                200,
+                [{"login": "user1"}],
+                {"ETag": f'"{headers["Authorization"]}"', **rate_limit_headers(remaining)},
+            )
+
+        mock_get.side_effect = get
+        for _ in range(4):
+            self.pr_cache._conditional_get(url, {"page": 1})
+
+        self.assertEqual(
+            [authorization for authorization, _ in sent],
+            ["token ghp_first", "token ghp_second"] * 2,
+        )
+        self.assertEqual(
+            [etag for _, etag in sent],
+            [None, None, '"token ghp_first"', '"token ghp_second"'],
+        )
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_review_status_uses_stored_reviews_on_304(self, mock_get):
+        """Test that review status is derived from stored reviews on 304"""
+        mock_get.return_value = make_response(
+            200, [{"state": "APPROVED"}], {"ETag": '"reviews"'}
+        )
+        first = self.pr_cache._get_pr_review_status("repo1", 1)
+
+        mock_get.return_value = make_response(304)
+        second = self.pr_cache._get_pr_review_status("repo1", 1)
+
+        self.assertEqual(first, second)
+        self.assertTrue(second["has_approvals"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_304_without_stored_page_is_not_reused(self, mock_get):
+        """Test that an unexpected 304 without a stored page yields no data"""
+        mock_get.return_value = make_response(304)
+
+        self.assertIsNone(self.pr_cache._get_pr_review_status("repo1", 1))
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_unused_validators_are_pruned_by_refresh(self, mock_get):
+        """Test that a refresh drops validators of requests no longer sent"""
+        reviews_url = "https://api.github.com/repos/test-org/repo1/pulls/9/reviews"
+        mock_get.return_value = make_response(200, [], {"ETag": '"reviews"'})
+        self.pr_cache._conditional_get(reviews_url, {"page": 1})
+        credential = self.pr_cache.credentials.names()[0]
+        stored = self.pr_cache._validator_store[(reviews_url, (("page", 1),), credential)]
+        stored["used_at"] -= self.pr_cache.validator_retention + timedelta(minutes=1)
+
+        mock_get.return_value = make_response(200, self.pulls, {"ETag": '"pulls"'})
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        urls = {url for url, _, _ in self.pr_cache._validator_store}
+        self.assertEqual(urls, {"https://api.github.com/repos/test-org/repo1/pulls"})
+        self.assertEqual(self.pr_cache.get_cache_stats()["stored_validators"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
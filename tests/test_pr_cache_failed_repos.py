@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test for keeping last known PRs of repositories that fail to fetch, and retrying them
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from tests.github_responses import make_response
+
+
+def _pr(number):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "updated_at": "2026-10-01T10:00:00Z",
+        "user": {"login": "author1"},
+        "requested_reviewers": [],
+        "assignees": [],
+    }
+
+
+class TestPRCacheFailedRepositories(unittest.TestCase):
+    """Test cases for repositories whose fetch failed"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1", "repo2"],
+            github_token="test-token",
+            github_org="test-org",
+        )
+        self.failing = {"repo1"}
+
+        def side_effect(url, **kwargs):
+            repo = url.split("/")[5]
+            if repo in self.failing:
+                return make_response(502)
+            return make_response(200, [_pr(1 if repo == "repo1" else 2)])
+
+        patcher = patch(
+            "plugins.certification.pr_cache.requests.Session.get", side_effect=side_effect
+        )
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.failing = set()
+        self.assertTrue(self.pr_cache.refresh_cache())
+        self.failing = {"repo1"}
+
+    def test_failed_repository_keeps_last_known_prs(self):
+        """Test that a failed fetch keeps serving the PRs from the previous refresh"""
+        synced_at = self.pr_cache.repo_synced_at["repo1"]
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual([pr.number for pr in self.pr_cache.cache["repo1"]], [1])
+        self.assertEqual(self.pr_cache.repo_synced_at["repo1"], synced_at)
+        self.assertEqual(
+            len(self.pr_cache.get_prs_for_user("author1")["authored_unassigned"]), 2
+        )
+        failed = self.pr_cache.get_cache_stats()["failed_repositories"]
+        self.assertEqual(list(failed), ["repo1"])
+        self.assertEqual(failed["repo1"]["failures"], 1)
+
+    def test_retry_fetches_only_failed_repositories(self):
+        """Test that a due retry refetches the failed repository alone"""
+        self.pr_cache.refresh_cache()
+        self.pr_cache.repo_retry["repo1"] = (1, datetime.now() - timedelta(seconds=1))
+        self.failing = set()
+        self.mock_get.reset_mock()
+
+        self.assertTrue(self.pr_cache.retry_failed_repositories())
+
+        requested = {call.args[0] for call in self.mock_get.call_args_list}
+        self.assertEqual(requested, {"https://api.github.com/repos/test-org/repo1/pulls"})
+        self.assertEqual(self.pr_cache.repo_retry, {})
+        self.assertEqual(len(self.pr_cache.cache["repo2"]), 1)
+
+    def test_retry_publishes_new_retry_state(self):
+        """Test that a retry replaces the retry state stats may be reading"""
+        self.pr_cache.refresh_cache()
+        self.pr_cache.repo_retry["repo1"] = (1, datetime.now() - timedelta(seconds=1))
+        self.failing = set()
+        repo_retry = self.pr_cache.repo_retry
+        repo_synced_at = self.pr_cache.repo_synced_at
+        expected = (dict(repo_retry), dict(repo_synced_at))
+
+        self.assertTrue(self.pr_cache.retry_failed_repositories())
+
+        self.assertEqual((repo_retry, repo_synced_at), expected)
+        self.assertEqual(self.pr_cache.repo_retry, {})
+        self.assertGreater(
+            self.pr_cache.repo_synced_at["repo1"], repo_synced_at["repo1"]
+        )
+
+    def test_retry_waits_until_due(self):
+        """Test that no request is made before the retry is due"""
+        self.pr_cache.refresh_cache()
+        self.mock_get.reset_mock()
+
+        self.assertFalse(self.pr_cache.retry_failed_repositories())
+        self.mock_get.assert_not_called()
+
+    def test_retry_skipped_while_refreshing(self):
+        """Test that no retry runs while a refresh fetches the repositories anyway"""
+        self.pr_cache.refresh_cache()
+        self.pr_cache.repo_retry["repo1"] = (1, datetime.now() - timedelta(seconds=1))
+        self.mock_get.reset_mock()
+
+        with self.pr_cache._refresh_lock:
+            self.assertFalse(self.pr_cache.retry_failed_repositories())
+
+        self.mock_get.assert_not_called()
+        self.assertEqual(self.pr_cache.repo_retry["repo1"][0], 1)
+
+    def test_retry_backs_off_after_repeated_failures(self):
+        """Test that each failed retry doubles the delay until the next one"""
+        self.pr_cache.refresh_cache()
+        self.pr_cache.repo_retry["repo1"] = (1, datetime.now() - timedelta(seconds=1))
+
+        self.assertFalse(self.pr_cache.retry_failed_repositories())
+
+        failures, next_retry = self.pr_cache.repo_retry["repo1"]
+        self.assertEqual(failures, 2)
+        self.assertGreater(next_retry, datetime.now() + timedelta(seconds=90))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test for the GraphQL fetch backend of PullRequestCache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import (
+    analyze_review_states,
+    review_status_from_node,
+)
+
+
+def _pr_node(number, author, draft=False, reviewers=(), teams=(), assignees=(),
+             reviews=()):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "url": f"https://github.com/test-org/repo/pull/{number}",
+        "isDraft": draft,
+        "updatedAt": "2026-10-01T10:00:00Z",
+        "headRefOid": f"sha{number}",
+        "author": {"login": author},
+        "assignees": {"nodes": [{"login": login} for login in assignees]},
+        "reviewRequests": {
+            "nodes": [
+                {"requestedReviewer": {"__typename": "User", "login": login}}
+                for login in reviewers
+            ]
+            + [
+                {"requestedReviewer": {"__typename": "Team", "slug": slug, "name": slug}}
+                for slug in teams
+            ]
+        },
+        "approvals": {"totalCount": list(reviews).count("APPROVED")},
+        "changesRequested": {"totalCount": list(reviews).count("CHANGES_REQUESTED")},
+    }
+
+
+def _connection(nodes, has_next_page=False, end_cursor=None):
+    return {
+        "pageInfo": {"hasNextPage": has_next_page, "endCursor": end_cursor},
+        "nodes": nodes,
+    }
+
+
+def _graphql_response(body):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = body
+    return mock_response
+
+
+class TestPRCacheGraphQL(unittest.TestCase):
+    """Test cases for the GraphQL batch backend"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1", "repo2", "missing"],
+            github_token="test-token",
+            github_org="test-org",
+            fetch_backend="graphql",
+        )
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    @patch("plugins.certification.pr_cache.requests.Session.post")
+    def test_refresh_cache_with_single_batch(self, mock_post, mock_get):
+        """Test that one GraphQL query fills the cache and review status"""
+        mock_post.return_value = _graphql_response({
+            "data": {
+                "repo0": {"pullRequests": _connection([
+                    _pr_node(1, "author1", reviewers=["reviewer1"], teams=["team1"]),
+                    _pr_node(2, "author1", draft=True),
+                ])},
+                "repo1": {"pullRequests": _connection([
+                    _pr_node(3, "author2", assignees=["author1"], reviews=["APPROVED"]),
+                ])},
+                "repo2": None,
+            },
+            "errors": [{"type": "NOT_FOUND", "path": ["repo2"], "message": "Not found"}],
+        })
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        mock_post.assert_called_once()
+        mock_get.assert_not_called()
+        self.assertEqual(list(self.pr_cache.cache.keys()), ["repo1", "repo2", "missing"])
+        self.assertEqual(self.pr_cache.cache["missing"], [])
+
+        pr = self.pr_cache.cache["repo1"][0]
+        self.assertEqual(len(self.pr_cache.cache["repo1"]), 1)  # Draft filtered out
+        self.assertEqual(pr.author, "author1")
+        self.assertEqual(pr.reviewers, ("reviewer1",))
+        self.assertEqual(pr.teams, ("team1",))
+        self.assertEqual(pr.repository, "repo1")
+        self.assertEqual(pr["html_url"], "https://github.com/test-org/repo/pull/1")
+        revision, status = self.pr_cache.review_status[("repo2", 3)]
+        self.assertEqual(revision, "sha3:2026-10-01T10:00:00Z")
+        self.assertTrue(status["has_approvals"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    @patch("plugins.certification.pr_cache.requests.Session.post")
+    def test_review_status_from_graphql_avoids_rest_calls(self, mock_post, mock_get):
+        """Test that categorization uses review status delivered by GraphQL"""
+        mock_post.return_value = _graphql_response({
+            "data": {
+                "repo0": {"pullRequests": _connection([
+                    _pr_node(1, "author1", reviewers=["reviewer1"],
+                             reviews=["CHANGES_REQUESTED"]),
+                    _pr_node(2, "author1", assignees=["someone"], reviews=["APPROVED"]),
+                ])},
+                "repo1": {"pullRequests": _connection([])},
+                "repo2": {"pullRequests": _connection([])},
+            }
+        })
+        self.pr_cache.refresh_cache()
+
+        result = self.pr_cache.get_prs_for_user("author1")
+
+        mock_get.assert_not_called()
+        self.assertEqual(result["authored_changes_requested"][0]["number"], 1)
+        self.assertEqual(result["authored_approved"][0]["number"], 2)
+
+    def test_review_status_matches_rest_backend(self):
+        """Test that GraphQL and REST review status agree after a later approval"""
+        states = ["CHANGES_REQUESTED", "COMMENTED", "APPROVED"]
+
+        rest_status = analyze_review_states([{"state": state} for state in states])
+        graphql_status = review_status_from_node(_pr_node(1, "author1", reviews=states))
+
+        self.assertEqual(graphql_status, rest_status)
+        self.assertTrue(graphql_status["has_changes_requested"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.post")
+    def test_repository_with_more_than_one_page(self, mock_post):
+        """Test that repositories with more open PRs than one page are followed up"""
+        self.pr_cache.repo_filter = ["repo1"]
+
+        def side_effect(url, **kwargs):
+            variables = kwargs["json"]["variables"]
+            if "cursor" not in variables:
+                return _graphql_response({"data": {"repo0": {"pullRequests": _connection(
+                    [_pr_node(1, "author1")], has_next_page=True, end_cursor="c1"
+                )}}})
+            self.assertEqual(variables["name"], "repo1")
+            self.assertEqual(variables["cursor"], "c1")
+            return _graphql_response({"data": {"repository": {"pullRequests": _connection(
+                [_pr_node(2, "author1")]
+            )}}})
+
+        mock_post.side_effect = side_effect
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+        self.assertEqual(
+            [pr["number"] for pr in self.pr_cache.cache["repo1"]], [1, 2]
+        )
+
+    @patch("plugins.certification.pr_cache.requests.Session.post")
+    def test_repositories_are_split_into_batches(self, mock_post):
+        """Test that repositories are queried in batches of the configured size"""
+        self.pr_cache.repo_filter = [f"repo{i}" for i in range(5)]
+        self.pr_cache.graphql_batch_size = 2
+
+        def side_effect(url, **kwargs):
+            query = kwargs["json"]["query"]
+            aliases = [f"repo{i}" for i in range(2) if f"repo{i}: repository" in query]
+            return _graphql_response({
+                "data": {alias: {"pullRequests": _connection([])} for alias in aliases}
+            })
+
+        mock_post.side_effect = side_effect
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(len(self.pr_cache.cache), 5)
+
+    @patch("plugins.certification.pr_cache.requests.Session.post")
+    def test_failed_batch_skips_its_repositories(self, mock_post):
+        """Test that repositories of a failed GraphQL request are not cached"""
+        import requests
+
+        mock_post.side_effect = requests.exceptions.RequestException("Network error")
+
+        # With no repository fetched at all, the refresh failed
+        self.assertFalse(self.pr_cache.refresh_cache())
+        self.assertEqual(self.pr_cache.cache, {})
+
+    def test_invalid_backend_rejected(self):
+        """Test that an unknown backend name is rejected"""
+        with self.assertRaises(Exception):
+            PullRequestCache(
+                github_token="test-token", github_org="test-org", fetch_backend="soap"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
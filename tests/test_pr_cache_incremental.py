@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test for incremental (updated-since) refreshes of the PR cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import requests
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import merge_pr_changes
+from tests.github_responses import make_response
+
+
+def _timestamp(moment):
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _pr(number, updated_at, state="open", draft=False):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": state,
+        "draft": draft,
+        "updated_at": updated_at,
+        "user": {"login": "author1"},
+        "requested_reviewers": [],
+        "assignees": [],
+    }
+
+
+class TestMergePRChanges(unittest.TestCase):
+    """Test cases for merging changed PRs into cached PRs"""
+
+    def test_merge_upserts_and_removes(self):
+        """Test that open PRs are upserted and closed or draft PRs removed"""
+        cached = [_pr(3, "old"), _pr(2, "old"), _pr(1, "old")]
+        changes = [
+            _pr(4, "new"),
+            _pr(3, "new"),
+            _pr(2, "new", state="closed"),
+            _pr(1, "new", draft=True),
+        ]
+
+        merged = merge_pr_changes(cached, changes, "repo1")
+
+        self.assertEqual([pr["number"] for pr in merged], [4, 3])
+        self.assertEqual(merged[1]["updated_at"], "new")
+
+    def test_merge_ignores_unknown_closed_prs(self):
+        """Test that closing a PR that is not cached is a no-op"""
+        merged = merge_pr_changes(
+            [_pr(1, "old")], [_pr(5, "new", state="closed")], "repo1"
+        )
+
+        self.assertEqual([pr["number"] for pr in merged], [1])
+
+
+class TestPRCacheIncrementalRefresh(unittest.TestCase):
+    """Test cases for incremental refreshes"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_token="test-token",
+            github_org="test-org",
+            incremental=True,
+        )
+        self.now = datetime.now(timezone.utc)
+
+    def _full_refresh(self, mock_get, prs):
+        mock_get.side_effect = lambda url, **kwargs: make_response(
+            200, prs if kwargs["params"]["page"] == 1 else []
+        )
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_incremental_refresh_merges_delta(self, mock_get):
+        """Test that the second refresh only fetches PRs updated since the first"""
+        old = _timestamp(self.now - timedelta(days=2))
+        self._full_refresh(mock_get, [_pr(2, old), _pr(1, old)])
+        self.assertFalse(self.pr_cache.get_cache_stats()["last_refresh_incremental"])
+
+        requested_params = []
+        delta = [
+            _pr(3, _timestamp(self.now)),
+            _pr(2, _timestamp(self.now), state="closed"),
+            _pr(1, old),
+        ]
+
+        def delta_refresh(url, **kwargs):
+            requested_params.append(kwargs["params"])
+            return make_response(200, delta)
+
+        mock_get.side_effect = delta_refresh
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual(len(requested_params), 1)
+        self.assertEqual(requested_params[0]["state"], "all")
+        self.assertEqual(requested_params[0]["sort"], "updated")
+        self.assertEqual(requested_params[0]["direction"], "desc")
+        self.assertEqual([pr["number"] for pr in self.pr_cache.cache["repo1"]], [3, 1])
+        self.assertTrue(self.pr_cache.get_cache_stats()["last_refresh_incremental"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_delta_failure_falls_back_to_full_fetch(self, mock_get):
+        """Test that a failed delta request re-fetches all open PRs"""
+        old = _timestamp(self.now - timedelta(days=2))
+        self._full_refresh(mock_get, [_pr(1, old)])
+
+        def failing_delta(url, **kwargs):
+            if kwargs["params"].get("state") == "all":
+                response = make_response(500)
+                response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+                return response
+            page = kwargs["params"]["page"]
+            return make_response(200, [_pr(7, old)] if page == 1 else [])
+
+        mock_get.side_effect = failing_delta
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        self.assertEqual([pr["number"] for pr in self.pr_cache.cache["repo1"]], [7])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_full_refresh_runs_periodically(self, mock_get):
+        """Test that a full refresh runs once the full refresh interval elapsed"""
+        old = _timestamp(self.now - timedelta(days=2))
+        self._full_refresh(mock_get, [_pr(1, old)])
+        self.pr_cache.last_full_refresh = datetime.now() - timedelta(hours=2)
+
+        self._full_refresh(mock_get, [_pr(8, old)])
+
+        self.assertFalse(self.pr_cache.get_cache_stats()["last_refresh_incremental"])
+        self.assertEqual([pr["number"] for pr in self.pr_cache.cache["repo1"]], [8])
+
+    @patch.dict(os.environ, {"GITHUB_INCREMENTAL_REFRESH": "true"})
+    def test_incremental_from_environment(self):
+        """Test that incremental mode can be enabled from the environment"""
+        pr_cache = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+
+        self.assertTrue(pr_cache.incremental)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,9 @@ import unittest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-from plugins.certification.pr_cache import PullRequestCache
+import requests
+
+from plugins.certification.pr_cache import DEFAULT_PAGE_WORKERS, PullRequestCache
 
 
 class TestPRCacheRefresh(unittest.TestCase):
@@ -26,7 +28,7 @@ class TestPRCacheRefresh(unittest.TestCase):
             github_org="test-org"
         )
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_success_with_filter(self, mock_get):
         """Test successful cache refresh with repository filter"""
         # Mock responses for two repositories
@@ -93,7 +95,7 @@ class TestPRCacheRefresh(unittest.TestCase):
         self.assertIsNotNone(self.pr_cache.last_updated)
         self.assertIsInstance(self.pr_cache.last_updated, datetime)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_handles_404_repos(self, mock_get):
         """Test that refresh_cache handles 404 errors for non-existent repos"""
         # Mock responses - one successful, one 404
@@ -137,7 +139,7 @@ class TestPRCacheRefresh(unittest.TestCase):
         self.assertEqual(len(self.pr_cache.cache["repo1"]), 0)  # 404 returns empty list
         self.assertEqual(len(self.pr_cache.cache["repo2"]), 1)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_without_filter_fetches_org_repos(self, mock_get):
         """Test that refresh_cache fetches all org repos when no filter is provided"""
         # Create cache without filter
@@ -204,7 +206,56 @@ class TestPRCacheRefresh(unittest.TestCase):
         self.assertIn("org-repo1", pr_cache.cache)
         self.assertIn("org-repo2", pr_cache.cache)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_partial_org_listing_keeps_cached_repos(self, mock_get):
+        """Test that a repository listing failing partway does not drop repositories"""
+        pr_cache = PullRequestCache(github_token="test-token", github_org="test-org")
+        listing_fails = False
+
+        def side_effect(url, **kwargs):
+            mock_response = MagicMock(status_code=200, headers={})
+            page = kwargs.get("params", {}).get("page", 1)
+            if "/orgs/test-org/repos" in url:
+                if page == 1:
+                    mock_response.headers = {
+                        "Link": '<https://api.github.com/orgs/test-org/repos?page=2>; rel="next"'
+                    }
+                    mock_response.json.return_value = [{"name": "org-repo1"}]
+                elif listing_fails:
+                    mock_response.status_code = 502
+                    mock_response.raise_for_status.side_effect = (
+                        requests.exceptions.HTTPError("502 Bad Gateway")
+                    )
+                else:
+                    mock_response.json.return_value = [{"name": "org-repo2"}]
+            else:
+                mock_response.json.return_value = []
+            return mock_response
+
+        mock_get.side_effect = side_effect
+        self.assertTrue(pr_cache.refresh_cache())
+
+        listing_fails = True
+        self.assertTrue(pr_cache.refresh_cache())
+
+        self.assertEqual(list(pr_cache.cache), ["org-repo1", "org-repo2"])
+        requested = {call.args[0] for call in mock_get.call_args_list}
+        self.assertIn("https://api.github.com/repos/test-org/org-repo2/pulls", requested)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_failed_org_listing_without_cache_fails_refresh(self, mock_get):
+        """Test that a refresh fails when the repositories cannot be listed at all"""
+        pr_cache = PullRequestCache(github_token="test-token", github_org="test-org")
+        mock_response = MagicMock(status_code=503, headers={})
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            "503 Service Unavailable"
+        )
+        mock_get.return_value = mock_response
+
+        self.assertFalse(pr_cache.refresh_cache())
+        self.assertIn("503", pr_cache.last_refresh_error)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_handles_request_exceptions(self, mock_get):
         """Test that refresh_cache handles network errors gracefully"""
         import requests
@@ -252,7 +303,7 @@ class TestPRCacheRefresh(unittest.TestCase):
         self.assertIn("repo2", self.pr_cache.cache)
         self.assertNotIn("repo1", self.pr_cache.cache)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_pagination(self, mock_get):
         """Test that refresh_cache handles pagination correctly"""
         # Mock responses with pagination
@@ -312,7 +363,7 @@ class TestPRCacheRefresh(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(len(pr_cache.cache["repo1"]), 110)  # Total PRs from both pages
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_filters_draft_prs(self, mock_get):
         """Test that refresh_cache filters out draft PRs"""
         # Mock response with mix of draft and non-draft PRs
@@ -378,7 +429,7 @@ class TestPRCacheRefresh(unittest.TestCase):
         self.assertIn(3, pr_numbers)
         self.assertNotIn(2, pr_numbers)  # Draft PR should be filtered out
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_refresh_cache_exception_returns_false(self, mock_get):
         """Test that refresh_cache returns False when exception occurs"""
         # Mock exception during fetch
@@ -390,6 +441,98 @@ class TestPRCacheRefresh(unittest.TestCase):
         # Assertions
         self.assertFalse(result)
 
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_cache_fetches_repos_concurrently(self, mock_get):
+        """Test that refresh_cache fetches repositories in parallel worker threads"""
+        import threading
+
+        repo_names = [f"repo{i}" for i in range(6)]
+        thread_names = set()
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+        all_workers_busy = threading.Event()
+
+        def side_effect(url, **kwargs):
+            with lock:
+                thread_names.add(threading.current_thread().name)
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+                if in_flight[0] == 3:
+                    all_workers_busy.set()
+            # Hold the request until all workers fetch at once, or give up
+            # if they never do
+            all_workers_busy.wait(timeout=5)
+            with lock:
+                in_flight[0] -= 1
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            page = kwargs.get("params", {}).get("page", 1)
+            repo_name = url.split("/")[-2]
+            if page == 1:
+                mock_response.json.return_value = [
+                    {
+                        "number": int(repo_name[len("repo"):]),
+                        "title": f"PR in {repo_name}",
+                        "draft": False,
+                        "user": {"login": "author"},
+                        "requested_reviewers": [],
+                        "assignees": []
+                    }
+                ]
+            else:
+                mock_response.json.return_value = []
+            return mock_response
+
+        mock_get.side_effect = side_effect
+
+        pr_cache = PullRequestCache(
+            repo_filter=repo_names,
+            github_token="test-token",
+            github_org="test-org",
+            fetch_workers=3,
+        )
+
+        result = pr_cache.refresh_cache()
+
+        self.assertTrue(result)
+        # Results are merged in the configured repository order
+        self.assertEqual(list(pr_cache.cache.keys()), repo_names)
+        for i, repo_name in enumerate(repo_names):
+            self.assertEqual(pr_cache.cache[repo_name][0]["number"], i)
+        # The 6 requests are spread over all 3 workers, fetching at the same time
+        self.assertEqual(len(thread_names), 3)
+        self.assertEqual(in_flight[1], 3)
+        self.assertEqual(mock_get.call_count, 6)
+        self.assertIsNotNone(pr_cache.last_refresh_duration)
+        self.assertEqual(
+            pr_cache.get_cache_stats()["last_refresh_duration"],
+            pr_cache.last_refresh_duration,
+        )
+
+    def test_fetch_workers_from_environment(self):
+        """Test that the worker pool size can be configured via environment"""
+        with patch.dict(os.environ, {"GITHUB_FETCH_WORKERS": "4"}):
+            pr_cache = PullRequestCache(
+                github_token="test-token", github_org="test-org"
+            )
+        self.assertEqual(pr_cache.fetch_workers, 4)
+
+    @patch("plugins.certification.pr_cache.get_session")
+    def test_connection_pool_covers_page_workers(self, mock_get_session):
+        """Test that every fetch worker's page workers get a pooled connection"""
+        mock_get_session.return_value.get.return_value = MagicMock(
+            status_code=200, headers={}
+        )
+        pr_cache = PullRequestCache(
+            github_token="test-token", github_org="test-org", fetch_workers=8
+        )
+
+        pr_cache._conditional_get("https://api.github.com/orgs/test-org/repos")
+
+        mock_get_session.assert_called_once_with(
+            "https://api.github.com/orgs/test-org/repos", 8 * DEFAULT_PAGE_WORKERS
+        )
+
     def test_is_cache_expired_when_never_updated(self):
         """Test that cache is expired when never updated"""
         self.assertTrue(self.pr_cache.is_cache_expired())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Test for the review status cache computed during PullRequestCache.refresh_cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from tests.github_responses import make_response
+
+
+class TestPRCacheReviewStatus(unittest.TestCase):
+    """Test cases for precomputed review status"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"],
+            github_token="test-token",
+            github_org="test-org"
+        )
+        self.pulls = [
+            {
+                "number": 1,
+                "title": "Reviewed PR",
+                "draft": False,
+                "updated_at": "2026-10-01T10:00:00Z",
+                "head": {"sha": "abc"},
+                "user": {"login": "author1"},
+                "requested_reviewers": [{"login": "reviewer1"}],
+                "requested_teams": [],
+                "assignees": []
+            },
+            {
+                "number": 2,
+                "title": "Unassigned PR",
+                "draft": False,
+                "updated_at": "2026-10-01T10:00:00Z",
+                "head": {"sha": "def"},
+                "user": {"login": "author1"},
+                "requested_reviewers": [],
+                "requested_teams": [],
+                "assignees": []
+            },
+        ]
+        self.reviews = [{"state": "APPROVED"}]
+        self.review_requests = []
+
+    def _side_effect(self, url, **kwargs):
+        page = kwargs.get("params", {}).get("page", 1)
+        if url.endswith("/reviews"):
+            self.review_requests.append((url, page))
+            return make_response(200, self.reviews if page == 1 else [])
+        if url.endswith("/pulls"):
+            return make_response(200, self.pulls if page == 1 else [])
+        return make_response(200, [])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_precomputes_review_status(self, mock_get):
+        """Test that review status is computed at refresh and read by get_prs_for_user"""
+        mock_get.side_effect = self._side_effect
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        # Only the PR with reviewers needs a review status
+        self.assertEqual(list(self.pr_cache.review_status.keys()), [("repo1", 1)])
+        self.assertEqual(len(self.review_requests), 1)
+
+        mock_get.reset_mock()
+        result = self.pr_cache.get_prs_for_user("author1")
+
+        mock_get.assert_not_called()
+        self.assertEqual(result["authored_approved"][0]["number"], 1)
+        self.assertEqual(result["authored_unassigned"][0]["number"], 2)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_unchanged_prs_are_not_fetched_again(self, mock_get):
+        """Test that review status is reused while the PR revision is unchanged"""
+        mock_get.side_effect = self._side_effect
+
+        self.pr_cache.refresh_cache()
+        self.pr_cache.refresh_cache()
+        self.assertEqual(len(self.review_requests), 1)
+        self.assertEqual(self.pr_cache.last_review_fetch_count, 0)
+
+        # A new push changes the revision and the status is fetched again
+        self.pulls[0]["head"] = {"sha": "abd"}
+        self.reviews = [{"state": "CHANGES_REQUESTED"}]
+        self.pr_cache.refresh_cache()
+
+        self.assertEqual(len(self.review_requests), 2)
+        _, status = self.pr_cache.review_status[("repo1", 1)]
+        self.assertTrue(status["has_changes_requested"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_failed_review_fetch_is_retried(self, mock_get):
+        """Test that failed review fetches are not cached"""
+        def failing_reviews(url, **kwargs):
+            if url.endswith("/reviews"):
+                return make_response(500, None)
+            return self._side_effect(url, **kwargs)
+
+        mock_get.side_effect = failing_reviews
+        self.pr_cache.refresh_cache()
+        self.assertEqual(self.pr_cache.review_status, {})
+
+        mock_get.side_effect = self._side_effect
+        self.pr_cache.refresh_cache()
+        self.assertIn(("repo1", 1), self.pr_cache.review_status)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_failed_review_status_retried_for_user_asking(self, mock_get):
+        """Test that status missing after a refresh is fetched when its author asks"""
+        def failing_reviews(url, **kwargs):
+            if url.endswith("/reviews"):
+                self.review_requests.append((url, kwargs["params"]["page"]))
+                return make_response(500, None)
+            return self._side_effect(url, **kwargs)
+
+        mock_get.side_effect = failing_reviews
+        self.pr_cache.refresh_cache()
+        # Building the index does not fetch the status again
+        self.assertEqual(len(self.review_requests), 1)
+        self.assertEqual(
+            len(self.pr_cache.get_prs_for_user("reviewer1")["assigned"]), 1
+        )
+        self.assertEqual(len(self.review_requests), 1)
+
+        priorities = []
+
+        def reviews(url, **kwargs):
+            priorities.append(self.pr_cache.rate_limit.priority())
+            return self._side_effect(url, **kwargs)
+
+        mock_get.side_effect = reviews
+        result = self.pr_cache.get_prs_for_user("author1")
+
+        self.assertEqual(result["authored_approved"][0]["number"], 1)
+        self.assertEqual(result["authored_unknown_status"], [])
+        self.assertEqual(len(self.review_requests), 2)
+        self.assertEqual(priorities, ["interactive"])
+
+        # Kept for later lookups
+        self.pr_cache.get_prs_for_user("author1")
+        self.assertEqual(len(self.review_requests), 2)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_reviews_are_paged(self, mock_get):
+        """Test that reviews beyond the first page are examined"""
+        def side_effect(url, **kwargs):
+            page = kwargs["params"]["page"]
+            self.assertEqual(kwargs["params"]["per_page"], 100)
+            if page == 1:
+                return make_response(200, [{"state": "COMMENTED"}] * 100)
+            if page == 2:
+                return make_response(200, [{"state": "CHANGES_REQUESTED"}])
+            self.fail("Requested a page after a partial page")
+
+        mock_get.side_effect = side_effect
+
+        status = self.pr_cache._get_pr_review_status("repo1", 1)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertTrue(status["has_changes_requested"])
+        self.assertFalse(status["has_approvals"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test for the org-wide search fetch mode and the org repository enumeration
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.pr_cache_utils import search_open_pr_repositories
+from tests.github_responses import make_response
+
+
+def _search_item(repo, number):
+    return {
+        "number": number,
+        "repository_url": f"https://api.github.com/repos/test-org/{repo}",
+        "pull_request": {"url": f"https://api.github.com/repos/test-org/{repo}/pulls/{number}"},
+    }
+
+
+def _pr(number):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "user": {"login": "author1"},
+        "requested_reviewers": [],
+        "assignees": [],
+    }
+
+
+class TestSearchOpenPRRepositories(unittest.TestCase):
+    """Test cases for search_open_pr_repositories"""
+
+    def test_collects_repositories(self):
+        """Test that the repositories of all results are collected"""
+        body = {
+            "total_count": 3,
+            "incomplete_results": False,
+            "items": [_search_item("repo1", 1), _search_item("repo2", 2), _search_item("repo1", 3)],
+        }
+
+        repos = search_open_pr_repositories(
+            lambda params: (make_response(200, body), body), "test-org"
+        )
+
+        self.assertEqual(repos, {"repo1", "repo2"})
+
+    def test_shards_by_creation_date(self):
+        """Test that ranges over the result cap are split by creation date"""
+        queries = []
+
+        def fetch_page(params):
+            queries.append(params["q"])
+            if "2020-01-01..2020-01-04" in params["q"]:
+                body = {"total_count": 1500, "items": []}
+            else:
+                body = {"total_count": 1, "items": [_search_item("repo1", 1)]}
+            return make_response(200, body), body
+
+        repos = search_open_pr_repositories(
+            fetch_page, "test-org", date(2020, 1, 1), date(2020, 1, 4)
+        )
+
+        self.assertEqual(repos, {"repo1"})
+        self.assertIn("is:pr is:open org:test-org archived:false -is:draft", queries[0])
+        self.assertEqual(
+            sorted(query.rsplit(":", 1)[1] for query in queries[1:]),
+            ["2020-01-01..2020-01-02", "2020-01-03..2020-01-04"],
+        )
+
+    def test_failed_search(self):
+        """Test that a failed search request is reported as None"""
+        repos = search_open_pr_repositories(
+            lambda params: (make_response(422), None), "test-org"
+        )
+
+        self.assertIsNone(repos)
+
+
+class TestPRCacheSearchBackend(unittest.TestCase):
+    """Test cases for the search fetch backend of the PR cache"""
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_only_repositories_with_open_prs_are_crawled(self, mock_get):
+        """Test that the pulls API is only called for repositories found by search"""
+        pr_cache = PullRequestCache(
+            github_token="test-token", github_org="test-org", fetch_backend="search"
+        )
+        search_body = {"total_count": 1, "items": [_search_item("repo2", 7)]}
+
+        def side_effect(url, **kwargs):
+            if "search/issues" in url:
+                return make_response(200, search_body)
+            if "repos/test-org/repo2/pulls" in url:
+                return make_response(200, [_pr(7)])
+            self.fail(f"Unexpected request to {url}")
+
+        mock_get.side_effect = side_effect
+
+        self.assertTrue(pr_cache.refresh_cache())
+
+        self.assertEqual(list(pr_cache.cache), ["repo2"])
+        self.assertEqual(pr_cache.cache["repo2"][0].number, 7)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_failed_search_keeps_cache(self, mock_get):
+        """Test that a failed search leaves the cache untouched"""
+        pr_cache = PullRequestCache(
+            github_token="test-token", github_org="test-org", fetch_backend="search"
+        )
+        pr_cache.cache = {"repo1": [_pr(1)]}
+        mock_get.return_value = make_response(503)
+
+        self.assertFalse(pr_cache.refresh_cache())
+        self.assertEqual(len(pr_cache.cache["repo1"]), 1)
+
+
+class TestOrgRepositoryEnumeration(unittest.TestCase):
+    """Test cases for listing the repositories of the organization"""
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_archived_and_inactive_repositories_are_skipped(self, mock_get):
+        """Test that archived repositories and those without recent pushes are skipped"""
+        pr_cache = PullRequestCache(github_token="test-token", github_org="test-org")
+        recent = (datetime.now(timezone.utc) - timedelta(days=3)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+        mock_get.return_value = make_response(
+            200,
+            [
+                {"name": "active", "archived": False, "pushed_at": recent},
+                {"name": "archived", "archived": True, "pushed_at": recent},
+                {"name": "stale", "archived": False, "pushed_at": "2015-01-01T00:00:00Z"},
+            ],
+        )
+
+        self.assertEqual(pr_cache._fetch_all_org_repositories(), ["active"])
+
+
+if __name__ == "__main__":
+    unittest.main()
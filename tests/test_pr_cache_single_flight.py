@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test for single-flight PR cache refreshes and serving stale data while revalidating
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from plugins.certification.pr_cache import PullRequestCache
+
+
+def _pr(number):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "user": {"login": "author1"},
+        "requested_reviewers": [],
+        "assignees": [],
+    }
+
+
+class TestPRCacheSingleFlight(unittest.TestCase):
+    """Test cases for coordinating concurrent PR cache refreshes"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.refresh_count = 0
+
+        def slow_refresh():
+            self.refresh_count += 1
+            self.started.set()
+            self.release.wait(timeout=5)
+            self.pr_cache.cache = {"repo1": [_pr(1), _pr(2)]}
+            self.pr_cache.last_updated = datetime.now()
+            return True
+
+        self.pr_cache._refresh_cache = slow_refresh
+
+    def tearDown(self):
+        self.release.set()
+
+    def _wait_for_refresh(self):
+        self.release.set()
+        with self.pr_cache._refresh_lock:
+            pass
+
+    def test_stale_cache_is_served_while_refreshing(self):
+        """Test that callers get the stale snapshot while one refresh runs"""
+        self.pr_cache.cache = {"repo1": [_pr(1)]}
+        self.pr_cache.last_updated = datetime.now() - timedelta(hours=1)
+
+        first = self.pr_cache.get_prs_for_user("author1")
+        self.assertTrue(self.started.wait(timeout=5))
+        second = self.pr_cache.get_prs_for_user("author1")
+
+        self.assertEqual(len(first["authored_unassigned"]), 1)
+        self.assertEqual(len(second["authored_unassigned"]), 1)
+        self.assertTrue(self.pr_cache.is_refreshing())
+
+        self._wait_for_refresh()
+
+        self.assertEqual(self.refresh_count, 1)
+        self.assertEqual(
+            len(self.pr_cache.get_prs_for_user("author1")["authored_unassigned"]), 2
+        )
+
+    def test_concurrent_refresh_is_skipped(self):
+        """Test that a refresh requested while another runs is skipped"""
+        self.assertTrue(self.pr_cache.refresh_in_background())
+        self.assertTrue(self.started.wait(timeout=5))
+
+        self.assertFalse(self.pr_cache.refresh_cache())
+        self.assertFalse(self.pr_cache.refresh_in_background())
+
+        self._wait_for_refresh()
+        self.assertEqual(self.refresh_count, 1)
+
+    def test_first_load_waits_for_running_refresh(self):
+        """Test that without any data, callers wait for the refresh in progress"""
+        self.pr_cache.refresh_in_background()
+        self.assertTrue(self.started.wait(timeout=5))
+        threading.Timer(0.1, self.release.set).start()
+
+        result = self.pr_cache.get_prs_for_user("author1")
+
+        self.assertEqual(len(result["authored_unassigned"]), 2)
+        self.assertEqual(self.refresh_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
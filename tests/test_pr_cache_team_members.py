@@ -9,8 +9,11 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import unittest
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import requests
+
 from plugins.certification.pr_cache import PullRequestCache
 
 
@@ -25,7 +28,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
             github_org="test-org"
         )
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_success(self, mock_get):
         """Test successful retrieval of team members"""
         # Mock response with team members
@@ -61,7 +64,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         self.assertIn("user2", members)
         self.assertIn("user3", members)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_with_pagination(self, mock_get):
         """Test get_team_members handles pagination correctly"""
         # Mock response with multiple pages
@@ -100,7 +103,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         self.assertIn("user100", members)
         self.assertIn("user150", members)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_handles_404(self, mock_get):
         """Test that get_team_members returns empty list for non-existent team"""
         # Mock 404 response
@@ -115,7 +118,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         # Assertions
         self.assertEqual(members, [])
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_handles_request_exception(self, mock_get):
         """Test that get_team_members handles network errors gracefully"""
         import requests
@@ -129,7 +132,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         # Assertions
         self.assertEqual(members, [])
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_handles_other_http_errors(self, mock_get):
         """Test that get_team_members handles other HTTP errors"""
         import requests
@@ -146,7 +149,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         # Assertions - should return empty list due to exception handling
         self.assertEqual(members, [])
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_with_empty_team_name(self, mock_get):
         """Test that get_team_members returns empty list for empty team name"""
         # No need to mock since it should return early
@@ -160,7 +163,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         # Verify no API call was made since empty string should be caught
         mock_get.assert_not_called()
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_headers_contain_token(self, mock_get):
         """Test that get_team_members includes authentication token in headers"""
         # Mock response
@@ -179,7 +182,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         self.assertEqual(headers["Authorization"], "token test-token")
         self.assertEqual(headers["Accept"], "application/vnd.github.v3+json")
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_uses_correct_url(self, mock_get):
         """Test that get_team_members constructs the correct GitHub API URL"""
         # Mock response
@@ -197,7 +200,7 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         url = call_args[0][0]
         self.assertEqual(url, "https://api.github.com/orgs/test-org/teams/my-team/members")
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_team_members_mixed_case_usernames(self, mock_get):
         """Test that get_team_members preserves username case"""
         # Mock response with mixed case usernames - handle pagination
@@ -230,5 +233,65 @@ class TestPRCacheTeamMembers(unittest.TestCase):
         self.assertIn("USER_THREE", members)
 
 
+class TestPRCacheTeamMembersCaching(unittest.TestCase):
+    """Test cases for caching team members in the PR cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+
+    def _members_response(self, url, **kwargs):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        page = kwargs.get("params", {}).get("page", 1)
+        if "teams/test-team/members" in url and page == 1:
+            mock_response.json.return_value = [{"login": "user1"}, {"login": "user2"}]
+        else:
+            mock_response.json.return_value = []
+        return mock_response
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_members_are_cached(self, mock_get):
+        """Test that team members are only fetched once within the TTL"""
+        mock_get.side_effect = self._members_response
+
+        first = self.pr_cache.get_team_members("test-team")
+        calls = mock_get.call_count
+        second = self.pr_cache.get_team_members("test-team")
+
+        self.assertEqual(first, ["user1", "user2"])
+        self.assertEqual(second, first)
+        self.assertEqual(mock_get.call_count, calls)
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_stale_members_served_on_error(self, mock_get):
+        """Test that expired members are served when GitHub fails"""
+        self.pr_cache.team_members["test-team"] = (
+            datetime.now() - timedelta(days=1),
+            ["user1"],
+        )
+        mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
+
+        members = self.pr_cache.get_team_members("test-team")
+
+        self.assertEqual(members, ["user1"])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_refresh_revalidates_cached_teams(self, mock_get):
+        """Test that the PR cache refresh refetches teams past half their TTL"""
+        fetched_at = datetime.now() - self.pr_cache.team_members_ttl * 0.75
+        self.pr_cache.team_members["test-team"] = (fetched_at, ["old-user"])
+        mock_get.side_effect = self._members_response
+
+        self.assertTrue(self.pr_cache.refresh_cache())
+
+        refreshed_at, members = self.pr_cache.team_members["test-team"]
+        self.assertGreater(refreshed_at, fetched_at)
+        self.assertEqual(members, ["user1", "user2"])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test for the per-user PR index built by PullRequestCache.refresh_cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from plugins.certification.pr_cache import PullRequestCache
+from tests.github_responses import make_response
+
+
+class TestPRCacheUserIndex(unittest.TestCase):
+    """Test cases for the per-user PR index"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.pr_cache = PullRequestCache(
+            repo_filter=["repo1", "repo2"],
+            github_token="test-token",
+            github_org="test-org"
+        )
+        self.pulls = {
+            "repo1": [
+                {
+                    "number": 1,
+                    "title": "Needs review",
+                    "draft": False,
+                    "user": {"login": "Author1"},
+                    "requested_reviewers": [{"login": "Reviewer1"}],
+                    "requested_teams": [],
+                    "assignees": [{"login": "assignee1"}]
+                },
+            ],
+            "repo2": [
+                {
+                    "number": 2,
+                    "title": "Unassigned",
+                    "draft": False,
+                    "user": {"login": "author1"},
+                    "requested_reviewers": [],
+                    "requested_teams": [],
+                    "assignees": []
+                },
+            ],
+        }
+
+    def _side_effect(self, url, **kwargs):
+        page = kwargs.get("params", {}).get("page", 1)
+        if url.endswith("/reviews"):
+            return make_response(200, [{"state": "APPROVED"}] if page == 1 else [])
+        repo_name = url.split("/")[-2]
+        return make_response(200, self.pulls.get(repo_name, []) if page == 1 else [])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_index_built_at_refresh(self, mock_get):
+        """Test that refresh_cache indexes every reviewer, assignee and author"""
+        mock_get.side_effect = self._side_effect
+
+        self.pr_cache.refresh_cache()
+
+        self.assertEqual(
+            sorted(self.pr_cache._snapshot.user_index.keys()),
+            ["assignee1", "author1", "reviewer1"],
+        )
+        self.assertEqual(self.pr_cache.get_cache_stats()["indexed_users"], 3)
+
+    @patch("plugins.certification.pr_cache.categorize_pr_for_user")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_lookup_does_not_categorize(self, mock_get, mock_categorize):
+        """Test that get_prs_for_user is a lookup in the prebuilt index"""
+        from plugins.certification.pr_cache_utils import categorize_pr_for_user
+
+        mock_get.side_effect = self._side_effect
+        mock_categorize.side_effect = categorize_pr_for_user
+        self.pr_cache.refresh_cache()
+        mock_categorize.reset_mock()
+        mock_get.reset_mock()
+
+        author_prs = self.pr_cache.get_prs_for_user("AUTHOR1")
+        reviewer_prs = self.pr_cache.get_prs_for_user("reviewer1")
+
+        mock_categorize.assert_not_called()
+        mock_get.assert_not_called()
+        self.assertEqual(author_prs["authored_approved"][0]["number"], 1)
+        self.assertEqual(author_prs["authored_unassigned"][0]["number"], 2)
+        self.assertEqual(reviewer_prs["assigned"][0]["user_role"], ("reviewer",))
+        self.assertEqual(reviewer_prs["authored_unassigned"], [])
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_unknown_user_gets_empty_categories(self, mock_get):
+        """Test that users without PRs get all categories empty"""
+        mock_get.side_effect = self._side_effect
+        self.pr_cache.refresh_cache()
+
+        result = self.pr_cache.get_prs_for_user("nobody")
+
+        self.assertEqual(set(result.keys()), {
+            "assigned",
+            "authored_unassigned",
+            "authored_approved",
+            "authored_changes_requested",
+            "authored_pending_review",
+            "authored_unknown_status",
+        })
+        self.assertTrue(all(prs == [] for prs in result.values()))
+
+    @patch("plugins.certification.pr_cache.requests.Session.get")
+    def test_returned_lists_do_not_alias_index(self, mock_get):
+        """Test that callers cannot modify the shared index"""
+        mock_get.side_effect = self._side_effect
+        self.pr_cache.refresh_cache()
+
+        self.pr_cache.get_prs_for_user("author1")["authored_unassigned"].clear()
+
+        self.assertEqual(
+            len(self.pr_cache.get_prs_for_user("author1")["authored_unassigned"]), 1
+        )
+
+    def test_assigning_cache_replaces_index(self):
+        """Test that the index always matches the current cache contents"""
+        self.pr_cache.cache = {"repo2": self.pulls["repo2"]}
+        self.pr_cache.last_updated = datetime.now()
+        self.assertEqual(len(self.pr_cache.get_prs_for_user("author1")["authored_unassigned"]), 1)
+
+        self.pr_cache.cache = {}
+
+        self.assertIsNone(self.pr_cache._snapshot.user_index)
+        self.assertEqual(self.pr_cache.get_prs_for_user("author1")["authored_unassigned"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,7 +19,7 @@ class TestPRChangesRequested(unittest.TestCase):
             repo_filter=["test-repo"], github_token="test-token", github_org="test-org"
         )
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_prs_for_user_with_changes_requested(self, mock_get):
         """Test that get_prs_for_user correctly identifies PRs with changes requested"""
         # Set up cache with a PR authored by the user
@@ -55,7 +55,7 @@ class TestPRChangesRequested(unittest.TestCase):
         self.assertEqual(len(result["authored_approved"]), 0)
         self.assertEqual(len(result["authored_pending_review"]), 0)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_prs_for_user_with_approvals(self, mock_get):
         """Test that get_prs_for_user correctly identifies PRs with approvals"""
         # Set up cache with a PR authored by the user
@@ -91,7 +91,7 @@ class TestPRChangesRequested(unittest.TestCase):
         self.assertEqual(len(result["authored_changes_requested"]), 0)
         self.assertEqual(len(result["authored_pending_review"]), 0)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_prs_for_user_with_both_approval_and_changes(self, mock_get):
         """Test that get_prs_for_user handles PRs with both approvals and changes requested"""
         # Set up cache with a PR authored by the user
@@ -126,7 +126,7 @@ class TestPRChangesRequested(unittest.TestCase):
         # Should not be in approved category
         self.assertEqual(len(result["authored_approved"]), 0)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_prs_for_user_with_review_api_error(self, mock_get):
         """Test that get_prs_for_user handles review API errors gracefully"""
         # Set up cache with a PR authored by the user
@@ -158,7 +158,7 @@ class TestPRChangesRequested(unittest.TestCase):
         self.assertEqual(len(result["authored_changes_requested"]), 0)
         self.assertEqual(len(result["authored_approved"]), 0)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_prs_for_user_with_network_error(self, mock_get):
         """Test that get_prs_for_user handles network errors gracefully"""
         import requests
@@ -231,7 +231,7 @@ class TestPRChangesRequested(unittest.TestCase):
                 self.assertEqual(len(result["assigned"]), 0)
                 self.assertEqual(len(result["authored_unassigned"]), 0)
 
-    @patch("plugins.certification.pr_cache.requests.get")
+    @patch("plugins.certification.pr_cache.requests.Session.get")
     def test_get_prs_for_user_handles_review_status_error(self, mock_get):
         """Test that get_prs_for_user handles review status errors gracefully"""
         # Set up cache with a PR
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test for the compact PR records kept in the PR cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+
+from plugins.certification.pr_cache_utils import (
+    PullRequestRecord,
+    compact_pr_page,
+    merge_pr_changes,
+    pr_record_from_dict,
+    to_pr_record,
+)
+
+
+def _github_pr():
+    return {
+        "number": 7,
+        "title": "Fix tests",
+        "html_url": "https://github.com/test-org/repo1/pull/7",
+        "user": {"login": "author1", "id": 1, "avatar_url": "https://example.com/a"},
+        "requested_reviewers": [{"login": "reviewer1"}],
+        "requested_teams": [{"slug": "team1", "name": "Team 1"}],
+        "assignees": [{"login": "assignee1"}],
+        "updated_at": "2024-01-01T00:00:00Z",
+        "head": {"sha": "abc123", "ref": "fix-tests"},
+        "body": "A long description that is not kept",
+    }
+
+
+class TestPullRequestRecord(unittest.TestCase):
+    """Test cases for PullRequestRecord"""
+
+    def test_conversion_keeps_used_fields(self):
+        """Test that conversion keeps only the fields the bot uses"""
+        pr = to_pr_record(_github_pr(), "repo1")
+
+        self.assertEqual(pr.author, "author1")
+        self.assertEqual(pr.reviewers, ("reviewer1",))
+        self.assertEqual(pr.teams, ("team1",))
+        self.assertEqual(pr.assignees, ("assignee1",))
+        self.assertEqual(pr.repository, "repo1")
+        self.assertEqual(pr.head_sha, "abc123")
+        self.assertNotIn("body", pr)
+
+    def test_records_are_passed_through(self):
+        """Test that converting a record returns the same object"""
+        pr = to_pr_record(_github_pr(), "repo1")
+
+        self.assertIs(to_pr_record(pr, "repo1"), pr)
+
+    def test_mapping_access(self):
+        """Test read-only item access used by the formatters"""
+        pr = to_pr_record(_github_pr(), "repo1")
+
+        self.assertEqual(pr["title"], "Fix tests")
+        self.assertEqual(pr.get("missing", "default"), "default")
+        self.assertNotIn("user_role", pr)
+        self.assertIsNone(pr.get("user_role"))
+        with self.assertRaises(KeyError):
+            pr["user_role"]
+
+    def test_user_role_copy(self):
+        """Test that categorized copies leave the cached record unchanged"""
+        pr = to_pr_record(_github_pr(), "repo1")
+
+        categorized = pr.with_user_role(("reviewer",))
+
+        self.assertEqual(categorized["user_role"], ("reviewer",))
+        self.assertIsNone(pr.user_role)
+
+    def test_round_trip(self):
+        """Test that records survive conversion to and from a dict"""
+        pr = to_pr_record(_github_pr(), "repo1").with_user_role(("assignee",))
+
+        restored = pr_record_from_dict(pr.to_dict())
+
+        self.assertIsInstance(restored, PullRequestRecord)
+        self.assertEqual(restored, pr)
+
+    def test_compact_page(self):
+        """Test that pages kept for conditional requests hold records, not JSON"""
+        draft = {**_github_pr(), "number": 8, "draft": True}
+        closed = {**_github_pr(), "number": 9, "state": "closed"}
+
+        page = compact_pr_page([_github_pr(), draft, closed], "repo1")
+
+        self.assertEqual(page[0], to_pr_record(_github_pr(), "repo1"))
+        self.assertEqual(
+            page[1:],
+            [
+                {"number": 8, "updated_at": draft["updated_at"], "state": "open",
+                 "draft": True},
+                {"number": 9, "updated_at": closed["updated_at"], "state": "closed",
+                 "draft": False},
+            ],
+        )
+        cached = [to_pr_record(draft, "repo1"), to_pr_record(closed, "repo1")]
+        self.assertEqual(merge_pr_changes(cached, page, "repo1"), [page[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
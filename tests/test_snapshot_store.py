@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test for versioned cache snapshots swapped atomically on refresh
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from plugins.certification.jira_integration import cache as jira_cache
+from plugins.certification.pr_cache import PullRequestCache
+from plugins.certification.snapshot_store import SnapshotStore
+
+
+def _issue(key, email):
+    issue = MagicMock()
+    issue.key = key
+    issue.fields.summary = f"Issue {key}"
+    issue.fields.status.name = "In Progress"
+    issue.fields.status.statusCategory.name = "In Progress"
+    issue.fields.priority.name = "High"
+    issue.fields.customfield_10024 = 3
+    issue.fields.assignee.accountId = f"account-{email}"
+    issue.fields.assignee.emailAddress = email
+    return issue
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Test cases for SnapshotStore"""
+
+    def test_publish_increments_version(self):
+        """Test that every publish swaps in a new snapshot with a higher version"""
+        store = SnapshotStore({"a": 1})
+        before = store.current()
+
+        published = store.publish({"a": 2})
+
+        self.assertEqual(before.version, 0)
+        self.assertEqual(published.version, 1)
+        self.assertIs(store.current(), published)
+        self.assertEqual(before.data, {"a": 1})
+
+    def test_publish_with_outdated_version(self):
+        """Test that a publish based on an outdated snapshot is rejected"""
+        store = SnapshotStore("initial")
+        store.publish("newer")
+
+        self.assertIsNone(store.publish("stale", expected_version=0))
+        self.assertEqual(store.current().data, "newer")
+
+
+@patch.dict("plugins.certification.jira_integration.client._filter_jql", clear=True)
+class TestJiraCacheSnapshots(unittest.TestCase):
+    """Test cases for publishing Jira cache refreshes"""
+
+    def tearDown(self):
+        jira_cache.restore_jira_snapshot({"issues": {}, "account_to_email": {}})
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    @patch("plugins.certification.jira_integration.cache.get_jira_client")
+    def test_readers_keep_their_snapshot_during_refresh(self, mock_get_client):
+        """Test that a snapshot taken before a refresh is left untouched by it"""
+        jira_cache.restore_jira_snapshot(
+            {
+                "issues": {"old@example.com": [{"key": "OLD-1"}]},
+                "account_to_email": {},
+            }
+        )
+        before = jira_cache.get_jira_snapshot()
+        client = MagicMock()
+        client.filter.return_value.jql = "project = TEST"
+        client.search_issues.return_value = [_issue("NEW-1", "new@example.com")]
+        mock_get_client.return_value = client
+
+        self.assertTrue(jira_cache.refresh_jira_issues_cache())
+
+        after = jira_cache.get_jira_snapshot()
+        self.assertEqual(after.version, before.version + 1)
+        self.assertEqual(list(before.data.issues), ["old@example.com"])
+        self.assertEqual(list(after.data.issues), ["new@example.com"])
+        self.assertEqual(
+            jira_cache.get_jira_issues_for_user("new@example.com")["active"][0]["key"],
+            "NEW-1",
+        )
+
+    @patch("plugins.certification.jira_integration.cache.JIRA_FILTER_ID", "10000")
+    @patch("plugins.certification.jira_integration.cache.get_jira_client")
+    def test_failed_refresh_keeps_snapshot(self, mock_get_client):
+        """Test that a refresh failing halfway publishes nothing"""
+        jira_cache.restore_jira_snapshot(
+            {"issues": {"old@example.com": [{"key": "OLD-1"}]}, "account_to_email": {}}
+        )
+        before = jira_cache.get_jira_snapshot()
+        client = MagicMock()
+        client.filter.return_value.jql = "project = TEST"
+        client.search_issues.side_effect = Exception("Connection reset")
+        mock_get_client.return_value = client
+
+        self.assertFalse(jira_cache.refresh_jira_issues_cache())
+        self.assertIs(jira_cache.get_jira_snapshot(), before)
+
+
+class TestPRCacheSnapshots(unittest.TestCase):
+    """Test cases for publishing PR cache contents"""
+
+    def test_assigning_cache_publishes_new_version(self):
+        """Test that new PR cache contents are published as a new version"""
+        pr_cache = PullRequestCache(
+            repo_filter=["repo1"], github_token="test-token", github_org="test-org"
+        )
+        version = pr_cache.get_cache_stats()["snapshot_version"]
+
+        pr_cache.cache = {"repo1": []}
+
+        self.assertEqual(pr_cache.get_cache_stats()["snapshot_version"], version + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()